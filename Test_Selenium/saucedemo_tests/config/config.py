@@ -2,19 +2,66 @@
 Configuration globale pour les tests SauceDemo
 """
 
+import os
+import time
+
+
+def _env_flag(name, default=False):
+    """Lit un booléen depuis une variable d'environnement"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 class Config:
     """Configuration centralisée"""
     
-    # URL de base
-    BASE_URL = "https://www.saucedemo.com/"
+    # Racine du projet saucedemo_tests
+    ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    REPORTS_DIR = os.path.join(ROOT_DIR, "reports")
+    
+    # URL de base (SAUCEDEMO_BASE_URL pour cibler un autre environnement)
+    BASE_URL = os.environ.get("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/")
+    
+    # Serveur SauceDemo local (voir local_server/) : remplace BASE_URL au démarrage
+    USE_LOCAL_SERVER = _env_flag("SAUCEDEMO_LOCAL")
+    LOCAL_SERVER_PORT = int(os.environ.get("SAUCEDEMO_LOCAL_PORT", "0"))  # 0 = port libre
+    LOCAL_GLITCH_DELAY = float(os.environ.get("SAUCEDEMO_GLITCH_DELAY", "2.5"))  # performance_glitch_user
+    
+    # Enregistrement / rejeu du trafic HTTP (voir utils/network_archive.py) : "record" ou "replay"
+    NETWORK_MODE = os.environ.get("SAUCEDEMO_NETWORK") or None
+    NETWORK_ARCHIVE = os.environ.get(
+        "SAUCEDEMO_NETWORK_ARCHIVE", os.path.join(ROOT_DIR, "recordings", "saucedemo.json.gz")
+    )
+    NETWORK_LATENCY = float(os.environ.get("SAUCEDEMO_NETWORK_LATENCY", "0"))  # Secondes ajoutées en rejeu
     
     # Timeouts - Augmentés pour plus de stabilité
-    IMPLICIT_WAIT = 10
+    # Mode strict : aucune attente implicite, chaque requête des pages porte son
+    # propre timeout et les vérifications d'absence répondent immédiatement
+    STRICT_WAITS = _env_flag("SAUCEDEMO_STRICT_WAITS", True)
+    IMPLICIT_WAIT = 10         # Utilisé uniquement hors mode strict
     EXPLICIT_WAIT = 15
+    TEST_WAIT_BUDGET = float(os.environ.get("SAUCEDEMO_WAIT_BUDGET", "0"))  # Attente totale max par test (0 = illimité, par défaut)
+    NAVIGATION_TIMEOUT = 5     # Délai avant de passer à la stratégie de navigation suivante
+    NAVIGATION_MAX_FAILURES = 2  # Stratégie ignorée après N échecs sans aucune réussite
+    POLL_FREQUENCY = 0.1       # Intervalle de sondage des attentes (secondes)
+    DOM_QUIET_MS = 100         # DOM considéré stable après N ms sans mutation
+    SNAPSHOT_VALIDATE = False  # Vérifier le MutationObserver avant de réutiliser un snapshot
+    VALIDATE_LOCATORS = _env_flag("SAUCEDEMO_VALIDATE_LOCATORS", True)  # Locators vérifiés au démarrage (snapshots HTML)
+    VALIDATE_LOCATORS_LIVE = _env_flag("SAUCEDEMO_VALIDATE_LOCATORS_LIVE")  # ... et sur l'application cible (connexion réelle)
+    
+    # Relances des erreurs transitoires (élément périmé, clic intercepté)
+    RETRY_ATTEMPTS = 3         # Tentatives au total
+    RETRY_BACKOFF = 0.05       # Délai de base (secondes), doublé à chaque relance
+    RETRY_BACKOFF_MAX = 0.5    # Délai maximal d'une relance
     
     # Credentials
     PASSWORD = "secret_sauce"
     
+    # Connexion rapide : réinjection de la session capturée au premier login UI
+    FAST_AUTH = _env_flag("SAUCEDEMO_FAST_AUTH", True)
+    
     # Utilisateurs disponibles
     USERS = [
         "standard_user",
@@ -25,6 +72,9 @@ class Config:
         "visual_user"
     ]
     
+    # Utilisateurs dont la connexion doit être refusée
+    LOCKED_USERS = ["locked_out_user"]
+    
     # Utilisateurs fonctionnels (qui peuvent se connecter)
     # Note: problem_user, error_user et visual_user ont des bugs intentionnels
     FUNCTIONAL_USERS = [
@@ -43,17 +93,103 @@ class Config:
         "visual_user"
     ]
     
-    # Produits attendus
+    # Données partagées avec la suite Playwright (users.json, steps.json) et
+    # parcours déclaratifs exécutés par utils/journey_engine.py
+    SHARED_DATA_DIR = os.environ.get(
+        "SAUCEDEMO_SHARED_DATA",
+        os.path.join(os.path.dirname(os.path.dirname(ROOT_DIR)), "TestPlaywright", "tests", "data")
+    )
+    JOURNEYS_FILE = os.environ.get("SAUCEDEMO_JOURNEYS", os.path.join(ROOT_DIR, "data", "journeys.json"))
+    
+    # Produits attendus (image : nom du fichier servi pour le produit)
     EXPECTED_PRODUCTS = [
-        {"name": "Sauce Labs Bike Light", "price": "$9.99"},
-        {"name": "Sauce Labs Backpack", "price": "$29.99"},
-        {"name": "Sauce Labs Bolt T-Shirt", "price": "$15.99"},
-        {"name": "Sauce Labs Fleece Jacket", "price": "$49.99"},
-        {"name": "Sauce Labs Onesie", "price": "$7.99"},
-        {"name": "Test.allTheThings() T-Shirt (Red)", "price": "$15.99"}
+        {"name": "Sauce Labs Bike Light", "price": "$9.99", "image": "bike-light-1200x1500"},
+        {"name": "Sauce Labs Backpack", "price": "$29.99", "image": "sauce-backpack-1200x1500"},
+        {"name": "Sauce Labs Bolt T-Shirt", "price": "$15.99", "image": "bolt-shirt-1200x1500"},
+        {"name": "Sauce Labs Fleece Jacket", "price": "$49.99", "image": "sauce-pullover-1200x1500"},
+        {"name": "Sauce Labs Onesie", "price": "$7.99", "image": "red-onesie-1200x1500"},
+        {"name": "Test.allTheThings() T-Shirt (Red)", "price": "$15.99", "image": "red-tatt-1200x1500"}
     ]
     
     # Configuration du navigateur
     BROWSER = "chrome"  # chrome, firefox, edge
-    HEADLESS = False
-    MAXIMIZE_WINDOW = True
\ No newline at end of file
+    HEADLESS = False          # Profil "standard" uniquement
+    MAXIMIZE_WINDOW = True    # Profil "standard" uniquement
+    
+    # Profil de performance (voir utils/browser_profile.py) : "fast" ou "standard"
+    BROWSER_PROFILE = os.environ.get("SAUCEDEMO_BROWSER_PROFILE", "fast")
+    WINDOW_SIZE = "1366,768"
+    BLOCK_NON_ESSENTIAL = _env_flag("SAUCEDEMO_BLOCK_RESOURCES", True)
+    
+    # Requêtes tierces / analytics toujours bloquées
+    BLOCKED_THIRD_PARTY = [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*backtrace.io*",
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+    ]
+    
+    # Ressources non essentielles, bloquées sauf si le test les déclare
+    # avec @pytest.mark.resources("images", ...)
+    NON_ESSENTIAL_RESOURCES = {
+        "images": ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.svg", "*.webp"],
+        "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf"],
+        "media": ["*.mp4", "*.webm", "*.mp3"],
+    }
+    
+    # Pool de navigateurs partagé pendant la session
+    DRIVER_POOL_SIZE = 1     # Navigateurs « chauds » maximum
+    DRIVER_MAX_USES = 25     # Recyclage après N tests
+    
+    # Résolution du chromedriver (voir utils/driver_resolver.py)
+    CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")
+    DRIVER_CACHE_DIR = os.environ.get(
+        "SAUCEDEMO_DRIVER_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "saucedemo_tests", "drivers")
+    )
+    OFFLINE = _env_flag("SAUCEDEMO_OFFLINE")  # Aucun téléchargement autorisé
+    
+    # Exécution parallèle (voir run_parallel.py)
+    PARALLEL_WORKERS = 4
+    WORKER_ID = os.environ.get("SAUCEDEMO_WORKER_ID")  # None en exécution série
+    HISTORY_FILE = os.path.join(ROOT_DIR, ".test_history.json")
+    CONCURRENT_WORKERS = 3   # Navigateurs pilotés en parallèle par utils/concurrent_runner.py
+    
+    # Identifiant de l'exécution (partagé par les workers de run_parallel.py)
+    RUN_ID = os.environ.get("SAUCEDEMO_RUN_ID") or time.strftime("%Y%m%d-%H%M%S")
+    
+    # Artefacts des tests en échec (voir utils/artifacts.py)
+    ARTIFACTS_ENABLED = _env_flag("SAUCEDEMO_ARTIFACTS", True)
+    ARTIFACTS_DIR = os.path.join(REPORTS_DIR, "artifacts")
+    ARTIFACTS_MAX_BYTES = int(float(os.environ.get("SAUCEDEMO_ARTIFACTS_MAX_MB", "50")) * 1024 * 1024)
+    ARTIFACTS_KEEP_RUNS = 5      # Exécutions conservées (les plus anciennes sont supprimées)
+    
+    # Mesure des étapes des Page Objects (rapport reports/step_timings.json/.csv)
+    STEP_TIMING = _env_flag("SAUCEDEMO_STEP_TIMING", True)
+    
+    # Métriques navigateur après chaque transition de page (rapport reports/web_perf.json)
+    WEB_PERF = _env_flag("SAUCEDEMO_WEB_PERF", True)
+    
+    # Vérification HTTP des images produits (voir utils/image_integrity.py)
+    IMAGE_PROBE_WORKERS = 6
+    
+    # Régression visuelle (voir utils/visual.py)
+    # Une référence par environnement (serveur local ou site public)
+    VISUAL_BASELINES = os.path.join(ROOT_DIR, "baselines",
+                                    "visual-local.json" if USE_LOCAL_SERVER else "visual.json")
+    VISUAL_UPDATE = _env_flag("SAUCEDEMO_VISUAL_UPDATE")  # Enregistrer les références
+    VISUAL_REFERENCE_USER = "standard_user"  # Utilisateur dont les captures font référence
+    VISUAL_WORKERS = 2           # Processus de calcul des empreintes
+    VISUAL_THUMBNAIL = 96        # Plus grand côté (px) des vignettes de région produites par le navigateur
+    VISUAL_TILE_GRID = 8         # Tuiles par côté de chaque région
+    VISUAL_TILE_TOLERANCE = 24   # Écart maximal d'une couleur moyenne de tuile (0-255)
+    VISUAL_HASH_THRESHOLD = 6    # Bits différents tolérés sur le hash 64 bits
+    SCREENSHOTS_DIR = os.path.join(ROOT_DIR, "screenshots")
+    
+    # Benchmark des parcours (voir run_benchmarks.py)
+    BENCHMARK_ITERATIONS = 5
+    BENCHMARK_WARMUP = 1
+    BENCHMARK_THRESHOLD = 0.2    # Régression si +20 % sur la médiane ou le p95
+    BENCHMARK_BASELINE = os.path.join(ROOT_DIR, "benchmark_baseline.json")
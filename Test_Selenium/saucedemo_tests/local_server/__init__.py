@@ -0,0 +1,7 @@
+"""
+Reproduction locale de www.saucedemo.com pour des tests hermétiques
+"""
+
+from local_server.server import LocalSauceDemo
+
+__all__ = ["LocalSauceDemo"]
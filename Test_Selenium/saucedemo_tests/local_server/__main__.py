@@ -0,0 +1,29 @@
+"""
+Lancement manuel : python -m local_server [--port 8000] [--glitch-delay 5]
+"""
+
+import argparse
+import time
+
+from local_server import LocalSauceDemo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur SauceDemo local")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--glitch-delay", type=float, default=None,
+                        help="Délai (s) de performance_glitch_user")
+    args = parser.parse_args()
+    
+    server = LocalSauceDemo(args.host, args.port, args.glitch_delay)
+    print(f"🚀 SauceDemo local: {server.start()} (Ctrl+C pour arrêter)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
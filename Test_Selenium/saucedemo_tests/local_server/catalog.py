@@ -0,0 +1,115 @@
+"""
+Catalogue produits et comportements par utilisateur du serveur local
+(reproduction de www.saucedemo.com)
+"""
+
+from html import escape
+
+# Ordre d'affichage par défaut (tri A → Z)
+PRODUCTS = [
+    {
+        "id": 4,
+        "name": "Sauce Labs Backpack",
+        "description": "carry.allTheThings() with the sleek, streamlined Sly Pack that melds "
+                       "uncompromising style with unequaled laptop and tablet protection.",
+        "price": 29.99,
+        "image": "sauce-backpack-1200x1500",
+        "color": "#2f3a4c",
+    },
+    {
+        "id": 0,
+        "name": "Sauce Labs Bike Light",
+        "description": "A red light isn't the desired state in testing but it sure helps when "
+                       "riding your bike at night. Water-resistant with 3 lighting modes, "
+                       "1 AAA battery included.",
+        "price": 9.99,
+        "image": "bike-light-1200x1500",
+        "color": "#c0392b",
+    },
+    {
+        "id": 1,
+        "name": "Sauce Labs Bolt T-Shirt",
+        "description": "Get your testing superhero on with the Sauce Labs bolt T-shirt. From "
+                       "American Apparel, 100% ringspun combed cotton, heather gray with red bolt.",
+        "price": 15.99,
+        "image": "bolt-shirt-1200x1500",
+        "color": "#7f8c8d",
+    },
+    {
+        "id": 5,
+        "name": "Sauce Labs Fleece Jacket",
+        "description": "It's not every day that you come across a midweight quarter-zip fleece "
+                       "jacket capable of handling everything from a relaxing day outdoors to a "
+                       "busy day at the office.",
+        "price": 49.99,
+        "image": "sauce-pullover-1200x1500",
+        "color": "#34495e",
+    },
+    {
+        "id": 2,
+        "name": "Sauce Labs Onesie",
+        "description": "Rib snap infant onesie for the junior automation engineer in development. "
+                       "Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom "
+                       "won't unravel.",
+        "price": 7.99,
+        "image": "red-onesie-1200x1500",
+        "color": "#e74c3c",
+    },
+    {
+        "id": 3,
+        "name": "Test.allTheThings() T-Shirt (Red)",
+        "description": "This classic Sauce Labs t-shirt is perfect to wear when cozying up to "
+                       "your keyboard to automate a few tests. Super-soft and comfy ringspun "
+                       "combed cotton.",
+        "price": 15.99,
+        "image": "red-tatt-1200x1500",
+        "color": "#a93226",
+    },
+]
+
+PRODUCTS_BY_ID = {p["id"]: p for p in PRODUCTS}
+
+# Image affichée à la place des vraies pour problem_user / visual_user
+BROKEN_IMAGE = "sl-404"
+
+
+def product_slug(product) -> str:
+    """Identifiant utilisé dans les ids des boutons (add-to-cart-<slug>)"""
+    return product["name"].lower().replace(" ", "-")
+
+
+def image_path(image_name) -> str:
+    return f"/static/media/{image_name}.svg"
+
+
+def product_image_for(username, product, position=0) -> str:
+    """Image d'un produit telle qu'affichée pour un utilisateur donné"""
+    if username == "problem_user":
+        return image_path(BROKEN_IMAGE)
+    if username == "visual_user" and position == 0:
+        return image_path(BROKEN_IMAGE)
+    return image_path(product["image"])
+
+
+def detail_link_for(username, product) -> str:
+    """Lien vers la page de détails (problem_user ouvre le mauvais produit)"""
+    item_id = product["id"]
+    if username == "problem_user":
+        item_id = (item_id + 1) % len(PRODUCTS)
+    return f"/inventory-item.html?id={item_id}"
+
+
+def render_image_svg(image_name) -> str:
+    """Image SVG de remplacement, distincte pour chaque produit"""
+    product = next((p for p in PRODUCTS if p["image"] == image_name), None)
+    if product is None and image_name != BROKEN_IMAGE:
+        return None
+    label = product["name"] if product else "404"
+    color = product["color"] if product else "#b9b9b9"
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="300" height="375" viewBox="0 0 300 375">'
+        f'<rect width="300" height="375" fill="{color}"/>'
+        '<text x="150" y="190" font-family="sans-serif" font-size="18" '
+        f'text-anchor="middle" fill="#ffffff">{escape(label)}</text>'
+        '</svg>'
+    )
@@ -0,0 +1,220 @@
+"""
+Rendu HTML des pages du serveur local
+
+Les ids, classes et attributs data-test sont ceux de www.saucedemo.com
+pour que les Page Objects fonctionnent à l'identique sur les deux cibles.
+"""
+
+import json
+import random
+from html import escape
+
+from local_server.catalog import (
+    PRODUCTS, detail_link_for, product_image_for, product_slug
+)
+
+
+def layout(title, body, username=None, body_class="", settings=None) -> str:
+    """Squelette commun : CSS, script applicatif et paramètres injectés"""
+    settings = dict(settings or {}, username=username)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="/static/app.css">
+</head>
+<body class="{body_class}">
+{body}
+<script>window.SAUCEDEMO = {json.dumps(settings)};</script>
+<script src="/static/app.js"></script>
+</body>
+</html>"""
+
+
+def header(page_title, secondary="") -> str:
+    return f"""<div id="page_wrapper" class="page_wrapper">
+<div class="primary_header" data-test="primary-header">
+  <div id="menu_button_container" class="bm-burger-button">
+    <button type="button" id="react-burger-menu-btn">Open Menu</button>
+  </div>
+  <nav class="bm-menu-wrap" hidden>
+    <a id="inventory_sidebar_link" data-test="inventory-sidebar-link" class="bm-item menu-item" href="/inventory.html">All Items</a>
+    <a id="logout_sidebar_link" data-test="logout-sidebar-link" class="bm-item menu-item" href="#">Logout</a>
+    <a id="reset_sidebar_link" data-test="reset-sidebar-link" class="bm-item menu-item" href="#">Reset App State</a>
+  </nav>
+  <div class="app_logo">Swag Labs</div>
+  <div id="shopping_cart_container" class="shopping_cart_container">
+    <a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html"></a>
+  </div>
+</div>
+<div class="header_secondary_container" data-test="secondary-header">
+  <span class="title" data-test="title">{escape(page_title)}</span>
+  {secondary}
+</div>"""
+
+
+def render_login(users, password, locked_users) -> str:
+    body = """<div class="login_container">
+<div class="login_logo">Swag Labs</div>
+<div class="login_wrapper">
+  <form id="login-form">
+    <div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none"></div>
+    <div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none"></div>
+    <div class="error-message-container"></div>
+    <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">
+  </form>
+</div>
+</div>"""
+    settings = {"users": users, "password": password, "lockedUsers": sorted(locked_users)}
+    return layout("Swag Labs", body, settings=settings)
+
+
+def render_inventory(username) -> str:
+    items = []
+    for position, product in enumerate(PRODUCTS):
+        price = product["price"]
+        if username == "visual_user":
+            price = round(random.uniform(5, 50), 2)  # Prix aléatoires (bug visuel)
+        items.append(f"""<div class="inventory_item" data-test="inventory-item">
+  <div class="inventory_item_img">
+    <a href="#" id="item_{product['id']}_img_link" data-test="item-{product['id']}-img-link" data-href="{detail_link_for(username, product)}">
+      <img alt="{escape(product['name'])}" class="inventory_item_img" src="{product_image_for(username, product, position)}" data-test="inventory-item-{product_slug(product)}-img">
+    </a>
+  </div>
+  <div class="inventory_item_description" data-test="inventory-item-description">
+    <div class="inventory_item_label">
+      <a href="#" id="item_{product['id']}_title_link" data-test="item-{product['id']}-title-link" data-href="{detail_link_for(username, product)}">
+        <div class="inventory_item_name" data-test="inventory-item-name">{escape(product['name'])}</div>
+      </a>
+      <div class="inventory_item_desc" data-test="inventory-item-desc">{escape(product['description'])}</div>
+    </div>
+    <div class="pricebar">
+      <div class="inventory_item_price" data-test="inventory-item-price" data-price="{price:.2f}">${price:.2f}</div>
+      <button class="btn btn_primary btn_small btn_inventory" data-item-id="{product['id']}" data-slug="{escape(product_slug(product))}" id="add-to-cart-{escape(product_slug(product))}">Add to cart</button>
+    </div>
+  </div>
+</div>""")
+    
+    sort = """<div class="right_component"><span class="select_container">
+  <select class="product_sort_container" data-test="product-sort-container">
+    <option value="az">Name (A to Z)</option>
+    <option value="za">Name (Z to A)</option>
+    <option value="lohi">Price (low to high)</option>
+    <option value="hilo">Price (high to low)</option>
+  </select>
+</span></div>"""
+    body = header("Products", sort) + f"""
+<div id="inventory_container" class="inventory_container">
+  <div class="inventory_list" data-test="inventory-list">
+{''.join(items)}
+  </div>
+</div>
+</div>"""
+    return layout("Swag Labs", body, username, _body_class(username))
+
+
+def render_item(username, product) -> str:
+    if product is None:
+        body = header("") + """
+<div class="inventory_details"><div class="inventory_details_container">
+  <div class="inventory_details_name large_size" data-test="inventory-item-name">ITEM NOT FOUND</div>
+  <button class="btn btn_secondary back btn_large inventory_details_back_button" data-test="back-to-products" id="back-to-products">Back to products</button>
+</div></div>
+</div>"""
+        return layout("Swag Labs", body, username, _body_class(username))
+    
+    body = header("", '<button class="btn btn_secondary back btn_large inventory_details_back_button" '
+                      'data-test="back-to-products" id="back-to-products">Back to products</button>') + f"""
+<div class="inventory_details" data-test="inventory-container">
+  <div class="inventory_details_container">
+    <div class="inventory_details_img_container">
+      <img alt="{escape(product['name'])}" class="inventory_details_img" src="{product_image_for(username, product)}" data-test="item-{product_slug(product)}-img">
+    </div>
+    <div class="inventory_details_desc_container">
+      <div class="inventory_details_name large_size" data-test="inventory-item-name">{escape(product['name'])}</div>
+      <div class="inventory_details_desc large_size" data-test="inventory-item-desc">{escape(product['description'])}</div>
+      <div class="inventory_details_price" data-test="inventory-item-price">${product['price']:.2f}</div>
+      <button class="btn btn_primary btn_small btn_inventory" data-item-id="{product['id']}" data-slug="{escape(product_slug(product))}" data-detail="1" id="add-to-cart">Add to cart</button>
+    </div>
+  </div>
+</div>
+</div>"""
+    return layout("Swag Labs", body, username, _body_class(username))
+
+
+def render_cart(username) -> str:
+    body = header("Your Cart") + """
+<div id="cart_contents_container" class="cart_contents_container">
+  <div class="cart_list" data-test="cart-list">
+    <div class="cart_quantity_label">QTY</div>
+    <div class="cart_desc_label">Description</div>
+  </div>
+  <div class="cart_footer">
+    <button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping">Continue Shopping</button>
+    <button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout">Checkout</button>
+  </div>
+</div>
+</div>"""
+    return layout("Swag Labs", body, username, _body_class(username), {"products": _cart_settings()})
+
+
+def _cart_settings() -> dict:
+    return {str(p["id"]): {"name": p["name"], "description": p["description"],
+                           "price": p["price"], "slug": product_slug(p)} for p in PRODUCTS}
+
+
+def render_checkout_info(username) -> str:
+    body = header("Checkout: Your Information") + """
+<div class="checkout_info_container">
+  <form id="checkout-info-form">
+    <div class="checkout_info">
+      <div class="form_group"><input class="input_error form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName"></div>
+      <div class="form_group"><input class="input_error form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName"></div>
+      <div class="form_group"><input class="input_error form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode"></div>
+      <div class="error-message-container"></div>
+    </div>
+    <div class="checkout_buttons">
+      <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel">Cancel</button>
+      <input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">
+    </div>
+  </form>
+</div>
+</div>"""
+    return layout("Swag Labs", body, username, _body_class(username))
+
+
+def render_checkout_overview(username) -> str:
+    body = header("Checkout: Overview") + """
+<div id="checkout_summary_container" class="checkout_summary_container">
+  <div class="cart_list" data-test="cart-list" data-summary="1">
+    <div class="cart_quantity_label">QTY</div>
+    <div class="cart_desc_label">Description</div>
+  </div>
+  <div class="summary_info">
+    <div class="summary_subtotal_label" data-test="subtotal-label"></div>
+    <div class="summary_tax_label" data-test="tax-label"></div>
+    <div class="summary_info_label summary_total_label" data-test="total-label"></div>
+    <div class="cart_footer">
+      <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel">Cancel</button>
+      <button class="btn btn_action btn_medium cart_button" data-test="finish" id="finish">Finish</button>
+    </div>
+  </div>
+</div>
+</div>"""
+    return layout("Swag Labs", body, username, _body_class(username), {"products": _cart_settings()})
+
+
+def render_checkout_complete(username) -> str:
+    body = header("Checkout: Complete!") + """
+<div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">
+  <h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>
+  <div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>
+  <button class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products">Back Home</button>
+</div>
+</div>"""
+    return layout("Swag Labs", body, username, _body_class(username))
+
+
+def _body_class(username) -> str:
+    return "visual_failure" if username == "visual_user" else ""
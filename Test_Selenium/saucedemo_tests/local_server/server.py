@@ -0,0 +1,145 @@
+"""
+Serveur HTTP local qui remplace www.saucedemo.com pendant les tests
+
+Sert les pages login, inventaire, détails produit, panier et commande avec les mêmes
+ids/classes que le vrai site, et reproduit les comportements de chaque
+utilisateur de Config.USERS (locked_out_user bloqué, images cassées de
+problem_user, lenteur configurable de performance_glitch_user, ...).
+"""
+
+import logging
+import mimetypes
+import os
+import threading
+import time
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from config.config import Config
+from local_server import pages
+from local_server.catalog import PRODUCTS_BY_ID, render_image_svg
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class SauceDemoHandler(BaseHTTPRequestHandler):
+    """Routage des requêtes vers les pages de l'application"""
+    
+    server_version = "LocalSauceDemo/1.0"
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path
+        
+        if path in ("/", "/index.html"):
+            return self._send_html(pages.render_login(
+                Config.USERS, Config.PASSWORD, Config.LOCKED_USERS
+            ))
+        if path.startswith("/static/media/"):
+            return self._send_media(os.path.basename(path))
+        if path.startswith("/static/"):
+            return self._send_static(path[len("/static/"):])
+        
+        username = self._session_username()
+        if username is None:
+            return self._redirect("/")
+        
+        if path == "/inventory.html":
+            if username == "performance_glitch_user":
+                time.sleep(self.server.glitch_delay)
+            return self._send_html(pages.render_inventory(username))
+        if path == "/inventory-item.html":
+            item_id = parse_qs(url.query).get("id", [""])[0]
+            product = PRODUCTS_BY_ID.get(int(item_id)) if item_id.isdigit() else None
+            return self._send_html(pages.render_item(username, product))
+        if path == "/cart.html":
+            return self._send_html(pages.render_cart(username))
+        if path == "/checkout-step-one.html":
+            return self._send_html(pages.render_checkout_info(username))
+        if path == "/checkout-step-two.html":
+            return self._send_html(pages.render_checkout_overview(username))
+        if path == "/checkout-complete.html":
+            return self._send_html(pages.render_checkout_complete(username))
+        
+        self.send_error(HTTPStatus.NOT_FOUND)
+    
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+    
+    def _session_username(self):
+        """Utilisateur du cookie session-username, s'il est autorisé"""
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get("session-username")
+        if morsel is None:
+            return None
+        username = morsel.value
+        if username not in Config.USERS or username in Config.LOCKED_USERS:
+            return None
+        return username
+    
+    def _send_html(self, html):
+        self._send(HTTPStatus.OK, "text/html; charset=utf-8", html.encode("utf-8"))
+    
+    def _send_media(self, filename):
+        svg = render_image_svg(os.path.splitext(filename)[0])
+        if svg is None:
+            return self.send_error(HTTPStatus.NOT_FOUND)
+        self._send(HTTPStatus.OK, "image/svg+xml", svg.encode("utf-8"))
+    
+    def _send_static(self, relative_path):
+        file_path = os.path.normpath(os.path.join(STATIC_DIR, relative_path))
+        if not file_path.startswith(STATIC_DIR) or not os.path.isfile(file_path):
+            return self.send_error(HTTPStatus.NOT_FOUND)
+        with open(file_path, "rb") as f:
+            content = f.read()
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        self._send(HTTPStatus.OK, content_type, content)
+    
+    def _redirect(self, location):
+        self.send_response(HTTPStatus.FOUND)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def _send(self, status, content_type, content):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class LocalSauceDemo:
+    """Serveur local démarré dans un thread d'arrière-plan"""
+    
+    def __init__(self, host="127.0.0.1", port=None, glitch_delay=None):
+        self.host = host
+        self.port = Config.LOCAL_SERVER_PORT if port is None else port
+        self.glitch_delay = Config.LOCAL_GLITCH_DELAY if glitch_delay is None else glitch_delay
+        self._httpd = None
+        self._thread = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self._httpd.server_address[1]}/"
+    
+    def start(self) -> str:
+        """Démarre le serveur et retourne son URL de base"""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), SauceDemoHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.glitch_delay = self.glitch_delay
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("SauceDemo local démarré sur %s", self.base_url)
+        return self.base_url
+    
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
@@ -0,0 +1,222 @@
+/**
+ * Comportement client du serveur local SauceDemo :
+ * login, panier (localStorage "cart-contents"), tri, commande, menu et navigation.
+ */
+(function () {
+  const SETTINGS = window.SAUCEDEMO || {};
+  const USER = SETTINGS.username;
+  const CART_KEY = 'cart-contents';
+
+  function getCart() {
+    try {
+      return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function setCart(ids) {
+    if (ids.length) {
+      window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    } else {
+      window.localStorage.removeItem(CART_KEY);
+    }
+    renderBadge();
+  }
+
+  function renderBadge() {
+    const link = document.querySelector('.shopping_cart_link');
+    if (!link) return;
+    let badge = link.querySelector('.shopping_cart_badge');
+    const count = getCart().length;
+    if (!count) {
+      if (badge) badge.remove();
+      return;
+    }
+    if (!badge) {
+      badge = document.createElement('span');
+      badge.className = 'shopping_cart_badge';
+      badge.setAttribute('data-test', 'shopping-cart-badge');
+      link.appendChild(badge);
+    }
+    badge.textContent = String(count);
+  }
+
+  function renderButton(button) {
+    const inCart = getCart().includes(Number(button.dataset.itemId));
+    const suffix = button.dataset.detail ? '' : '-' + button.dataset.slug;
+    button.id = (inCart ? 'remove' : 'add-to-cart') + suffix;
+    button.textContent = inCart ? 'Remove' : 'Add to cart';
+    button.classList.toggle('btn_primary', !inCart);
+    button.classList.toggle('btn_secondary', inCart);
+  }
+
+  function toggleCart(button) {
+    const id = Number(button.dataset.itemId);
+    const cart = getCart();
+    if (cart.includes(id)) {
+      if (USER === 'error_user') {
+        console.error('Failed to remove item from cart.');
+        return;
+      }
+      setCart(cart.filter((x) => x !== id));
+    } else {
+      if (USER === 'error_user' && id % 2 === 1) {
+        console.error('Failed to add item to the cart.');
+        return;
+      }
+      cart.push(id);
+      setCart(cart);
+    }
+    renderButton(button);
+    const cartItem = button.closest('.cart_item');
+    if (cartItem && !getCart().includes(id)) cartItem.remove();
+  }
+
+  function showError(message) {
+    const container = document.querySelector('.error-message-container');
+    container.classList.add('error');
+    container.innerHTML = '<h3 data-test="error"><button class="error-button" data-test="error-button">x</button></h3>';
+    container.querySelector('h3').appendChild(document.createTextNode(message));
+  }
+
+  function login(event) {
+    event.preventDefault();
+    const username = document.getElementById('user-name').value;
+    const password = document.getElementById('password').value;
+    if (!username) return showError('Epic sadface: Username is required');
+    if (!password) return showError('Epic sadface: Password is required');
+    if (!SETTINGS.users.includes(username) || password !== SETTINGS.password) {
+      return showError('Epic sadface: Username and password do not match any user in this service');
+    }
+    if (SETTINGS.lockedUsers.includes(username)) {
+      return showError('Epic sadface: Sorry, this user has been locked out.');
+    }
+    document.cookie = 'session-username=' + username + '; path=/';
+    window.location.href = '/inventory.html';
+  }
+
+  function sortInventory(order) {
+    if (USER === 'problem_user') return;
+    if (USER === 'error_user') {
+      console.error('Sorting is broken! This error has been reported to Backtrace.');
+      return;
+    }
+    const list = document.querySelector('.inventory_list');
+    const items = Array.from(list.querySelectorAll('.inventory_item'));
+    const name = (el) => el.querySelector('.inventory_item_name').textContent;
+    const price = (el) => Number(el.querySelector('.inventory_item_price').dataset.price);
+    const compare = {
+      az: (a, b) => name(a).localeCompare(name(b)),
+      za: (a, b) => name(b).localeCompare(name(a)),
+      lohi: (a, b) => price(a) - price(b),
+      hilo: (a, b) => price(b) - price(a),
+    }[order];
+    items.sort(compare).forEach((item) => list.appendChild(item));
+  }
+
+  function submitCheckoutInfo(event) {
+    event.preventDefault();
+    const required = [['first-name', 'First Name'], ['last-name', 'Last Name'], ['postal-code', 'Postal Code']];
+    for (const [id, label] of required) {
+      if (!document.getElementById(id).value) return showError('Error: ' + label + ' is required');
+    }
+    window.location.href = '/checkout-step-two.html';
+  }
+
+  function renderSummary() {
+    const subtotal = getCart().reduce((sum, id) => {
+      const product = SETTINGS.products[String(id)];
+      return sum + (product ? product.price : 0);
+    }, 0);
+    const tax = Math.round(subtotal * 8) / 100;
+    document.querySelector('.summary_subtotal_label').textContent = 'Item total: $' + subtotal.toFixed(2);
+    document.querySelector('.summary_tax_label').textContent = 'Tax: $' + tax.toFixed(2);
+    document.querySelector('.summary_total_label').textContent = 'Total: $' + (subtotal + tax).toFixed(2);
+  }
+
+  function renderCart() {
+    const list = document.querySelector('.cart_list');
+    const summary = Boolean(list.dataset.summary);
+    getCart().forEach((id) => {
+      const product = SETTINGS.products[String(id)];
+      if (!product) return;
+      const item = document.createElement('div');
+      item.className = 'cart_item';
+      item.setAttribute('data-test', 'inventory-item');
+      item.innerHTML =
+        '<div class="cart_quantity" data-test="item-quantity">1</div>' +
+        '<div class="cart_item_label">' +
+        '<a href="#" id="item_' + id + '_title_link" data-href="/inventory-item.html?id=' + id + '">' +
+        '<div class="inventory_item_name" data-test="inventory-item-name"></div></a>' +
+        '<div class="inventory_item_desc" data-test="inventory-item-desc"></div>' +
+        '<div class="item_pricebar"><div class="inventory_item_price" data-test="inventory-item-price"></div>' +
+        '<button class="btn btn_secondary btn_small cart_button" data-item-id="' + id + '"></button></div></div>';
+      item.querySelector('.inventory_item_name').textContent = product.name;
+      item.querySelector('.inventory_item_desc').textContent = product.description;
+      item.querySelector('.inventory_item_price').textContent = '$' + product.price.toFixed(2);
+      const button = item.querySelector('button');
+      list.appendChild(item);
+      if (summary) {
+        button.remove();
+      } else {
+        button.dataset.slug = product.slug;
+        renderButton(button);
+      }
+    });
+    if (summary) renderSummary();
+  }
+
+  document.addEventListener('click', (event) => {
+    const target = event.target;
+    if (target.closest('.error-button')) {
+      const container = document.querySelector('.error-message-container');
+      container.classList.remove('error');
+      container.innerHTML = '';
+      return;
+    }
+    const cartButton = target.closest('button[data-item-id]');
+    if (cartButton) return toggleCart(cartButton);
+
+    const link = target.closest('a[data-href]');
+    if (link) {
+      event.preventDefault();
+      window.location.href = link.dataset.href;
+      return;
+    }
+    if (target.closest('#back-to-products') || target.closest('#continue-shopping')) {
+      window.location.href = '/inventory.html';
+    } else if (target.closest('#checkout')) {
+      window.location.href = '/checkout-step-one.html';
+    } else if (target.closest('#cancel')) {
+      event.preventDefault();
+      window.location.href = document.getElementById('checkout-info-form') ? '/cart.html' : '/inventory.html';
+    } else if (target.closest('#finish')) {
+      setCart([]);
+      window.location.href = '/checkout-complete.html';
+    } else if (target.closest('#react-burger-menu-btn')) {
+      const menu = document.querySelector('.bm-menu-wrap');
+      menu.hidden = !menu.hidden;
+    } else if (target.closest('#logout_sidebar_link')) {
+      event.preventDefault();
+      document.cookie = 'session-username=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT';
+      window.location.href = '/';
+    } else if (target.closest('#reset_sidebar_link')) {
+      event.preventDefault();
+      setCart([]);
+      document.querySelectorAll('button[data-item-id]').forEach(renderButton);
+    }
+  });
+
+  document.addEventListener('change', (event) => {
+    if (event.target.matches('.product_sort_container')) sortInventory(event.target.value);
+  });
+
+  const form = document.getElementById('login-form');
+  if (form) form.addEventListener('submit', login);
+  const checkoutForm = document.getElementById('checkout-info-form');
+  if (checkoutForm) checkoutForm.addEventListener('submit', submitCheckoutInfo);
+  if (document.querySelector('.cart_list')) renderCart();
+  document.querySelectorAll('button[data-item-id]').forEach(renderButton);
+  renderBadge();
+})();
@@ -4,67 +4,314 @@
 # BASE_PAGE_PY = '''"""
 # Classe de base pour toutes les pages
 # """
+import weakref
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from config.config import Config
+from pages.locators import registry
+from utils.image_integrity import IMAGE_STATES_SCRIPT
+from utils.retry import retry_action
+from utils.step_timing import instrument_page_class, recorder, untimed
+from utils.visual import IMAGES_LOADED_SCRIPT, visual
+from utils.wait_budget import wait_budget
+from utils.web_perf import web_perf
+
+
+# Résout après `quiet` ms sans mutation du DOM (false si `timeout` ms atteint avant)
+DOM_SETTLED_SCRIPT = """
+const [quiet, timeout, done] = arguments;
+let quietTimer;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quiet);
+});
+const timeoutTimer = setTimeout(() => finish(false), timeout);
+function finish(settled) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(timeoutTimer);
+    done(settled);
+}
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+quietTimer = setTimeout(() => finish(true), quiet);
+"""
+
+ELEMENT_RECT_SCRIPT = """
+const r = arguments[0].getBoundingClientRect();
+return [r.x, r.y, r.width, r.height];
+"""
+
+
+class element_is_stable:
+    """Condition d'attente : l'élément ne bouge plus entre deux sondages"""
+    
+    def __init__(self, target):
+        self.target = target
+        self.last_rect = None
+    
+    def __call__(self, driver):
+        try:
+            element = self.target
+            if isinstance(element, tuple):
+                element = driver.find_element(*element)
+            rect = driver.execute_script(ELEMENT_RECT_SCRIPT, element)
+        except StaleElementReferenceException:
+            self.last_rect = None
+            return False
+        stable = rect == self.last_rect and rect[2] > 0 and rect[3] > 0
+        self.last_rect = rect
+        return element if stable else False
+
+
+class PageState:
+    """
+    État du navigateur partagé par toutes les pages d'un même driver
+    dom_version est incrémenté à chaque action susceptible de modifier le DOM
+    """
+    
+    def __init__(self):
+        self.url = None
+        self.dom_version = 0
+    
+    def bump(self, url=None):
+        self.dom_version += 1
+        self.url = url
+
+
+_page_states = weakref.WeakKeyDictionary()
 
 
 class BasePage:
-    """Classe de base avec méthodes communes à toutes les pages"""
+    """
+    Classe de base avec méthodes communes à toutes les pages
+    Les méthodes publiques de chaque page sont mesurées automatiquement
+    (voir utils/step_timing.py)
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_page_class(cls)
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT, poll_frequency=Config.POLL_FREQUENCY)
     
-    def find_element(self, by, value):
+    @property
+    def page_state(self) -> PageState:
+        """État partagé (URL connue, version du DOM) pour ce driver"""
+        state = _page_states.get(self.driver)
+        if state is None:
+            state = _page_states[self.driver] = PageState()
+        return state
+    
+    @untimed
+    def mark_dom_changed(self, url=None):
+        """Signale qu'une action a pu modifier la page (invalide les caches)"""
+        self.page_state.bump(url)
+    
+    @untimed
+    def perform(self, action, locator=None):
+        """
+        Exécute une action en relançant brièvement les erreurs transitoires
+        (élément périmé, clic intercepté) ; chaque relance est enregistrée
+        dans le rapport d'instabilité (reports/flakes.json)
+        """
+        step = recorder.current_step
+        return retry_action(
+            action,
+            page=type(self).__name__,
+            step=step["step"] if step else None,
+            locator=f"{locator[0]}={locator[1]}" if locator else None,
+        )
+    
+    @untimed
+    def track_locator(self, by, value):
+        """Mesure une requête dans le profil du locator (voir pages/locators.py)"""
+        return registry.track(type(self).__name__, by, value)
+    
+    def find_element(self, by, value, timeout=None):
         """Trouve un élément avec attente explicite"""
-        return self.wait.until(EC.presence_of_element_located((by, value)))
+        with self.track_locator(by, value):
+            return self.wait_until(EC.presence_of_element_located((by, value)), timeout)
     
-    def find_elements(self, by, value):
+    def find_elements(self, by, value, timeout=None):
         """Trouve plusieurs éléments"""
-        return self.wait.until(EC.presence_of_all_elements_located((by, value)))
+        with self.track_locator(by, value):
+            return self.wait_until(EC.presence_of_all_elements_located((by, value)), timeout)
+    
+    def resolve_locators(self, *locators):
+        """Résout plusieurs locators déclarés en un seul aller-retour {NOM: [éléments]}"""
+        found = registry.resolve(self.driver, locators)
+        return {locator.name: found[locator.key] for locator in locators}
     
-    def click_element(self, by, value):
+    def read_texts(self, *locators):
+        """Texte du premier élément de chaque locator (None si absent), en un seul aller-retour"""
+        found = registry.resolve(self.driver, locators, mode="text")
+        return {locator.name: (found[locator.key] or [None])[0] for locator in locators}
+    
+    def read_all_texts(self, locator):
+        """Textes de tous les éléments d'un locator, en un seul aller-retour"""
+        return registry.resolve(self.driver, [locator], mode="text")[locator.key]
+    
+    def click_element(self, by, value, timeout=None):
         """Clique sur un élément avec attente de cliquabilité"""
-        element = self.wait.until(EC.element_to_be_clickable((by, value)))
-        element.click()
-        return element
+        def click():
+            element = self.wait_until(EC.element_to_be_clickable((by, value)), timeout)
+            element.click()
+            return element
+        
+        try:
+            with self.track_locator(by, value):
+                return self.perform(click, locator=(by, value))
+        finally:
+            self.mark_dom_changed()
     
     def is_element_visible(self, by, value, timeout=None):
         """Vérifie si un élément est visible"""
-        timeout = timeout or Config.EXPLICIT_WAIT
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
-            )
-            return True
-        except TimeoutException:
-            return False
+        with self.track_locator(by, value):
+            try:
+                self.wait_until(EC.visibility_of_element_located((by, value)), timeout)
+                return True
+            except TimeoutException:
+                return False
     
-    def is_element_present(self, by, value):
-        """Vérifie si un élément est présent dans le DOM"""
-        try:
-            self.driver.find_element(by, value)
-            return True
-        except:
-            return False
+    def is_element_present(self, by, value, timeout=0):
+        """
+        Vérifie si un élément est présent dans le DOM
+        timeout=0 : réponse immédiate (sans attente implicite en mode strict)
+        """
+        with self.track_locator(by, value):
+            if not timeout:
+                return len(self.driver.find_elements(by, value)) > 0
+            try:
+                self.wait_until(EC.presence_of_element_located((by, value)), timeout)
+                return True
+            except TimeoutException:
+                return False
     
-    def get_text(self, by, value):
+    def get_text(self, by, value, timeout=None):
         """Récupère le texte d'un élément"""
-        return self.find_element(by, value).text
+        with self.track_locator(by, value):
+            return self.perform(lambda: self.find_element(by, value, timeout).text, locator=(by, value))
     
-    def send_keys(self, by, value, text):
+    def send_keys(self, by, value, text, timeout=None):
         """Envoie du texte à un élément"""
-        element = self.find_element(by, value)
-        element.clear()
-        element.send_keys(text)
+        def type_text():
+            element = self.find_element(by, value, timeout)
+            element.clear()
+            element.send_keys(text)
+        
+        try:
+            with self.track_locator(by, value):
+                self.perform(type_text, locator=(by, value))
+        finally:
+            self.mark_dom_changed()
     
     def get_current_url(self):
         """Récupère l'URL actuelle"""
         return self.driver.current_url
     
     def navigate_to(self, url):
-        """Navigate vers une URL"""
+        """Navigate vers une URL (métriques de la page chargée collectées)"""
         self.driver.get(url)
+        self.mark_dom_changed(url)
+        self.capture_web_perf()
+    
+    @untimed
+    def capture_web_perf(self, transition=None):
+        """
+        Collecte Navigation/Resource Timing, paint et long tasks après une
+        transition (nommée d'après l'étape en cours, voir utils/web_perf.py)
+        """
+        if transition is None:
+            step = recorder.current_step
+            transition = f"{step['page']}.{step['step']}" if step else type(self).__name__
+        return web_perf.collect(self.driver, transition)
+    
+    def capture_visual(self, name, regions):
+        """
+        Vignettes des régions de la page une fois les images chargées ; les
+        empreintes sont calculées en arrière-plan (voir utils/visual.py)
+        
+        Returns:
+            VisualCheck (results() attend et compare aux références)
+        """
+        self.wait_until(lambda d: d.execute_script(IMAGES_LOADED_SCRIPT), message="Images non chargées")
+        return visual.check(self.driver, name, regions)
+    
+    def read_image_states(self, selectors, timeout=None):
+        """
+        État de chargement (complete, naturalWidth/Height) de l'image de chaque
+        conteneur, en un seul appel une fois les images terminées
+        selectors : {'item': conteneur ou None pour la page, 'name', 'image'}
+        """
+        timeout = wait_budget.clamp(recorder.current_context.get("test_id"),
+                                    Config.EXPLICIT_WAIT if timeout is None else timeout)
+        with recorder.waiting():
+            return self.driver.execute_async_script(IMAGE_STATES_SCRIPT, selectors, int(timeout * 1000))
+    
+    # ----- Attentes conditionnelles (aucune pause fixe) -----
+    
+    def wait_until(self, condition, timeout=None, message=""):
+        """
+        Attend qu'une condition soit vraie et retourne sa valeur
+        Le timeout est plafonné par le budget d'attente restant du test
+        """
+        timeout = wait_budget.clamp(recorder.current_context.get("test_id"),
+                                    Config.EXPLICIT_WAIT if timeout is None else timeout)
+        with recorder.waiting():
+            return WebDriverWait(
+                self.driver, timeout, poll_frequency=Config.POLL_FREQUENCY
+            ).until(condition, message)
+    
+    def wait_for_url_contains(self, fragment, timeout=None):
+        """Attend que l'URL contienne un fragment"""
+        return self.wait_until(EC.url_contains(fragment), timeout,
+                               f"URL ne contient pas '{fragment}'")
+    
+    def wait_for_url_change(self, old_url, timeout=None):
+        """Attend que l'URL soit différente de old_url et retourne la nouvelle"""
+        self.wait_until(EC.url_changes(old_url), timeout, f"URL inchangée: {old_url}")
+        return self.driver.current_url
+    
+    def wait_for_dom_settled(self, quiet_ms=None, timeout=None):
+        """Attend que le DOM ne subisse plus de mutations pendant quiet_ms"""
+        quiet_ms = Config.DOM_QUIET_MS if quiet_ms is None else quiet_ms
+        timeout = wait_budget.clamp(recorder.current_context.get("test_id"),
+                                    Config.EXPLICIT_WAIT if timeout is None else timeout)
+        timeout_ms = int(timeout * 1000)
+        with recorder.waiting():
+            return self.driver.execute_async_script(DOM_SETTLED_SCRIPT, quiet_ms, timeout_ms)
+    
+    def wait_for_element_stable(self, target, timeout=None):
+        """Attend qu'un élément (locator ou WebElement) ait une position stable"""
+        return self.wait_until(element_is_stable(target), timeout, "Élément instable")
+    
+    def wait_for_navigation(self, action, url_fragment=None, timeout=None):
+        """
+        Exécute une action puis attend que la navigation soit effective :
+        URL modifiée (ou contenant url_fragment) et document chargé
+        """
+        old_url = self.driver.current_url
+        try:
+            action()
+        finally:
+            self.mark_dom_changed()
+        if url_fragment:
+            self.wait_for_url_contains(url_fragment, timeout)
+        else:
+            self.wait_for_url_change(old_url, timeout)
+        self.wait_until(
+            lambda d: d.execute_script("return document.readyState") == "complete",
+            timeout, "Document non chargé"
+        )
+        url = self.driver.current_url
+        self.page_state.url = url
+        self.capture_web_perf()
+        return url
+
+
+instrument_page_class(BasePage)
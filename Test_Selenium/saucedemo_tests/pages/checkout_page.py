@@ -0,0 +1,70 @@
+"""
+Page Object pour le panier et le tunnel de commande
+(panier → informations client → récapitulatif → confirmation)
+"""
+
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.locators import Locator
+
+
+class CheckoutPage(BasePage):
+    """Panier et étapes de la commande"""
+    
+    # Locators - panier
+    CART_ITEMS = Locator(By.CLASS_NAME, "cart_item", optional=True)
+    CART_ITEM_NAMES = Locator(By.CSS_SELECTOR, ".cart_item .inventory_item_name", optional=True)
+    CHECKOUT_BUTTON = Locator(By.ID, "checkout")
+    
+    # Locators - informations client
+    FIRST_NAME_INPUT = Locator(By.CSS_SELECTOR, "[data-test='firstName']")
+    LAST_NAME_INPUT = Locator(By.CSS_SELECTOR, "[data-test='lastName']")
+    POSTAL_CODE_INPUT = Locator(By.CSS_SELECTOR, "[data-test='postalCode']")
+    CONTINUE_BUTTON = Locator(By.ID, "continue")
+    ERROR_MESSAGE = Locator(By.CSS_SELECTOR, "[data-test='error']", optional=True)
+    
+    # Locators - récapitulatif et confirmation
+    SUMMARY_TOTAL = Locator(By.CLASS_NAME, "summary_total_label")
+    FINISH_BUTTON = Locator(By.ID, "finish")
+    COMPLETE_HEADER = Locator(By.CLASS_NAME, "complete-header")
+    COMPLETE_TEXT = Locator(By.CLASS_NAME, "complete-text")
+    
+    def get_cart_item_names(self) -> list:
+        """Noms des articles du panier (page panier ouverte)"""
+        self.wait_for_url_contains("/cart.html")
+        return self.read_all_texts(self.CART_ITEM_NAMES)
+    
+    def start_checkout(self):
+        """Panier → formulaire des informations client"""
+        self.wait_for_navigation(lambda: self.click_element(*self.CHECKOUT_BUTTON),
+                                 url_fragment="checkout-step-one")
+    
+    def fill_information(self, first_name, last_name, postal_code):
+        """Saisit les informations client"""
+        self.send_keys(*self.FIRST_NAME_INPUT, first_name)
+        self.send_keys(*self.LAST_NAME_INPUT, last_name)
+        self.send_keys(*self.POSTAL_CODE_INPUT, postal_code)
+    
+    def continue_to_overview(self):
+        """Formulaire → récapitulatif de la commande"""
+        self.wait_for_navigation(lambda: self.click_element(*self.CONTINUE_BUTTON),
+                                 url_fragment="checkout-step-two")
+    
+    def get_total(self) -> str:
+        """Libellé du total (ex: « Total: $32.39 »)"""
+        return self.get_text(*self.SUMMARY_TOTAL)
+    
+    def finish(self):
+        """Récapitulatif → confirmation"""
+        self.wait_for_navigation(lambda: self.click_element(*self.FINISH_BUTTON),
+                                 url_fragment="checkout-complete")
+    
+    def get_confirmation(self) -> dict:
+        """Titre et texte de la confirmation de commande"""
+        self.find_element(*self.COMPLETE_HEADER)
+        texts = self.read_texts(self.COMPLETE_HEADER, self.COMPLETE_TEXT)
+        return {'header': texts['COMPLETE_HEADER'], 'text': texts['COMPLETE_TEXT']}
+    
+    def get_error_message(self):
+        """Message d'erreur du formulaire (None si absent)"""
+        return self.read_texts(self.ERROR_MESSAGE)['ERROR_MESSAGE']
@@ -2,64 +2,237 @@
 Page Object pour la page du catalogue produits
 """
 
+import logging
+from urllib.parse import urljoin
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import NoSuchElementException
 from pages.base_page import BasePage
+from pages.locators import Locator
+from utils.image_integrity import build_integrity_table
+from config.config import Config
 from typing import List, Dict
-import time
+
+logger = logging.getLogger(__name__)
+
+
+# Extraction de tous les produits en un seul aller-retour navigateur
+# (sélecteurs transmis depuis le registre des locators, voir PRODUCT_SELECTORS).
+# Installe aussi un MutationObserver qui incrémente window.__sdDomVersion
+# quand la liste change (utilisé pour valider le cache de snapshot).
+PRODUCTS_SCRIPT = """
+const sel = arguments[0];
+if (!window.__sdObserver) {
+    window.__sdDomVersion = 0;
+    window.__sdObserver = new MutationObserver(() => { window.__sdDomVersion++; });
+    window.__sdObserver.observe(document.body, {
+        childList: true, subtree: true, characterData: true,
+        attributes: true, attributeFilter: ['id', 'src']
+    });
+}
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+const attr = (root, selector, name) => {
+    const el = root.querySelector(selector);
+    return el ? el.getAttribute(name) : null;
+};
+const products = Array.from(document.querySelectorAll(sel.item)).map((item, index) => {
+    const titleLink = attr(item, sel.title_link, 'id');
+    const imageLink = attr(item, sel.image_link, 'id');
+    const idMatch = /item_(\\d+)_/.exec(titleLink || imageLink || '');
+    return {
+        index: index,
+        name: text(item, sel.name),
+        price: text(item, sel.price),
+        description: text(item, sel.description),
+        image_src: attr(item, sel.image, 'src'),
+        add_button_id: attr(item, sel.add_button, 'id'),
+        remove_button_id: attr(item, sel.remove_button, 'id'),
+        name_link_id: titleLink,
+        image_link_id: imageLink,
+        item_id: idMatch ? idMatch[1] : null
+    };
+});
+return {url: location.href, dom_version: window.__sdDomVersion, products: products};
+"""
+
+SNAPSHOT_TOKEN_SCRIPT = """
+return {url: location.href, dom_version: window.__sdDomVersion === undefined ? null : window.__sdDomVersion};
+"""
+
+# État modifiable par un test : panier (badge + stockage) et tri
+MUTABLE_STATE_SCRIPT = """
+const sel = arguments[0];
+const badge = document.querySelector(sel.badge);
+const sort = document.querySelector(sel.sort);
+return {
+    url: location.href,
+    cart: window.localStorage.getItem('cart-contents') || '[]',
+    badge: badge ? badge.textContent : '',
+    sort: sort ? sort.value : null,
+    order: Array.from(document.querySelectorAll(sel.name)).map(e => e.textContent),
+};
+"""
+
+# Visibilité, état activé, attributs et position des éléments de chaque
+# produit, en une seule exécution : une ligne (tableau) par produit
+ELEMENT_CHECKS_SCRIPT = """
+const sel = arguments[0];
+const rect = (el) => {
+    if (!el) return null;
+    const r = el.getBoundingClientRect();
+    return [Math.round(r.x), Math.round(r.y), Math.round(r.width), Math.round(r.height)];
+};
+const visible = (el) => {
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    if (r.width <= 0 || r.height <= 0) return false;
+    return el.checkVisibility ? el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true}) : true;
+};
+const enabled = (el) => Boolean(el) && !el.matches(':disabled');
+return Array.from(document.querySelectorAll(sel.item)).map((item) => {
+    const image = item.querySelector(sel.image);
+    const button = item.querySelector(sel.add_button);
+    const name = item.querySelector(sel.name);
+    return [
+        name ? name.innerText.trim() : null,
+        visible(image), image ? image.src : null, rect(image),
+        visible(button), enabled(button), rect(button),
+        visible(name), enabled(name), rect(name),
+    ];
+});
+"""
+
+# Colonnes des lignes retournées par ELEMENT_CHECKS_SCRIPT
+ELEMENT_CHECK_COLUMNS = (
+    "name",
+    "has_visible_image", "image_src", "image_rect",
+    "has_add_button", "button_is_enabled", "button_rect",
+    "name_is_displayed", "name_is_enabled", "name_rect",
+)
+
+# Résultat de verify_product_elements (compatibilité)
+VERIFICATION_KEYS = (
+    "has_visible_image", "has_add_button", "has_clickable_name", "image_has_src", "button_is_enabled"
+)
+
+RESOLVE_ELEMENT_SCRIPT = """
+const [index, selector, itemSelector] = arguments;
+const item = document.querySelectorAll(itemSelector)[index];
+if (!item || !selector) return item || null;
+return item.querySelector(selector);
+"""
+
+
+class Product(dict):
+    """
+    Données d'un produit extraites en bloc
+    Les clés 'element', 'image', 'add_button' et 'name_link' ne sont
+    résolues en WebElement (un aller-retour) qu'au premier accès
+    """
+    
+    def __init__(self, driver, data):
+        super().__init__(data)
+        self._driver = driver
+    
+    def __missing__(self, key):
+        if key not in LAZY_ELEMENT_SELECTORS:
+            raise KeyError(key)
+        element = self._driver.execute_script(
+            RESOLVE_ELEMENT_SCRIPT, self['index'], LAZY_ELEMENT_SELECTORS[key],
+            PRODUCT_SELECTORS['item']
+        )
+        if element is None:
+            raise NoSuchElementException(f"{key} introuvable pour {self.get('name')}")
+        self[key] = element
+        return element
 
 
 class InventoryPage(BasePage):
     """Page du catalogue produits"""
     
-    # Locators
-    INVENTORY_ITEMS = (By.CLASS_NAME, "inventory_item")
-    PRODUCT_NAMES = (By.CLASS_NAME, "inventory_item_name")
-    PRODUCT_PRICES = (By.CLASS_NAME, "inventory_item_price")
-    PRODUCT_IMAGES = (By.CSS_SELECTOR, ".inventory_item_img img")
-    ADD_TO_CART_BUTTONS = (By.CSS_SELECTOR, "button[id^='add-to-cart']")
-    REMOVE_BUTTONS = (By.CSS_SELECTOR, "button[id^='remove']")
-    SHOPPING_CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
-    SHOPPING_CART_LINK = (By.CLASS_NAME, "shopping_cart_link")
-    PRODUCT_SORT_CONTAINER = (By.CLASS_NAME, "product_sort_container")
+    # Locators (les sélecteurs produits servent aussi aux scripts d'extraction)
+    INVENTORY_ITEMS = Locator(By.CLASS_NAME, "inventory_item")
+    PRODUCT_NAMES = Locator(By.CLASS_NAME, "inventory_item_name")
+    PRODUCT_DESCRIPTIONS = Locator(By.CLASS_NAME, "inventory_item_desc")
+    PRODUCT_PRICES = Locator(By.CLASS_NAME, "inventory_item_price")
+    PRODUCT_IMAGES = Locator(By.CSS_SELECTOR, ".inventory_item_img img")
+    PRODUCT_IMAGE_LINKS = Locator(By.CSS_SELECTOR, "a[id$='_img_link']")
+    PRODUCT_TITLE_LINKS = Locator(By.CSS_SELECTOR, "a[id$='_title_link']")
+    ADD_TO_CART_BUTTONS = Locator(By.CSS_SELECTOR, "button[id^='add-to-cart']")
+    REMOVE_BUTTONS = Locator(By.CSS_SELECTOR, "button[id^='remove']", optional=True)
+    SHOPPING_CART_BADGE = Locator(By.CLASS_NAME, "shopping_cart_badge", optional=True)
+    SHOPPING_CART_LINK = Locator(By.CLASS_NAME, "shopping_cart_link")
+    PRODUCT_SORT_CONTAINER = Locator(By.CLASS_NAME, "product_sort_container")
+    
+    # Stratégies de navigation vers le détail, dans l'ordre par défaut.
+    # Leurs résultats sont partagés par toutes les instances de la session.
+    NAVIGATION_STRATEGIES = ("image_link", "name_link", "direct_url")
+    _strategy_stats = {s: {'success': 0, 'failure': 0} for s in NAVIGATION_STRATEGIES}
+    _preferred_strategy = None
+    
+    def __init__(self, driver):
+        super().__init__(driver)
+        # Cache du dernier snapshot produits, indexé par (URL, version du DOM)
+        self._snapshot = None
+        self._snapshot_key = None
+        self._snapshot_token = None
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._product_index = {}
+        self._index_source = None
+        self._element_checks = None
+        self._element_checks_key = None
     
     def is_on_inventory_page(self):
         """Vérifie qu'on est sur la page inventaire"""
         return "/inventory.html" in self.get_current_url()
     
-    def get_all_products(self) -> List[Dict]:
+    def get_all_products(self, refresh: bool = False) -> List[Dict]:
         """
         Récupère tous les produits avec leurs informations
-        Méthode robuste avec attentes explicites
+        Une seule exécution de script pour tous les champs ; les éléments
+        (image, boutons, liens) sont résolus à la demande.
+        Tant que la page n'a pas changé, le snapshot en cache est retourné
+        sans aucun aller-retour navigateur.
         """
-        products = []
+        if not refresh and self._is_snapshot_fresh():
+            self.cache_stats["hits"] += 1
+            return self._snapshot
+        self.cache_stats["misses"] += 1
         
         # Attendre que les produits soient chargés
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located(self.INVENTORY_ITEMS)
-        )
-        time.sleep(0.5)
-        
-        items = self.driver.find_elements(*self.INVENTORY_ITEMS)
+        self.wait_until(EC.presence_of_all_elements_located(self.INVENTORY_ITEMS), timeout=10)
+        self.wait_for_dom_settled()
         
-        for item in items:
-            try:
-                product = {
-                    'name': item.find_element(By.CLASS_NAME, "inventory_item_name").text,
-                    'price': item.find_element(By.CLASS_NAME, "inventory_item_price").text,
-                    'description': item.find_element(By.CLASS_NAME, "inventory_item_desc").text,
-                    'image': item.find_element(By.CSS_SELECTOR, ".inventory_item_img img"),
-                    'add_button': item.find_element(By.CSS_SELECTOR, "button[id^='add-to-cart']"),
-                    'name_link': item.find_element(By.CLASS_NAME, "inventory_item_name"),
-                    'element': item
-                }
-                products.append(product)
-            except Exception as e:
-                print(f"⚠️  Erreur lors de la récupération d'un produit: {e}")
-                continue
-        
-        return products
+        result = self.driver.execute_script(PRODUCTS_SCRIPT, PRODUCT_SELECTORS)
+        self.page_state.url = result['url']
+        self._snapshot = [Product(self.driver, row) for row in result['products']]
+        self._snapshot_key = (self.page_state.url, self.page_state.dom_version)
+        self._snapshot_token = {'url': result['url'], 'dom_version': result['dom_version']}
+        return self._snapshot
+    
+    def invalidate_snapshot(self):
+        """Force une nouvelle extraction à la prochaine requête"""
+        self._snapshot = None
+        self._snapshot_key = None
+    
+    def _is_snapshot_fresh(self) -> bool:
+        """
+        Snapshot valide si aucune action n'a modifié la page depuis l'extraction.
+        Avec Config.SNAPSHOT_VALIDATE, le compteur du MutationObserver est aussi
+        vérifié (un aller-retour léger) pour détecter les changements côté app.
+        """
+        if self._snapshot is None:
+            return False
+        if self._snapshot_key != (self.page_state.url, self.page_state.dom_version):
+            return False
+        if Config.SNAPSHOT_VALIDATE:
+            return self.driver.execute_script(SNAPSHOT_TOKEN_SCRIPT) == self._snapshot_token
+        return True
     
     def get_product_count(self) -> int:
         """Retourne le nombre total de produits"""
@@ -81,170 +254,231 @@ class InventoryPage(BasePage):
                 return True
         return False
     
-    def verify_product_elements(self, product: Dict) -> Dict[str, bool]:
-        """Vérifie tous les éléments d'un produit"""
-        results = {
-            'has_visible_image': False,
-            'has_add_button': False,
-            'has_clickable_name': False,
-            'image_has_src': False,
-            'button_is_enabled': False
-        }
-        
-        try:
-            # Vérifier l'image
-            img = product['image']
-            try:
-                results['has_visible_image'] = img.is_displayed()
-            except:
-                results['has_visible_image'] = False
-            
-            try:
-                src = img.get_attribute('src')
-                results['image_has_src'] = bool(src) and src != ''
-            except:
-                results['image_has_src'] = False
-            
-            # Vérifier le bouton Add to cart
-            try:
-                btn = product['add_button']
-                results['has_add_button'] = btn.is_displayed()
-                results['button_is_enabled'] = btn.is_enabled()
-            except:
-                pass
-            
-            # Vérifier le nom cliquable
-            try:
-                name_link = product['name_link']
-                results['has_clickable_name'] = name_link.is_displayed() and name_link.is_enabled()
-            except:
-                pass
-            
-        except Exception as e:
-            print(f"⚠️  Erreur lors de la vérification du produit {product.get('name', 'Unknown')}: {e}")
+    def get_element_checks(self, refresh: bool = False) -> List[Dict]:
+        """
+        Tableau de vérification de tous les produits en un seul aller-retour :
+        visibilité et état de l'image, du bouton Add to cart et du nom, src de
+        l'image et boîtes englobantes [x, y, largeur, hauteur].
+        Réutilisé tant que la page n'a pas changé (comme le snapshot produits).
+        """
+        key = (self.page_state.url, self.page_state.dom_version)
+        if not refresh and self._element_checks is not None and self._element_checks_key == key:
+            return self._element_checks
         
-        return results
+        self.wait_until(EC.presence_of_all_elements_located(self.INVENTORY_ITEMS), timeout=10)
+        rows = self.driver.execute_script(ELEMENT_CHECKS_SCRIPT, PRODUCT_SELECTORS)
+        checks = []
+        for index, row in enumerate(rows):
+            check = dict(zip(ELEMENT_CHECK_COLUMNS, row), index=index)
+            check['image_has_src'] = bool(check['image_src'])
+            check['has_clickable_name'] = check['name_is_displayed'] and check['name_is_enabled']
+            checks.append(check)
+        self._element_checks = checks
+        self._element_checks_key = (self.page_state.url, self.page_state.dom_version)
+        return checks
     
-    def click_product_by_name(self, product_name: str):
+    def verify_product_elements(self, product: Dict) -> Dict[str, bool]:
         """
-        Clique sur un produit par son nom
-        SauceDemo utilise JavaScript, tous les liens ont href="#"
+        Vérifie tous les éléments d'un produit
+        Lu dans le tableau de get_element_checks : un seul aller-retour pour
+        tous les produits de la page au lieu de ~5 commandes par produit.
+        """
+        checks = self.get_element_checks()
+        index = product.get('index')
+        if index is not None and index < len(checks) and checks[index]['name'] == product.get('name'):
+            check = checks[index]
+        else:
+            check = next((c for c in checks if c['name'] == product.get('name')), None)
+        if check is None:
+            logger.warning("Produit absent du tableau de vérification: %s", product.get('name', 'Unknown'))
+            return {key: False for key in VERIFICATION_KEYS}
+        return {key: check[key] for key in VERIFICATION_KEYS}
+    
+    def check_visual(self):
+        """
+        Régression visuelle de l'inventaire : page entière, carte et image de
+        chaque produit (régions nommées d'après le produit)
+        """
+        self.wait_until(EC.presence_of_all_elements_located(self.INVENTORY_ITEMS), timeout=10)
+        return self.capture_visual("inventory", VISUAL_REGIONS)
+    
+    def get_image_integrity(self) -> List[Dict]:
+        """
+        Tableau d'intégrité des images (une ligne par produit) : chargement
+        réel, réponse HTTP et correspondance au produit (utils/image_integrity.py)
+        """
+        self.wait_until(EC.presence_of_all_elements_located(self.INVENTORY_ITEMS), timeout=10)
+        return build_integrity_table(self.read_image_states(PRODUCT_SELECTORS), page="inventory")
+    
+    def get_product_index(self) -> Dict[str, Dict]:
+        """
+        Index nom → identifiants de navigation, construit une fois par
+        chargement de l'inventaire (à partir du snapshot en cache)
         """
-        print(f"\n🔍 Recherche du produit: '{product_name}'")
-        
-        # Attendre le chargement
-        time.sleep(1)
-        
-        # Trouver tous les produits
         products = self.get_all_products()
+        if self._index_source is not products:
+            self._product_index = {
+                p['name']: {
+                    'item_id': p['item_id'],
+                    'detail_url': urljoin(Config.BASE_URL, f"inventory-item.html?id={p['item_id']}")
+                                  if p['item_id'] is not None else None,
+                    'image_link_id': p['image_link_id'],
+                    'name_link_id': p['name_link_id'],
+                }
+                for p in products
+            }
+            self._index_source = products
+        return self._product_index
+    
+    def click_product_by_name(self, product_name: str):
+        """
+        Ouvre la page de détails d'un produit par son nom
+        SauceDemo utilise JavaScript, tous les liens ont href="#" : on clique
+        en JS sur le lien image ou titre, ou on navigue directement vers l'URL.
+        Les stratégies qui ont réussi pendant la session sont essayées en
+        premier, celles qui échouent systématiquement sont ignorées.
+        """
+        entry = self.get_product_index().get(product_name)
+        if entry is None:
+            raise Exception(f"❌ Produit non trouvé: {product_name}")
+        logger.debug("Navigation vers: '%s' (item %s)", product_name, entry['item_id'])
         
-        for product in products:
-            if product['name'] == product_name:
-                print(f"✓ Produit trouvé: {product_name}")
-                
-                # Trouver l'élément du produit
-                item_element = product['element']
-                
-                # STRATÉGIE 1: Cliquer sur le lien de l'image avec JavaScript
-                try:
-                    image_link = item_element.find_element(By.CSS_SELECTOR, "a[id*='img']")
-                    print(f"  - Lien image trouvé: {image_link.get_attribute('id')}")
-                    
-                    # Scroll
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", image_link)
-                    time.sleep(0.5)
-                    
-                    # Forcer le clic avec JavaScript
-                    self.driver.execute_script("arguments[0].click();", image_link)
-                    time.sleep(2)  # Attendre plus longtemps
-                    
-                    print(f"✓ URL après clic JS: {self.driver.current_url}")
-                    
-                    if "inventory-item.html" in self.driver.current_url or "?id=" in self.driver.current_url:
-                        print(f"✅ Navigation réussie!")
-                        return
-                        
-                except Exception as e1:
-                    print(f"⚠️  Stratégie 1 échouée: {e1}")
-                
-                # STRATÉGIE 2: Cliquer sur le nom du produit avec JavaScript
-                try:
-                    name_link = product['name_link']
-                    
-                    # Trouver le lien parent <a>
-                    parent_a = name_link.find_element(By.XPATH, "./parent::a")
-                    print(f"  - Lien nom trouvé: {parent_a.get_attribute('id')}")
-                    
-                    # Scroll
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", parent_a)
-                    time.sleep(0.5)
-                    
-                    # Clic JavaScript
-                    self.driver.execute_script("arguments[0].click();", parent_a)
-                    time.sleep(2)
-                    
-                    print(f"✓ URL après clic nom: {self.driver.current_url}")
-                    
-                    if "inventory-item.html" in self.driver.current_url or "?id=" in self.driver.current_url:
-                        print(f"✅ Navigation réussie (via nom)!")
-                        return
-                        
-                except Exception as e2:
-                    print(f"⚠️  Stratégie 2 échouée: {e2}")
-                
-                # STRATÉGIE 3: Navigation directe via URL
-                try:
-                    # Extraire l'ID du produit depuis l'attribut data ou construire l'URL
-                    print(f"  - Tentative navigation directe...")
-                    
-                    # Trouver l'ID dans l'un des liens
-                    all_links = item_element.find_elements(By.TAG_NAME, "a")
-                    for link in all_links:
-                        link_id = link.get_attribute('id')
-                        if 'title_link' in link_id or 'img' in link_id:
-                            # Extraire le numéro d'item (ex: item_4_title_link → 4)
-                            import re
-                            match = re.search(r'item_(\d+)_', link_id)
-                            if match:
-                                item_id = match.group(1)
-                                detail_url = f"https://www.saucedemo.com/inventory-item.html?id={item_id}"
-                                print(f"  - Navigation directe vers: {detail_url}")
-                                self.driver.get(detail_url)
-                                time.sleep(2)
-                                print(f"✅ Navigation directe réussie!")
-                                return
-                                
-                except Exception as e3:
-                    print(f"⚠️  Stratégie 3 échouée: {e3}")
+        for strategy in self._navigation_order():
+            try:
+                url = self._navigate_with(strategy, entry)
+            except Exception as e:
+                self._record_strategy(strategy, success=False)
+                logger.warning("Stratégie %s échouée: %s", strategy, e)
+                continue
+            if url:
+                self._record_strategy(strategy, success=True)
+                logger.debug("Navigation réussie (%s): %s", strategy, url)
+                return
         
         # Si rien n'a fonctionné
         raise Exception(f"❌ Impossible de naviguer vers: {product_name}")
     
+    def _navigate_with(self, strategy: str, entry: Dict):
+        """Applique une stratégie ; retourne l'URL atteinte, ou None si inapplicable"""
+        if strategy == "direct_url":
+            if not entry['detail_url']:
+                return None
+            self.navigate_to(entry['detail_url'])
+            return entry['detail_url']
+        
+        link_id = entry['image_link_id'] if strategy == "image_link" else entry['name_link_id']
+        if not link_id:
+            return None
+        return self.wait_for_navigation(
+            lambda: self.driver.execute_script("document.getElementById(arguments[0]).click();", link_id),
+            url_fragment="inventory-item.html",
+            timeout=Config.NAVIGATION_TIMEOUT
+        )
+    
+    @classmethod
+    def _navigation_order(cls) -> List[str]:
+        """Stratégies triées : dernière réussie d'abord, échecs répétés exclus"""
+        stats = cls._strategy_stats
+        usable = [
+            s for s in cls.NAVIGATION_STRATEGIES
+            if stats[s]['success'] > 0 or stats[s]['failure'] < Config.NAVIGATION_MAX_FAILURES
+        ]
+        preferred = cls._preferred_strategy
+        if preferred in usable:
+            usable.remove(preferred)
+            usable.insert(0, preferred)
+        return usable or list(cls.NAVIGATION_STRATEGIES)
+    
+    @classmethod
+    def _record_strategy(cls, strategy: str, success: bool):
+        cls._strategy_stats[strategy]['success' if success else 'failure'] += 1
+        if success:
+            cls._preferred_strategy = strategy
+    
     def add_product_to_cart_by_name(self, product_name: str):
-        """Ajoute un produit au panier par son nom"""
+        """
+        Ajoute un produit au panier par son nom
+        Clic relancé brièvement si le bouton est re-rendu ou masqué (voir BasePage.perform)
+        """
         products = self.get_all_products()
         for product in products:
             if product['name'] == product_name:
-                try:
-                    btn = product['add_button']
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                    time.sleep(0.3)
-                    btn.click()
-                    return
-                except:
-                    self.driver.execute_script("arguments[0].click();", btn)
-                    return
+                if not product['add_button_id']:
+                    raise NoSuchElementException(f"Bouton Add to cart absent: {product_name}")
+                self.click_element(By.ID, product['add_button_id'])
+                return
         
         raise Exception(f"❌ Produit non trouvé: {product_name}")
     
     def get_cart_item_count(self) -> int:
         """Récupère le nombre d'articles dans le panier"""
+        def read_badge():
+            badges = self.driver.find_elements(*self.SHOPPING_CART_BADGE)
+            return int(badges[0].text) if badges else 0
+        
+        return self.perform(read_badge, locator=self.SHOPPING_CART_BADGE)
+    
+    def get_mutable_state(self) -> Dict:
+        """
+        Panier, tri et ordre des produits en un seul aller-retour
+        (sert à détecter qu'un test « lecture seule » a modifié la session)
+        """
+        self.wait_until(EC.presence_of_all_elements_located(self.INVENTORY_ITEMS), timeout=10)
+        return self.driver.execute_script(MUTABLE_STATE_SCRIPT, PRODUCT_SELECTORS)
+    
+    def sort_by(self, value: str):
+        """Sélectionne un tri (az, za, lohi, hilo) ; le snapshot produits est invalidé"""
+        def select():
+            Select(self.find_element(*self.PRODUCT_SORT_CONTAINER)).select_by_value(value)
+        
         try:
-            badge_text = self.get_text(*self.SHOPPING_CART_BADGE)
-            return int(badge_text)
-        except:
-            return 0
+            self.perform(select, locator=self.PRODUCT_SORT_CONTAINER)
+        finally:
+            self.mark_dom_changed()
+    
+    def get_sort_value(self) -> str:
+        """Tri actuellement sélectionné"""
+        return self.find_element(*self.PRODUCT_SORT_CONTAINER).get_attribute('value')
+    
+    def get_product_names(self) -> List[str]:
+        """Noms des produits dans l'ordre affiché"""
+        return [p['name'] for p in self.get_all_products()]
+    
+    def get_product_prices(self) -> List[float]:
+        """Prix des produits dans l'ordre affiché"""
+        return [float(p['price'].lstrip('$')) for p in self.get_all_products()]
     
     def open_shopping_cart(self):
         """Ouvre le panier"""
-        self.click_element(*self.SHOPPING_CART_LINK)
\ No newline at end of file
+        self.click_element(*self.SHOPPING_CART_LINK)
+
+
+# Sélecteurs CSS transmis aux scripts (un seul endroit : les locators de la page)
+PRODUCT_SELECTORS = {
+    'item': InventoryPage.INVENTORY_ITEMS.css,
+    'name': InventoryPage.PRODUCT_NAMES.css,
+    'description': InventoryPage.PRODUCT_DESCRIPTIONS.css,
+    'price': InventoryPage.PRODUCT_PRICES.css,
+    'image': InventoryPage.PRODUCT_IMAGES.css,
+    'image_link': InventoryPage.PRODUCT_IMAGE_LINKS.css,
+    'title_link': InventoryPage.PRODUCT_TITLE_LINKS.css,
+    'add_button': InventoryPage.ADD_TO_CART_BUTTONS.css,
+    'remove_button': InventoryPage.REMOVE_BUTTONS.css,
+    'badge': InventoryPage.SHOPPING_CART_BADGE.css,
+    'sort': InventoryPage.PRODUCT_SORT_CONTAINER.css,
+}
+
+# Sélecteurs des éléments résolus à la demande, relatifs au n-ième produit
+LAZY_ELEMENT_SELECTORS = {
+    'element': None,
+    'image': PRODUCT_SELECTORS['image'],
+    'add_button': PRODUCT_SELECTORS['add_button'],
+    'name_link': PRODUCT_SELECTORS['name'],
+}
+
+# Régions de la régression visuelle : (nom, sélecteur, libellé de chaque élément)
+VISUAL_REGIONS = [
+    ('page', 'body', None),
+    ('item', PRODUCT_SELECTORS['item'], PRODUCT_SELECTORS['name']),
+    ('image', PRODUCT_SELECTORS['image'], '@alt'),
+]
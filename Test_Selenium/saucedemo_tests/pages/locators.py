@@ -0,0 +1,238 @@
+"""
+Registre central des locators des Page Objects
+
+Chaque page déclare ses locators avec Locator(by, value) : ils restent des
+tuples (by, value) utilisables tels quels par Selenium, mais sont aussi
+enregistrés sous « Page.NOM » dans le registre. Le registre compile chaque
+locator en sélecteur CSS (ou XPath) pour :
+    * résoudre plusieurs locators en une seule exécution de script,
+    * valider tous les locators d'une page d'un coup (page ouverte ou
+      snapshot HTML) et échouer immédiatement sur un sélecteur périmé,
+    * mesurer l'utilisation et la latence de chaque locator.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.webdriver.common.by import By
+from utils.artifacts import SessionReport
+from utils.stats import summarize
+
+
+class StaleLocatorError(AssertionError):
+    """Un ou plusieurs locators déclarés ne correspondent plus à la page"""
+
+
+def _css_string(value: str) -> str:
+    return json.dumps(value)
+
+
+# Conversion vers un sélecteur évaluable côté navigateur : (type, expression)
+_COMPILERS = {
+    By.ID: lambda v: ("css", f"[id={_css_string(v)}]"),
+    By.NAME: lambda v: ("css", f"[name={_css_string(v)}]"),
+    By.CLASS_NAME: lambda v: ("css", f".{v}"),
+    By.CSS_SELECTOR: lambda v: ("css", v),
+    By.TAG_NAME: lambda v: ("css", v),
+    By.XPATH: lambda v: ("xpath", v),
+}
+
+# Éléments correspondant à chaque locator, relatifs à une racine
+# (document courant, ou snapshot HTML analysé par DOMParser)
+QUERY_SCRIPT_PRELUDE = """
+const query = (root, kind, expr) => {
+    if (kind === 'xpath') {
+        const doc = root.ownerDocument || root;
+        const found = doc.evaluate(expr, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+    }
+    return Array.from(root.querySelectorAll(expr));
+};
+"""
+
+RESOLVE_SCRIPT = QUERY_SCRIPT_PRELUDE + """
+const [specs, mode] = arguments;
+const result = {};
+for (const [key, kind, expr] of specs) {
+    const elements = query(document, kind, expr);
+    result[key] = mode === 'text' ? elements.map(e => e.innerText.trim()) : elements;
+}
+return result;
+"""
+
+VALIDATE_SCRIPT = QUERY_SCRIPT_PRELUDE + """
+const [specs, html] = arguments;
+const root = html === null ? document : new DOMParser().parseFromString(html, 'text/html');
+const result = {};
+for (const [key, kind, expr] of specs) {
+    try {
+        result[key] = {count: query(root, kind, expr).length, error: null};
+    } catch (e) {
+        result[key] = {count: 0, error: String(e.message || e)};
+    }
+}
+return result;
+"""
+
+
+class Locator(tuple):
+    """
+    Locator (by, value) déclaré comme attribut d'une page
+    optional=True : élément qui n'existe que dans certains états (message
+    d'erreur, badge du panier, bouton Remove) ; seule sa syntaxe est validée
+    """
+
+    def __new__(cls, by, value, optional=False):
+        return super().__new__(cls, (by, value))
+
+    def __init__(self, by, value, optional=False):
+        self.optional = optional
+        self.page = None
+        self.name = None
+        self.kind, self.expression = _COMPILERS[by](value)
+
+    def __set_name__(self, owner, name):
+        self.page = owner.__name__
+        self.name = name
+        registry.register(self)
+
+    @property
+    def by(self):
+        return self[0]
+
+    @property
+    def value(self):
+        return self[1]
+
+    @property
+    def key(self) -> str:
+        return f"{self.page}.{self.name}"
+
+    @property
+    def css(self) -> str:
+        """Sélecteur CSS équivalent (pour les scripts qui interrogent le DOM)"""
+        if self.kind != "css":
+            raise ValueError(f"{self.key} n'a pas d'équivalent CSS: {self.value}")
+        return self.expression
+
+    def spec(self) -> list:
+        return [self.key, self.kind, self.expression]
+
+
+class LocatorRegistry(SessionReport):
+    """Locators de toutes les pages, avec profil d'utilisation par locator"""
+    
+    REPORT_NAME = "locator_profile"
+
+    def __init__(self):
+        self.locators = {}
+        self._by_value = {}
+        self._timings = defaultdict(list)
+        self._failures = defaultdict(int)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def register(self, locator: Locator):
+        self.locators[locator.key] = locator
+        self._by_value[(locator.page, locator.by, locator.value)] = locator
+
+    def for_page(self, page) -> list:
+        """Locators déclarés par une page (nom de classe ou classe)"""
+        page = page if isinstance(page, str) else page.__name__
+        return [locator for locator in self.locators.values() if locator.page == page]
+
+    def key_for(self, page, by, value) -> str:
+        """Nom « Page.NOM » d'un (by, value), ou « by=value » s'il n'est pas déclaré"""
+        locator = self._by_value.get((page, by, value))
+        return locator.key if locator else f"{by}={value}"
+
+    # ----- Résolution groupée -----
+
+    def resolve(self, driver, locators, mode="elements") -> dict:
+        """
+        Résout plusieurs locators en une seule exécution de script
+
+        Returns:
+            {Page.NOM: [WebElement, ...]} (ou textes si mode="text")
+        """
+        locators = list(locators)
+        with self.track_many(locators):
+            return driver.execute_script(RESOLVE_SCRIPT, [l.spec() for l in locators], mode)
+
+    def validate(self, driver, page, html=None) -> dict:
+        """
+        Vérifie tous les locators d'une page en un seul aller-retour, sur la
+        page ouverte ou sur un snapshot HTML (analysé dans le navigateur)
+
+        Returns:
+            {Page.NOM: message} pour chaque locator invalide ou introuvable
+        """
+        locators = self.for_page(page)
+        if not locators:
+            return {}
+        found = driver.execute_script(VALIDATE_SCRIPT, [l.spec() for l in locators], html)
+        problems = {}
+        for locator in locators:
+            entry = found[locator.key]
+            if entry["error"]:
+                problems[locator.key] = f"sélecteur invalide ({entry['error']}): {locator.value}"
+            elif not entry["count"] and not locator.optional:
+                problems[locator.key] = f"aucun élément: {locator.by}={locator.value}"
+        return problems
+
+    # ----- Profil d'utilisation -----
+
+    @contextmanager
+    def track(self, page, by, value):
+        """Mesure une requête par locator (les requêtes imbriquées lui sont attribuées)"""
+        with self._tracking([self.key_for(page, by, value)]):
+            yield
+
+    @contextmanager
+    def track_many(self, locators):
+        with self._tracking([locator.key for locator in locators]):
+            yield
+
+    @contextmanager
+    def _tracking(self, keys):
+        if getattr(self._local, "active", False):
+            yield
+            return
+        self._local.active = True
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._local.active = False
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                for key in keys:
+                    self._timings[key].append(elapsed)
+                    self._failures[key] += failed
+
+    def profile(self) -> dict:
+        """Utilisations, latence (p50/p95) et échecs par locator ; locators jamais utilisés"""
+        with self._lock:
+            used = {
+                key: dict(summarize(timings), failures=self._failures[key],
+                          total=round(sum(timings), 4))
+                for key, timings in sorted(self._timings.items(), key=lambda kv: -sum(kv[1]))
+            }
+        return {
+            "locators": used,
+            "unused": sorted(key for key in self.locators if key not in used),
+        }
+
+    def report_data(self):
+        """locator_profile.json (rien si aucun locator n'a servi)"""
+        return self.profile() if self._timings else None
+
+
+registry = LocatorRegistry()
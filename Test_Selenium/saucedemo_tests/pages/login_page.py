@@ -5,11 +5,14 @@
 # Page Object pour la page de connexion
 # """
 
+from urllib.parse import urljoin
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
 from pages.base_page import BasePage
+from pages.locators import Locator
+from utils.step_timing import recorder
 from config.config import Config
 
 
@@ -17,15 +20,19 @@ class LoginPage(BasePage):
     """Page de connexion SauceDemo"""
     
     # Locators
-    USERNAME_INPUT = (By.ID, "user-name")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.ID, "login-button")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
-    ERROR_CLOSE_BUTTON = (By.CLASS_NAME, "error-button")
+    USERNAME_INPUT = Locator(By.ID, "user-name")
+    PASSWORD_INPUT = Locator(By.ID, "password")
+    LOGIN_BUTTON = Locator(By.ID, "login-button")
+    ERROR_MESSAGE = Locator(By.CSS_SELECTOR, "[data-test='error']", optional=True)
+    ERROR_CLOSE_BUTTON = Locator(By.CLASS_NAME, "error-button", optional=True)
+    
+    # Attributs de cookie réinjectables (domaine et expiration sont recalculés)
+    COOKIE_KEYS = ("name", "value", "path", "secure", "httpOnly", "sameSite")
     
     def __init__(self, driver):
         super().__init__(driver)
         self.url = Config.BASE_URL
+        self.inventory_url = urljoin(Config.BASE_URL, "inventory.html")
     
     def navigate(self):
         """Navigate vers la page de login"""
@@ -46,6 +53,7 @@ class LoginPage(BasePage):
     def login(self, username, password=None):
         """Effectuer une connexion complète"""
         password = password or Config.PASSWORD
+        recorder.set_context(username=username)
         self.enter_username(username)
         self.enter_password(password)
         self.click_login_button()
@@ -54,7 +62,7 @@ class LoginPage(BasePage):
         """Récupère le message d'erreur"""
         try:
             return self.get_text(*self.ERROR_MESSAGE)
-        except:
+        except TimeoutException:
             return None
     
     def is_error_displayed(self):
@@ -62,11 +70,18 @@ class LoginPage(BasePage):
         return self.is_element_visible(*self.ERROR_MESSAGE, timeout=5)  # Augmenté de 3 à 5
     
     def is_login_successful(self, timeout=5):
-        """Vérifie si la connexion a réussi"""
+        """
+        Vérifie si la connexion a réussi
+        La transition login → inventaire est alors mesurée (métriques navigateur)
+        """
+        if not self._wait_for_inventory(timeout):
+            return False
+        self.capture_web_perf("LoginPage.login")
+        return True
+    
+    def _wait_for_inventory(self, timeout) -> bool:
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.url_contains("/inventory.html")
-            )
+            self.wait_for_url_contains("/inventory.html", timeout)
             return True
         except TimeoutException:
             return False
@@ -75,4 +90,31 @@ class LoginPage(BasePage):
         """Ferme le message d'erreur"""
         if self.is_error_displayed():
             self.click_element(*self.ERROR_CLOSE_BUTTON)
+    
+    def get_session_state(self) -> dict:
+        """Capture l'état d'authentification (cookies + localStorage) après connexion"""
+        return {
+            "cookies": self.driver.get_cookies(),
+            "local_storage": self.driver.execute_script(
+                "return Object.assign({}, window.localStorage);"
+            ),
+        }
+    
+    def restore_session(self, state: dict, timeout=5) -> bool:
+        """
+        Réinjecte un état capturé et ouvre directement /inventory.html
+        sans passer par le formulaire de connexion
+        """
+        if not self.get_current_url().startswith(self.url):
+            self.navigate_to(self.url)  # Les cookies ne se posent que sur le bon domaine
+        
+        for cookie in state["cookies"]:
+            self.driver.add_cookie({k: cookie[k] for k in self.COOKIE_KEYS if k in cookie})
+        self.driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) window.localStorage.setItem(k, v);",
+            state["local_storage"]
+        )
+        
+        self.navigate_to(self.inventory_url)  # Métriques collectées par navigate_to
+        return self._wait_for_inventory(timeout)
 
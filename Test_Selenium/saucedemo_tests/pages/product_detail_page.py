@@ -2,24 +2,29 @@
 Page Object pour la page de détails d'un produit
 """
 
+import logging
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
 from pages.base_page import BasePage
-import time
+from pages.locators import Locator
+from utils.image_integrity import build_integrity_table
+
+logger = logging.getLogger(__name__)
 
 
 class ProductDetailPage(BasePage):
     """Page de détails d'un produit"""
     
     # Locators
-    PRODUCT_NAME = (By.CLASS_NAME, "inventory_details_name")
-    PRODUCT_DESCRIPTION = (By.CLASS_NAME, "inventory_details_desc")
-    PRODUCT_PRICE = (By.CLASS_NAME, "inventory_details_price")
-    PRODUCT_IMAGE = (By.CSS_SELECTOR, ".inventory_details_img")
-    BACK_BUTTON = (By.ID, "back-to-products")
-    ADD_TO_CART_BUTTON = (By.CSS_SELECTOR, "button[id^='add-to-cart']")
-    REMOVE_BUTTON = (By.CSS_SELECTOR, "button[id^='remove']")
+    PRODUCT_NAME = Locator(By.CLASS_NAME, "inventory_details_name")
+    PRODUCT_DESCRIPTION = Locator(By.CLASS_NAME, "inventory_details_desc")
+    PRODUCT_PRICE = Locator(By.CLASS_NAME, "inventory_details_price")
+    PRODUCT_IMAGE = Locator(By.CSS_SELECTOR, ".inventory_details_img")
+    BACK_BUTTON = Locator(By.ID, "back-to-products")
+    ADD_TO_CART_BUTTON = Locator(By.CSS_SELECTOR, "button[id^='add-to-cart']", optional=True)
+    REMOVE_BUTTON = Locator(By.CSS_SELECTOR, "button[id^='remove']", optional=True)
     
     def is_on_detail_page(self):
         """
@@ -28,19 +33,17 @@ class ProductDetailPage(BasePage):
         """
         try:
             # Attendre que l'URL contienne "inventory-item"
-            WebDriverWait(self.driver, 10).until(
-                lambda d: "inventory-item.html" in d.current_url or "?id=" in d.current_url
+            self.wait_until(
+                lambda d: "inventory-item.html" in d.current_url or "?id=" in d.current_url,
+                timeout=10
             )
             
             # Attendre que le nom du produit soit visible
-            WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_element_located(self.PRODUCT_NAME)
-            )
+            self.wait_until(EC.visibility_of_element_located(self.PRODUCT_NAME), timeout=10)
             
             return True
         except Exception as e:
-            print(f"❌ Pas sur la page de détails: {e}")
-            print(f"   URL actuelle: {self.driver.current_url}")
+            logger.warning("Pas sur la page de détails (%s): %s", self.driver.current_url, e)
             return False
     
     def get_product_name(self) -> str:
@@ -55,58 +58,41 @@ class ProductDetailPage(BasePage):
         """Récupère le prix du produit"""
         return self.get_text(*self.PRODUCT_PRICE)
     
+    def get_product_info(self) -> dict:
+        """Nom, description et prix en un seul aller-retour (page déjà chargée)"""
+        texts = self.read_texts(self.PRODUCT_NAME, self.PRODUCT_DESCRIPTION, self.PRODUCT_PRICE)
+        return {
+            'name': texts['PRODUCT_NAME'],
+            'description': texts['PRODUCT_DESCRIPTION'],
+            'price': texts['PRODUCT_PRICE'],
+        }
+    
+    def get_image_integrity(self) -> dict:
+        """Intégrité de l'image du produit affiché (voir utils/image_integrity.py)"""
+        self.wait_until(EC.presence_of_element_located(self.PRODUCT_IMAGE), timeout=10)
+        states = self.read_image_states({
+            'item': None, 'name': self.PRODUCT_NAME.css, 'image': self.PRODUCT_IMAGE.css,
+        })
+        return build_integrity_table(states, page="detail")[0]
+    
     def is_product_image_visible(self) -> bool:
         """
         Vérifie si l'image du produit est visible
-        Version avec debug détaillé
+        (en cas d'échec du test, le DOM complet est archivé avec les artefacts)
         """
-        print("\n🔍 Vérification de l'image du produit...")
-        
         try:
             # Attendre que l'image soit dans le DOM
-            img = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(self.PRODUCT_IMAGE)
-            )
-            print(f"✓ Image trouvée dans le DOM")
-            
-            # Vérifier les propriétés de l'image
-            src = img.get_attribute('src')
-            print(f"  - src: {src}")
-            
-            is_displayed = img.is_displayed()
-            print(f"  - is_displayed: {is_displayed}")
-            
-            width = img.size['width']
-            height = img.size['height']
-            print(f"  - Dimensions: {width}x{height}")
-            
-            # Attendre que l'image soit visible
-            try:
-                WebDriverWait(self.driver, 20).until(
-                    EC.visibility_of_element_located(self.PRODUCT_IMAGE)
-                )
-                print(f"✓ Image est visible")
-                return True
-            except Exception as e:
-                print(f"❌ Image pas visible après attente: {e}")
-                
-                # Essayer de forcer un wait plus long
-                time.sleep(2)
-                is_visible_now = img.is_displayed()
-                print(f"  - Visible après 2s de plus: {is_visible_now}")
-                return is_visible_now
-                
-        except Exception as e:
-            print(f"❌ Erreur lors de la recherche de l'image: {e}")
-            
-            # Afficher le HTML de la page pour debug
-            try:
-                detail_container = self.driver.find_element(By.CLASS_NAME, "inventory_details_container")
-                print(f"\n📄 HTML du conteneur:")
-                print(detail_container.get_attribute('innerHTML')[:500])
-            except:
-                pass
-            
+            img = self.wait_until(EC.presence_of_element_located(self.PRODUCT_IMAGE), timeout=10)
+        except WebDriverException as e:
+            logger.warning("Image du produit absente du DOM (%s): %s", self.driver.current_url, e)
+            return False
+        
+        # Attendre que l'image soit visible
+        try:
+            self.wait_until(EC.visibility_of_element_located(self.PRODUCT_IMAGE), timeout=20)
+            return True
+        except WebDriverException as e:
+            logger.warning("Image du produit non visible (src=%s): %s", img.get_attribute('src'), e)
             return False
     
     def get_product_image_src(self) -> str:
@@ -116,48 +102,34 @@ class ProductDetailPage(BasePage):
     def click_back_button(self):
         """Clique sur le bouton retour avec JavaScript"""
         try:
-            back_btn = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(self.BACK_BUTTON)
-            )
-            
-            # Scroll
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", back_btn)
-            time.sleep(0.3)
+            back_btn = self.wait_until(EC.presence_of_element_located(self.BACK_BUTTON), timeout=10)
             
-            # Cliquer avec JavaScript
-            self.driver.execute_script("arguments[0].click();", back_btn)
-            time.sleep(1.5)
+            # Cliquer avec JavaScript et attendre le retour à l'inventaire
+            self.wait_for_navigation(
+                lambda: self.driver.execute_script("arguments[0].click();", back_btn),
+                url_fragment="/inventory.html"
+            )
             
         except Exception as e:
-            print(f"❌ Erreur click_back_button: {e}")
+            logger.error("Erreur click_back_button: %s", e)
             raise
     
     def back_to_products(self):
         """Retourne à la liste des produits"""
-        print("\n🔙 Retour vers la liste des produits...")
         
         try:
-            back_btn = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.BACK_BUTTON)
-            )
-            
-            # Scroll vers le bouton
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", back_btn)
-            time.sleep(0.3)
-            
-            # Cliquer avec JavaScript
-            self.driver.execute_script("arguments[0].click();", back_btn)
-            time.sleep(1.5)
+            back_btn = self.wait_until(EC.element_to_be_clickable(self.BACK_BUTTON), timeout=10)
             
-            print(f"✓ URL après retour: {self.driver.current_url}")
+            # Cliquer avec JavaScript et attendre le retour à l'inventaire
+            url = self.wait_for_navigation(
+                lambda: self.driver.execute_script("arguments[0].click();", back_btn),
+                url_fragment="/inventory.html"
+            )
             
-            if "/inventory.html" in self.driver.current_url:
-                print("✅ Retour réussi")
-            else:
-                print(f"⚠️ URL: {self.driver.current_url}")
+            logger.debug("Retour réussi: %s", url)
                 
         except Exception as e:
-            print(f"❌ Erreur back_to_products: {e}")
+            logger.error("Erreur back_to_products: %s", e)
             raise
     
     def add_to_cart(self):
@@ -168,6 +140,9 @@ class ProductDetailPage(BasePage):
         """Retire le produit du panier"""
         self.click_element(*self.REMOVE_BUTTON)
     
-    def is_added_to_cart(self) -> bool:
-        """Vérifie si le produit est dans le panier"""
-        return self.is_element_present(*self.REMOVE_BUTTON)
\ No newline at end of file
+    def is_added_to_cart(self, timeout=0) -> bool:
+        """
+        Vérifie si le produit est dans le panier
+        Immédiat par défaut ; timeout > 0 pour attendre le bouton Remove après un ajout
+        """
+        return self.is_element_present(*self.REMOVE_BUTTON, timeout=timeout)
\ No newline at end of file
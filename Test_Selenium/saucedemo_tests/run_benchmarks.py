@@ -0,0 +1,91 @@
+"""
+Benchmark des parcours SauceDemo (login, extraction inventaire,
+navigation vers le détail, retour)
+
+Usage:
+    python run_benchmarks.py [-i 5] [-w 1] [--users standard_user,problem_user]
+                             [--threshold 0.2] [--save-baseline]
+
+Les résultats sont écrits dans reports/benchmark.json et comparés à
+Config.BENCHMARK_BASELINE ; le code retour est 1 en cas de régression ou
+si un parcours mesuré n'a pas d'entrée dans la baseline, 2 si la baseline
+est absente (l'enregistrer avec --save-baseline).
+"""
+
+import argparse
+import os
+import sys
+
+from config.config import Config
+from utils.benchmark import (
+    compare_to_baseline, load_json, missing_from_baseline, run_benchmark, save_json, summarize_samples
+)
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des parcours SauceDemo")
+    parser.add_argument("-i", "--iterations", type=int, default=Config.BENCHMARK_ITERATIONS)
+    parser.add_argument("-w", "--warmup", type=int, default=Config.BENCHMARK_WARMUP)
+    parser.add_argument("--users", default=",".join(Config.USERS),
+                        help="Utilisateurs séparés par des virgules")
+    parser.add_argument("--threshold", type=float, default=Config.BENCHMARK_THRESHOLD,
+                        help="Hausse relative tolérée (0.2 = +20%%)")
+    parser.add_argument("--baseline", default=Config.BENCHMARK_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Enregistre ces résultats comme nouvelle baseline")
+    args = parser.parse_args(argv)
+    if not args.save_baseline and not os.path.isfile(args.baseline):
+        parser.error(f"baseline introuvable: {args.baseline} - l'enregistrer d'abord avec --save-baseline")
+    
+    users = [u.strip() for u in args.users.split(",") if u.strip()]
+    
+    local_server = None
+    if Config.USE_LOCAL_SERVER:
+        from local_server import LocalSauceDemo
+        local_server = LocalSauceDemo()
+        Config.BASE_URL = local_server.start()
+    
+    pool = DriverPool(create_driver)
+    try:
+        samples, failures = run_benchmark(pool, users, args.iterations, args.warmup)
+    finally:
+        pool.close()
+        if local_server is not None:
+            local_server.stop()
+    
+    summary = summarize_samples(samples)
+    save_json(os.path.join(Config.REPORTS_DIR, "benchmark.json"),
+              {"summary": summary, "failures": failures})
+    
+    for journey, by_user in summary.items():
+        for username, stats in by_user.items():
+            print(f"  {journey:<20} {username:<25} médiane {stats['median']:.3f}s  "
+                  f"p95 {stats['p95']:.3f}s  ({stats['outliers']} aberrantes écartées)")
+    for failure in failures:
+        print(f"❌ {failure['journey']} / {failure['username']}: {failure['error']}")
+    
+    if args.save_baseline:
+        save_json(args.baseline, summary)
+        print(f"✓ Baseline enregistrée: {args.baseline}")
+        return 0
+    
+    baseline = load_json(args.baseline)
+    regressions = compare_to_baseline(summary, baseline, args.threshold)
+    for r in regressions:
+        print(f"❌ Régression {r['journey']} / {r['username']} ({r['metric']}): "
+              f"{r['baseline']:.3f}s → {r['current']:.3f}s")
+    missing = missing_from_baseline(summary, baseline)
+    for m in missing:
+        print(f"⚠️ Pas de baseline pour {m['journey']} / {m['username']} - non comparé")
+    if missing:
+        print(f"⚠️ Baseline incomplète ({args.baseline}) : la réenregistrer avec --save-baseline")
+    if regressions or failures or missing:
+        return 1
+    print("✅ Aucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Exécution parallèle de la suite Selenium
+
+Usage:
+    python run_parallel.py -n 4 [--worker-args "-v --tb=short"] [sélection pytest...]
+
+Les tests sont collectés une fois, répartis en lots équilibrés d'après les
+durées de l'historique (Config.HISTORY_FILE), puis chaque lot est exécuté
+dans un processus pytest séparé avec son propre navigateur et son propre
+profil Chrome. Les arguments de sélection (chemins, -k, -m) ne servent qu'à
+la collecte : chaque worker reçoit uniquement ses identifiants de tests.
+"""
+
+import argparse
+import os
+import shlex
+import subprocess
+import sys
+
+from config.config import Config
+from utils.sharding import plan_shards
+from utils.test_history import TestHistory
+
+
+def collect_nodeids(pytest_args):
+    """Collecte les identifiants des tests sans les exécuter"""
+    output = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        cwd=Config.ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return [line.strip() for line in output.splitlines() if "::" in line]
+
+
+def run_shards(shards, worker_args):
+    """Lance un processus pytest par lot et attend la fin de tous"""
+    os.makedirs(Config.REPORTS_DIR, exist_ok=True)
+    processes = []
+    
+    for worker_id, shard in enumerate(shards):
+        env = dict(os.environ, SAUCEDEMO_WORKER_ID=f"gw{worker_id}", SAUCEDEMO_RUN_ID=Config.RUN_ID)
+        log_path = os.path.join(Config.REPORTS_DIR, f"worker-gw{worker_id}.log")
+        log_file = open(log_path, "w", encoding="utf-8")
+        process = subprocess.Popen(
+            [sys.executable, "-m", "pytest", *worker_args, *shard],
+            cwd=Config.ROOT_DIR, env=env, stdout=log_file, stderr=subprocess.STDOUT
+        )
+        processes.append((worker_id, process, log_file, log_path))
+        print(f"🚀 Worker gw{worker_id}: {len(shard)} tests")
+    
+    exit_code = 0
+    for worker_id, process, log_file, log_path in processes:
+        code = process.wait()
+        log_file.close()
+        status = "✅" if code == 0 else "❌"
+        print(f"{status} Worker gw{worker_id} terminé (code {code}) - log: {log_path}")
+        if code != 0:
+            exit_code = 1
+    
+    return exit_code
+
+
+def merge_worker_history(shard_count):
+    """Fusionne l'historique enregistré par chaque worker"""
+    history = TestHistory(Config.HISTORY_FILE)
+    for worker_id in range(shard_count):
+        partial = f"{Config.HISTORY_FILE}.gw{worker_id}"
+        if os.path.isfile(partial):
+            history.merge(TestHistory(partial))
+            os.remove(partial)
+    history.save()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exécution parallèle des tests SauceDemo")
+    parser.add_argument("-n", "--workers", type=int, default=Config.PARALLEL_WORKERS,
+                        help="Nombre de processus pytest")
+    parser.add_argument("--worker-args", default="-q --tb=short",
+                        help="Options pytest transmises à chaque worker")
+    args, pytest_args = parser.parse_known_args(argv)
+    if Config.VISUAL_UPDATE:
+        parser.error("SAUCEDEMO_VISUAL_UPDATE=1 : enregistrer les références visuelles en exécution série")
+    
+    nodeids = collect_nodeids(pytest_args)
+    if not nodeids:
+        print("Aucun test collecté")
+        return 5
+    
+    history = TestHistory(Config.HISTORY_FILE)
+    shards = plan_shards(nodeids, history.durations(), args.workers)
+    exit_code = run_shards(shards, shlex.split(args.worker_args))
+    merge_worker_history(len(shards))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,43 +5,351 @@
 # Fixtures pytest partagées pour tous les tests
 # """
 
+import time
+from contextlib import contextmanager
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from config.config import Config
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.product_detail_page import ProductDetailPage
+from pages.locators import registry
+from utils.driver_factory import create_driver
+from utils.artifacts import ArtifactCollector
+from utils.auth_state import AuthStateCache
+from utils.browser_profile import apply_resource_policy
+from utils.driver_pool import DriverPool
+from utils.image_integrity import image_probe
+from utils.locator_check import check_locator_snapshots, check_page_locators
+from utils.network_archive import tag_journey
+from utils.readonly_session import ReadOnlySession
+from utils.retry import flake_tracker
+from utils.step_timing import recorder
+from utils.test_history import TestHistory
+from utils.wait_budget import wait_budget
+from utils.visual import visual
+from utils.web_perf import web_perf
 
 
-@pytest.fixture(scope="function")
-def driver():
-    """Fixture pour initialiser et fermer le driver"""
-    
-    # Configuration du driver Chrome
-    chrome_options = Options()
-    if Config.HEADLESS:
-        chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    # Initialisation du driver
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_options
+_local_server = None
+_network = None
+_history = None
+_artifacts = None
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo", "Ordonnancement d'après l'historique")
+    group.addoption(
+        "--fast-cover", default=None, metavar="PAGES",
+        help="Sous-ensemble le plus rapide couvrant ces Page Objects "
+             "(ex: InventoryPage,LoginPage)"
+    )
+    group.addoption(
+        "--no-history-order", action="store_true", default=False,
+        help="Conserver l'ordre des fichiers au lieu de l'ordre issu de l'historique"
+    )
+    group.addoption(
+        "--network", default=Config.NETWORK_MODE, choices=("record", "replay"),
+        help="Enregistrer le trafic HTTP des parcours, ou le rejouer sans réseau"
+    )
+    group.addoption(
+        "--network-archive", default=Config.NETWORK_ARCHIVE, metavar="PATH",
+        help="Archive du trafic enregistré (json.gz)"
+    )
+    group.addoption(
+        "--network-latency", type=float, default=Config.NETWORK_LATENCY, metavar="SECONDS",
+        help="Latence ajoutée à chaque réponse rejouée"
     )
+    group.addoption(
+        "--concurrent", action="store_true", default=False,
+        help="Inclure les tests marqués concurrent (navigateurs hors du pool de session)"
+    )
+
+
+def pytest_configure(config):
+    """
+    Démarre le SauceDemo local si demandé (SAUCEDEMO_LOCAL=1), puis le proxy
+    d'enregistrement / de rejeu du trafic (--network record|replay)
+    """
+    config.addinivalue_line(
+        "markers",
+        "resources(*kinds): ressources réseau nécessaires au test (images, fonts, media)"
+    )
+    config.addinivalue_line(
+        "markers",
+        "readonly_inventory: tests en lecture seule partageant une session connectée par classe"
+    )
+    config.addinivalue_line(
+        "markers",
+        "concurrent: parcours multi-utilisateurs avec leurs propres navigateurs (exclus sans --concurrent)"
+    )
+    global _local_server, _network, _history, _artifacts
+    _history = TestHistory(Config.HISTORY_FILE)
+    if Config.ARTIFACTS_ENABLED:
+        _artifacts = ArtifactCollector()
+    if Config.USE_LOCAL_SERVER and _local_server is None:
+        from local_server import LocalSauceDemo
+        _local_server = LocalSauceDemo()
+        Config.BASE_URL = _local_server.start()
+    network_mode = config.getoption("--network")
+    if network_mode and _network is None:
+        from utils.network_archive import NetworkArchiveProxy
+        _network = NetworkArchiveProxy(network_mode, config.getoption("--network-archive"),
+                                       latency=config.getoption("--network-latency"))
+        Config.BASE_URL = _network.start()
+
+
+def pytest_unconfigure(config):
+    global _local_server, _network
+    if _network is not None:
+        _network.stop()
+        print(f"\n🌐 {_network.summary()}")
+        _network = None
+    if _local_server is not None:
+        _local_server.stop()
+        _local_server = None
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Ordonne les tests d'après l'historique : échecs récents d'abord, puis les
+    plus longs. Avec --fast-cover, ne garde que le sous-ensemble le plus rapide
+    couvrant les Page Objects demandés. Les tests marqués concurrent ne sont
+    gardés qu'avec --concurrent.
+    """
+    if not config.getoption("--concurrent"):
+        excluded = [item for item in items if item.get_closest_marker("concurrent")]
+        if excluded:
+            config.hook.pytest_deselected(items=excluded)
+            items[:] = [item for item in items if not item.get_closest_marker("concurrent")]
     
-    # Configuration
-    driver.implicitly_wait(Config.IMPLICIT_WAIT)
-    if Config.MAXIMIZE_WINDOW:
-        driver.maximize_window()
+    by_nodeid = {item.nodeid: item for item in items}
+    nodeids = list(by_nodeid)
     
-    yield driver
+    fast_cover = config.getoption("--fast-cover")
+    if fast_cover:
+        targets = [name.strip() for name in fast_cover.split(",") if name.strip()]
+        selected, uncovered = _history.fastest_cover(nodeids, targets)
+        if uncovered:
+            print(f"\n⚠️ Aucun test de l'historique ne couvre: {', '.join(uncovered)}")
+        deselected = [item for item in items if item.nodeid not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        nodeids = selected
+    
+    if not config.getoption("--no-history-order"):
+        # Les classes en session partagée restent groupées (une connexion par classe)
+        nodeids = _history.order(nodeids, group_of=lambda nodeid: _readonly_group(by_nodeid[nodeid]))
+    items[:] = [by_nodeid[nodeid] for nodeid in nodeids]
+
+
+def _readonly_group(item):
+    """Classe du test si elle partage une session lecture seule, sinon None"""
+    if item.get_closest_marker("readonly_inventory") and item.cls is not None:
+        return item.cls.__qualname__
+    return None
+
+
+# Durées et résultats mesurés pendant cette session
+_test_durations = {}
+_test_outcomes = {}
+_executed_tests = set()
+_session_overhead = {}  # nodeid → secondes de travail de session exécuté pendant son setup
+
+
+@contextmanager
+def session_work(name, username=None):
+    """
+    Travail de session (validation des locators...) déclenché par le setup du
+    premier test qui en a besoin : ses étapes, attentes et métriques sont
+    étiquetées « session::name » et sa durée est retirée de celle du test
+    """
+    owner = recorder.current_context.get("test_id")
+    start = time.perf_counter()
+    try:
+        with recorder.thread_context(test_id=f"session::{name}", username=username):
+            yield
+    finally:
+        if owner:
+            _session_overhead[owner] = _session_overhead.get(owner, 0.0) + time.perf_counter() - start
+
+
+def tag_network(driver, journey):
+    """
+    Avec --network record|replay, classe les requêtes suivantes du navigateur
+    sous ce parcours (test ou travail de session « session::... »)
+    """
+    if _network is not None:
+        tag_journey(driver, journey)
+
+
+def pytest_runtest_setup(item):
+    """Étiquette les mesures d'étapes avec le test et l'utilisateur courants"""
+    params = getattr(item, "callspec", None)
+    username = params.params.get("username") if params else None
+    recorder.set_context(test_id=item.nodeid, username=username)
+
+
+def pytest_runtest_logreport(report):
+    """Cumule la durée setup + call + teardown de chaque test (hors travail de session)"""
+    duration = report.duration
+    if report.when == "setup":
+        duration = max(duration - _session_overhead.pop(report.nodeid, 0.0), 0.0)
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + duration
+    if report.when == "call":
+        _executed_tests.add(report.nodeid)
+    if report.failed:
+        _test_outcomes[report.nodeid] = "failed"
+    elif report.skipped:
+        _test_outcomes.setdefault(report.nodeid, "skipped")
+    else:
+        _test_outcomes.setdefault(report.nodeid, "passed")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Capture les artefacts de débogage uniquement quand le test échoue"""
+    outcome = yield
+    report = outcome.get_result()
+    if _artifacts is None or not report.failed or report.when == "teardown":
+        return
+    
+    driver = item.funcargs.get("driver") if hasattr(item, "funcargs") else None
+    path = _artifacts.capture(item.nodeid, driver, recorder.records_for(item.nodeid))
+    if path:
+        report.sections.append(("artefacts", path))
+
+
+def pytest_sessionfinish(session):
+    """Enregistre durées, résultats et Page Objects utilisés dans l'historique"""
+    suffix = f"-{Config.WORKER_ID}" if Config.WORKER_ID else ""
+    recorder.write_report(Config.REPORTS_DIR, suffix)
+    wait_budget.write_report(Config.REPORTS_DIR, suffix)
+    registry.write_report(Config.REPORTS_DIR, suffix)
+    web_perf.write_report(Config.REPORTS_DIR, suffix)
+    image_probe.close()
+    visual.close()
+    visual_path = visual.write_report(Config.REPORTS_DIR, suffix)
+    if visual_path:
+        print(f"\n🖼️ Régression visuelle - rapport: {visual_path}")
+    exhausted = [t for t, entry in wait_budget.summary().items() if entry["exhausted"]]
+    if exhausted:
+        print(f"\n⏳ Budget d'attente ({wait_budget.limit}s) épuisé pour: {', '.join(exhausted)}")
+    flakes_path = flake_tracker.write_report(Config.REPORTS_DIR, suffix)
+    if flakes_path:
+        print(f"\n🔁 {len(flake_tracker.events)} relance(s) d'actions instables - rapport: {flakes_path}")
+    if _artifacts is not None and (_artifacts.bytes_written or _artifacts.skipped):
+        print(f"\n🗂️ {_artifacts.summary()}")
+    
+    if not _test_outcomes:
+        return
+    pages = recorder.pages_by_test()
+    for nodeid, outcome in _test_outcomes.items():
+        # Un test en erreur dès le setup n'a pas de durée représentative
+        duration = _test_durations[nodeid] if nodeid in _executed_tests else None
+        _history.record(nodeid, duration, outcome, pages.get(nodeid, ()))
+    
+    if Config.WORKER_ID:
+        _history.save(f"{Config.HISTORY_FILE}.{Config.WORKER_ID}", only_updated=True)
+    else:
+        _history.save()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Pool de navigateurs partagé par toute la session
+    Les locators des pages sont validés une fois avant le premier test, sur
+    des snapshots HTML statiques (et sur l'application cible avec
+    SAUCEDEMO_VALIDATE_LOCATORS_LIVE=1) : échec immédiat de tous les tests
+    navigateur si un sélecteur est périmé ; cette validation n'est pas
+    attribuée au test qui déclenche le pool
+    """
+    pool = DriverPool(create_driver)
+    try:
+        if Config.VALIDATE_LOCATORS:
+            with session_work("locator-check"):
+                check_locator_snapshots(pool)
+        if Config.VALIDATE_LOCATORS_LIVE:
+            auth_states = request.getfixturevalue("auth_states")
+            with session_work("locator-check-live", username="standard_user"):
+                check_page_locators(pool, auth_states, username="standard_user")
+    except Exception:
+        pool.close()
+        raise
+    
+    yield pool
     
     # Nettoyage
-    driver.quit()
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def visual_baselines(request, auth_states):
+    """
+    Références visuelles versionnées (Config.VISUAL_BASELINES), lues à la
+    première vérification visuelle ; absentes ou illisibles, les tests
+    visuels échouent. Avec SAUCEDEMO_VISUAL_UPDATE=1 (exécution série), elles
+    sont ré-enregistrées depuis Config.VISUAL_REFERENCE_USER et écrites en
+    fin de session, hors des mesures du test qui les déclenche
+    """
+    path = visual.baselines_path
+    try:
+        baselines = visual.load_baselines()
+    except (OSError, ValueError, KeyError) as e:
+        pytest.fail(f"Références visuelles illisibles ({path}): {e}", pytrace=False)
+    
+    if not Config.VISUAL_UPDATE:
+        if not baselines.has_page("inventory"):
+            pytest.fail(f"Aucune référence visuelle dans {path} : les enregistrer avec "
+                        f"SAUCEDEMO_VISUAL_UPDATE=1, les vérifier puis les committer", pytrace=False)
+        return baselines
+    
+    if Config.WORKER_ID:
+        pytest.fail("SAUCEDEMO_VISUAL_UPDATE=1 : enregistrer les références sans run_parallel.py", pytrace=False)
+    username = Config.VISUAL_REFERENCE_USER
+    driver_pool = request.getfixturevalue("driver_pool")
+    driver = driver_pool.acquire()
+    try:
+        apply_resource_policy(driver, ["images"])
+        tag_network(driver, "session::visual-baseline")
+        with session_work("visual-baseline", username=username):
+            assert auth_states.login(LoginPage(driver), username, timeout=10), \
+                f"Connexion échouée pour {username} (références visuelles)"
+            recorded = visual.record_baseline(InventoryPage(driver).check_visual())
+        assert recorded, "Aucune région capturée pour les références visuelles"
+    finally:
+        driver_pool.release(driver)
+    return baselines
+
+
+@pytest.fixture(scope="function")
+def driver(driver_pool, request):
+    """
+    Fixture qui emprunte un navigateur au pool et le rend après le test
+    Avec --network record|replay, le trafic est archivé / rejoué pour ce test
+    """
+    if request.node.get_closest_marker("readonly_inventory"):
+        # Navigateur connecté partagé par la classe, prêt sur l'inventaire
+        driver = request.getfixturevalue("readonly_inventory")
+        tag_network(driver, request.node.nodeid)
+        yield driver
+        tag_network(driver, "session::readonly")
+        return
+    
+    driver = driver_pool.acquire()
+    tag_network(driver, request.node.nodeid)
+    
+    # Profil le plus léger compatible avec les ressources déclarées par le test
+    marker = request.node.get_closest_marker("resources")
+    apply_resource_policy(driver, marker.args if marker else ())
+    
+    yield driver
+    
+    # Réinitialisation (ou recyclage) avant le prochain test ; les chargements
+    # encore en cours ne sont plus attribués à ce test
+    tag_network(driver, "session::pool")
+    driver_pool.release(driver)
 
 
 @pytest.fixture(scope="function")
@@ -62,21 +370,41 @@ def product_detail_page(driver):
     return ProductDetailPage(driver)
 
 
+@pytest.fixture(scope="session")
+def auth_states():
+    """États de connexion capturés une fois par utilisateur pour toute la session"""
+    return AuthStateCache()
+
+
+@pytest.fixture(scope="class")
+def readonly_session(driver_pool, auth_states):
+    """Session standard_user connectée une seule fois pour toute la classe"""
+    session = ReadOnlySession(driver_pool, auth_states)
+    
+    yield session
+    
+    print(f"\n📊 Session lecture seule: {session.stats}")
+    session.close()
+
+
+@pytest.fixture(scope="function")
+def readonly_inventory(readonly_session, request):
+    """Navigateur de la session partagée, ramené sur l'inventaire (renouvelé si modifié)"""
+    marker = request.node.get_closest_marker("resources")
+    return readonly_session.prepare(marker.args if marker else ())
+
+
 @pytest.fixture(scope="function")
-def authenticated_user(driver, login_page):
+def authenticated_user(driver, login_page, auth_states):
     """Fixture pour un utilisateur déjà connecté (standard_user)"""
-    login_page.navigate()
-    login_page.login("standard_user")
-    assert login_page.is_login_successful(), "La connexion a échoué"
+    assert auth_states.login(login_page, "standard_user"), "La connexion a échoué"
     return driver
 
 
 @pytest.fixture(scope="function")
-def authenticated_user_factory(driver, login_page):
+def authenticated_user_factory(driver, login_page, auth_states):
     """Factory fixture pour connecter différents utilisateurs"""
     def _login(username):
-        login_page.navigate()
-        login_page.login(username)
-        assert login_page.is_login_successful(), f"La connexion a échoué pour {username}"
+        assert auth_states.login(login_page, username), f"La connexion a échoué pour {username}"
         return driver
     return _login
@@ -0,0 +1,30 @@
+"""
+Parcours déclaratifs (data/journeys.json) sur les données partagées avec Playwright
+
+Un cas de test par ligne de données : ajouter une ligne ou une valeur de
+matrice dans le JSON suffit pour étendre la couverture.
+"""
+
+import pytest
+from config.config import Config
+from utils.journey_engine import compile_journeys, run_journey
+from utils.journeys import PageSet
+from utils.shared_data import load_shared
+
+
+@pytest.mark.parametrize("journey", compile_journeys(), ids=lambda journey: journey.id)
+def test_data_driven_journey(driver, auth_states, journey):
+    """Exécute les étapes compilées d'un parcours via les Page Objects"""
+    run_journey(journey, PageSet(driver), auth_states)
+
+
+def test_shared_data_matches_config():
+    """Utilisateurs et produits de la configuration Selenium identiques aux données Playwright"""
+    usernames = {user["username"] for user in load_shared("users").values()}
+    assert usernames == set(Config.USERS), \
+        f"users.json et Config.USERS divergent: {usernames ^ set(Config.USERS)}"
+    
+    product_names = set(load_shared("steps")["products"].values())
+    expected = {product["name"] for product in Config.EXPECTED_PRODUCTS}
+    assert product_names == expected, \
+        f"steps.json et Config.EXPECTED_PRODUCTS divergent: {product_names ^ expected}"
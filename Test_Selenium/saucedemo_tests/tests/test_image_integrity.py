@@ -0,0 +1,52 @@
+"""
+Intégrité des images produits pour chaque utilisateur (utils/image_integrity.py)
+
+Un appel navigateur et des requêtes HTTP mises en cache par URL : les
+images mal associées de problem_user et visual_user sont détectées même
+quand elles s'affichent correctement.
+"""
+
+import pytest
+from config.config import Config
+
+ALL_PRODUCTS = {product["name"] for product in Config.EXPECTED_PRODUCTS}
+
+# Produits dont l'image est volontairement incorrecte, par utilisateur
+IMAGE_BUGS = {
+    "problem_user": ALL_PRODUCTS,
+    "visual_user": {"Sauce Labs Backpack"},
+}
+
+
+def _describe(rows):
+    return "; ".join(f"{row['name']}: {', '.join(row['problems']) or 'ok'}" for row in rows)
+
+
+@pytest.mark.resources("images")
+@pytest.mark.parametrize("username", [u for u in Config.USERS if u not in Config.LOCKED_USERS])
+def test_inventory_image_integrity(auth_states, login_page, inventory_page, username):
+    """Seules les images connues comme incorrectes pour l'utilisateur sont signalées"""
+    timeout = 15 if username == "performance_glitch_user" else 10
+    assert auth_states.login(login_page, username, timeout=timeout), \
+        f"Connexion échouée pour {username}"
+    
+    table = inventory_page.get_image_integrity()
+    assert {row["name"] for row in table} == ALL_PRODUCTS, f"Produits inattendus: {_describe(table)}"
+    flagged = {row["name"] for row in table if not row["ok"]}
+    assert flagged == IMAGE_BUGS.get(username, set()), \
+        f"Images signalées pour {username}: {_describe(table)}"
+
+
+@pytest.mark.resources("images")
+@pytest.mark.parametrize("username", ["standard_user", "problem_user"])
+def test_detail_image_integrity(auth_states, login_page, inventory_page, product_detail_page, username):
+    """L'image de la page de détails correspond au produit affiché"""
+    assert auth_states.login(login_page, username, timeout=10), f"Connexion échouée pour {username}"
+    inventory_page.click_product_by_name("Sauce Labs Backpack")
+    assert product_detail_page.is_on_detail_page(), "Page de détails non affichée"
+    
+    row = product_detail_page.get_image_integrity()
+    if username in IMAGE_BUGS:
+        assert not row["ok"], f"Image de {row['name']} non signalée pour {username}"
+    else:
+        assert row["ok"], f"Image de {row['name']}: {', '.join(row['problems'])}"
@@ -0,0 +1,155 @@
+"""
+Enregistrement et rejeu du trafic HTTP (utils/network_archive.py)
+
+Tests sans navigateur : le proxy enregistre les réponses du SauceDemo
+local, l'archive est relue depuis le disque puis rejouée sans serveur.
+"""
+
+import http.client
+import time
+from urllib.parse import urlsplit
+
+import pytest
+from config.config import Config
+from local_server import LocalSauceDemo
+from utils.network_archive import (
+    JOURNEY_HEADER, SESSION_JOURNEY, NetworkArchive, NetworkArchiveProxy, worker_archive_path
+)
+
+SESSION_COOKIE = "session-username=standard_user"
+
+# Requêtes enregistrées par parcours : (chemin, en-têtes)
+JOURNEYS = {
+    "anonymous": [("/", {}), ("/static/app.css", {}), ("/inventory.html", {})],
+    "standard_user": [("/", {}), ("/inventory.html", {"Cookie": SESSION_COOKIE})],
+}
+
+
+def _get(base_url, path, headers=None):
+    """(statut, en-têtes hors Date, corps) d'une requête GET"""
+    parts = urlsplit(base_url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=10)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        headers = [(name, value) for name, value in response.getheaders() if name.lower() != "date"]
+        return response.status, headers, body
+    finally:
+        connection.close()
+
+
+def _record(path, journeys=JOURNEYS):
+    """Enregistre les parcours contre le SauceDemo local ; retourne les réponses obtenues"""
+    server = LocalSauceDemo()
+    proxy = NetworkArchiveProxy("record", path, upstream=server.start())
+    base_url = proxy.start()
+    responses = {}
+    try:
+        for journey, requests in journeys.items():
+            proxy.begin_journey(journey)
+            for request_path, headers in requests:
+                responses[(journey, request_path)] = _get(base_url, request_path, headers)
+    finally:
+        proxy.stop()
+        server.stop()
+    return proxy, responses
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / "saucedemo.json.gz")
+
+
+def test_replay_serves_recorded_responses(archive_path):
+    """Statut, en-têtes et corps rejoués à l'identique, par parcours, sans serveur"""
+    _, recorded = _record(archive_path)
+    assert recorded[("anonymous", "/inventory.html")][0] == 302, "Redirection attendue sans session"
+    assert recorded[("standard_user", "/inventory.html")][0] == 200
+    
+    proxy = NetworkArchiveProxy("replay", archive_path)
+    base_url = proxy.start()
+    try:
+        for (journey, request_path), expected in recorded.items():
+            proxy.begin_journey(journey)
+            assert _get(base_url, request_path) == expected, f"{journey} {request_path} différent"
+    finally:
+        proxy.stop()
+    assert not proxy.misses
+
+
+def test_replay_logs_unknown_requests(archive_path):
+    """Une requête absente de l'archive reçoit un 504 et est comptée"""
+    _record(archive_path)
+    proxy = NetworkArchiveProxy("replay", archive_path)
+    base_url = proxy.start()
+    try:
+        proxy.begin_journey("anonymous")
+        status, _, _ = _get(base_url, "/unknown.html")
+    finally:
+        proxy.stop()
+    assert status == 504
+    assert proxy.misses == [{"journey": "anonymous", "method": "GET", "path": "/unknown.html"}]
+
+
+def test_requests_filed_under_their_own_journey(archive_path):
+    """L'en-tête de parcours de chaque client prime sur le dernier begin_journey ; sans en-tête : session"""
+    server = LocalSauceDemo()
+    proxy = NetworkArchiveProxy("record", archive_path, upstream=server.start())
+    base_url = proxy.start()
+    try:
+        proxy.begin_journey("test_b")
+        _get(base_url, "/", {JOURNEY_HEADER: "test_a"})
+        _get(base_url, "/static/app.css")
+    finally:
+        proxy.stop()
+        server.stop()
+    assert [(entry["journey"], entry["path"]) for entry in proxy.archive.entries] == \
+        [("test_a", "/"), ("test_b", "/static/app.css")]
+    assert NetworkArchiveProxy("record", archive_path).journey == SESSION_JOURNEY
+    
+    proxy = NetworkArchiveProxy("replay", archive_path)
+    base_url = proxy.start()
+    try:
+        status, _, _ = _get(base_url, "/unknown.html", {JOURNEY_HEADER: "test_a"})
+    finally:
+        proxy.stop()
+    assert status == 504
+    assert proxy.misses == [{"journey": "test_a", "method": "GET", "path": "/unknown.html"}]
+
+
+def test_archive_deduplicates_bodies(archive_path):
+    """Un même corps (page de login des deux parcours) n'est stocké qu'une fois, après rechargement"""
+    _, recorded = _record(archive_path)
+    archive = NetworkArchive.load(archive_path)
+    distinct_bodies = {body for _, _, body in recorded.values()}
+    assert archive.stats()["responses"] == len(recorded)
+    assert archive.stats()["bodies"] == len(distinct_bodies) < len(recorded)
+
+
+def test_replay_applies_latency(archive_path):
+    """Chaque réponse rejouée est retardée de la latence configurée"""
+    _record(archive_path)
+    proxy = NetworkArchiveProxy("replay", archive_path, latency=0.2)
+    base_url = proxy.start()
+    try:
+        proxy.begin_journey("anonymous")
+        start = time.perf_counter()
+        status, _, _ = _get(base_url, "/")
+        elapsed = time.perf_counter() - start
+    finally:
+        proxy.stop()
+    assert status == 200
+    assert elapsed >= 0.2, f"Latence non appliquée ({elapsed:.3f}s)"
+
+
+def test_parallel_workers_record_separate_archives(archive_path, monkeypatch):
+    """Chaque worker écrit sa propre archive ; le rejeu les fusionne"""
+    for worker, journey in (("gw0", "anonymous"), ("gw1", "standard_user")):
+        monkeypatch.setattr(Config, "WORKER_ID", worker)
+        proxy, _ = _record(archive_path, {journey: JOURNEYS[journey]})
+        assert proxy.path == worker_archive_path(archive_path, worker)
+    monkeypatch.setattr(Config, "WORKER_ID", None)
+    
+    proxy = NetworkArchiveProxy("replay", archive_path)
+    assert {entry["journey"] for entry in proxy.archive.entries} == set(JOURNEYS)
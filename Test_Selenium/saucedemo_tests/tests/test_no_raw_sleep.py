@@ -0,0 +1,52 @@
+"""
+Vérification statique : aucune pause fixe (time.sleep) dans les Page Objects
+
+Les pages doivent utiliser les attentes conditionnelles de BasePage
+(wait_until, wait_for_navigation, wait_for_dom_settled, ...).
+Ce test ne lance pas de navigateur.
+"""
+
+import ast
+import os
+
+import pytest
+from config.config import Config
+
+PAGES_DIR = os.path.join(Config.ROOT_DIR, "pages")
+
+
+def find_raw_sleeps(source: str):
+    """Retourne les numéros de ligne des appels à time.sleep / sleep importé de time"""
+    tree = ast.parse(source)
+    sleep_aliases = set()
+    time_aliases = set()
+    
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            time_aliases.update(a.asname or a.name for a in node.names if a.name == "time")
+        elif isinstance(node, ast.ImportFrom) and node.module == "time":
+            sleep_aliases.update(a.asname or a.name for a in node.names if a.name == "sleep")
+    
+    lines = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if isinstance(func, ast.Attribute) and func.attr == "sleep" \
+                and isinstance(func.value, ast.Name) and func.value.id in time_aliases:
+            lines.append(node.lineno)
+        elif isinstance(func, ast.Name) and func.id in sleep_aliases:
+            lines.append(node.lineno)
+    return lines
+
+
+@pytest.mark.parametrize("filename", sorted(
+    f for f in os.listdir(PAGES_DIR) if f.endswith(".py")
+))
+def test_page_objects_have_no_raw_sleep(filename):
+    """Échoue si un Page Object contient un time.sleep"""
+    with open(os.path.join(PAGES_DIR, filename), encoding="utf-8") as f:
+        lines = find_raw_sleeps(f.read())
+    
+    assert not lines, \
+        f"time.sleep interdit dans pages/{filename} (lignes {lines}): utiliser les attentes de BasePage"
@@ -11,49 +11,47 @@ Note: SauceDemo contient des users avec bugs intentionnels:
 """
 
 import pytest
-import time
 from selenium.webdriver.common.by import By
 from config.config import Config
+from pages.inventory_page import InventoryPage
+from utils.concurrent_runner import ConcurrentJourneyRunner
 
 class TestProductVerification:
     """Suite de tests pour la vérification des produits"""
     
-    def test_login_all_users(self, driver, login_page):
+    @pytest.mark.parametrize("username", Config.USERS)
+    def test_login_all_users(self, login_page, username):
         """
-        Test de connexion pour tous les utilisateurs
+        Test de connexion pour chaque utilisateur (un cas indépendant par user)
         Vérifie que locked_out_user est bloqué et les autres peuvent se connecter
         """
         
-        for username in Config.USERS:
-            print(f"\n{'='*60}")
-            print(f"Test de connexion pour: {username}")
-            print(f"{'='*60}")
-            
-            login_page.navigate()
-            time.sleep(0.5)  # Attendre le chargement de la page
-            login_page.login(username)
-            
-            if username == "locked_out_user":
-                # Cet utilisateur ne peut pas se connecter
-                time.sleep(1)  # Attendre le message d'erreur
-                assert login_page.is_error_displayed(), \
-                    f"Message d'erreur attendu pour {username}"
-                error = login_page.get_error_message()
-                print(f"✓ {username}: Bloqué comme prévu")
-                print(f"  Message: {error}")
-            else:
-                # Tous les autres devraient pouvoir se connecter
-                # Note: Augmentation du timeout pour performance_glitch_user
-                is_successful = login_page.is_login_successful(timeout=10)
-                assert is_successful, \
-                    f"Connexion échouée pour {username}"
-                print(f"✓ {username}: Connexion réussie")
-                driver.back()
-                time.sleep(0.5)
+        print(f"\n{'='*60}")
+        print(f"Test de connexion pour: {username}")
+        print(f"{'='*60}")
+        
+        login_page.navigate()
+        login_page.login(username)
+        
+        if username in Config.LOCKED_USERS:
+            # Cet utilisateur ne peut pas se connecter (attente du message incluse)
+            assert login_page.is_error_displayed(), \
+                f"Message d'erreur attendu pour {username}"
+            error = login_page.get_error_message()
+            print(f"✓ {username}: Bloqué comme prévu")
+            print(f"  Message: {error}")
+        else:
+            # Tous les autres devraient pouvoir se connecter
+            # Note: Augmentation du timeout pour performance_glitch_user
+            is_successful = login_page.is_login_successful(timeout=10)
+            assert is_successful, \
+                f"Connexion échouée pour {username}"
+            print(f"✓ {username}: Connexion réussie")
     
+    @pytest.mark.resources("images")
     @pytest.mark.parametrize("username", Config.FUNCTIONAL_USERS)
     def test_complete_product_verification(self, driver, login_page, inventory_page, 
-                                          product_detail_page, username):
+                                          product_detail_page, auth_states, username):
         """
         Test Selenium 2 - Test complet de vérification des produits
         
@@ -73,18 +71,13 @@ class TestProductVerification:
         
         # ===== STEP 1: Se connecter =====
         print(f"\n--- STEP 1: Connexion ---")
-        login_page.navigate()
-        time.sleep(0.5)
-        login_page.login(username)
-        
         # Timeout augmenté pour performance_glitch_user
+        # (session réinjectée si l'utilisateur s'est déjà connecté via le formulaire)
         timeout = 15 if username == "performance_glitch_user" else 10
-        assert login_page.is_login_successful(timeout=timeout), \
+        assert auth_states.login(login_page, username, timeout=timeout), \
             f"Connexion échouée pour {username}"
         print(f"✓ Connexion réussie pour {username}")
         
-        time.sleep(1)  # Attendre le chargement complet de la page
-        
         # ===== STEP 2: Vérifier tous les produits =====
         print(f"\n--- STEP 2: Vérification de la présence de tous les produits ---")
         for expected_product in Config.EXPECTED_PRODUCTS:
@@ -95,8 +88,10 @@ class TestProductVerification:
             assert exists, \
                 f"Produit manquant: {expected_product['name']} - {expected_product['price']}"
             print(f"✓ {expected_product['name']} - {expected_product['price']}")
+        print(f"  Cache snapshot produits: {inventory_page.cache_stats}")
         
         # ===== STEP 3: Vérifier les éléments de chaque produit =====
+        # (tableau de vérification de tous les produits lu en un seul aller-retour)
         print(f"\n--- STEP 3: Vérification des éléments de chaque produit ---")
         all_products = inventory_page.get_all_products()
         
@@ -128,8 +123,7 @@ class TestProductVerification:
         
         # ===== STEP 4: Cliquer sur "Sauce Labs Backpack" =====
         print(f"\n--- STEP 4: Navigation vers 'Sauce Labs Backpack' ---")
-        inventory_page.click_product_by_name("Sauce Labs Backpack")
-        time.sleep(2)  # Attendre la navigation
+        inventory_page.click_product_by_name("Sauce Labs Backpack")  # Attend la navigation
         print(f"✓ Clic effectué sur 'Sauce Labs Backpack'")
         
         # ===== STEP 5: Vérifier la page de détails =====
@@ -155,8 +149,7 @@ class TestProductVerification:
         
         # ===== STEP 6: Retourner à la liste des produits =====
         print(f"\n--- STEP 6: Retour à la liste des produits ---")
-        product_detail_page.back_to_products()
-        time.sleep(1)  # Attendre le retour
+        product_detail_page.back_to_products()  # Attend le retour
         
         assert inventory_page.is_on_inventory_page(), \
             "Pas revenu à la page inventaire"
@@ -175,58 +168,64 @@ class TestProductVerification:
         print(f"{'='*70}\n")
 
 
+@pytest.mark.readonly_inventory
 class TestProductElements:
     """
     Tests spécifiques pour les éléments des produits
     Utilisent standard_user pour éviter les bugs intentionnels
+    (une seule connexion partagée par la classe : tests en lecture seule)
     """
     
-    def test_all_products_have_images(self, authenticated_user, inventory_page):
+    @pytest.mark.resources("images")
+    def test_all_products_have_images(self, inventory_page):
         """Vérifie que tous les produits ont des images visibles"""
-        products = inventory_page.get_all_products()
+        checks = inventory_page.get_element_checks()
+        assert checks, "Aucun produit trouvé"
         
-        for product in products:
-            assert product['image'].is_displayed(), \
-                f"Image non visible pour {product['name']}"
-            assert product['image'].get_attribute('src'), \
-                f"Image sans src pour {product['name']}"
+        for check in checks:
+            assert check['has_visible_image'], \
+                f"Image non visible pour {check['name']}"
+            assert check['image_has_src'], \
+                f"Image sans src pour {check['name']}"
     
-    def test_all_products_have_add_to_cart_button(self, authenticated_user, inventory_page):
+    def test_all_products_have_add_to_cart_button(self, inventory_page):
         """Vérifie que tous les produits ont un bouton Add to cart"""
-        products = inventory_page.get_all_products()
+        checks = inventory_page.get_element_checks()
+        assert checks, "Aucun produit trouvé"
         
-        for product in products:
-            assert product['add_button'].is_displayed(), \
-                f"Bouton non visible pour {product['name']}"
-            assert product['add_button'].is_enabled(), \
-                f"Bouton non activé pour {product['name']}"
+        for check in checks:
+            assert check['has_add_button'], \
+                f"Bouton non visible pour {check['name']}"
+            assert check['button_is_enabled'], \
+                f"Bouton non activé pour {check['name']}"
     
-    def test_all_products_have_clickable_names(self, authenticated_user, inventory_page):
+    def test_all_products_have_clickable_names(self, inventory_page):
         """Vérifie que tous les produits ont des noms cliquables"""
-        products = inventory_page.get_all_products()
+        checks = inventory_page.get_element_checks()
+        assert checks, "Aucun produit trouvé"
         
-        for product in products:
-            assert product['name_link'].is_displayed(), \
-                f"Nom non visible pour {product['name']}"
-            assert product['name_link'].is_enabled(), \
-                f"Nom non cliquable pour {product['name']}"
+        for check in checks:
+            assert check['name_is_displayed'], \
+                f"Nom non visible pour {check['name']}"
+            assert check['name_is_enabled'], \
+                f"Nom non cliquable pour {check['name']}"
 
 
+@pytest.mark.readonly_inventory
 class TestProductNavigation:
-    """Tests pour la navigation entre produits"""
+    """Tests pour la navigation entre produits (session partagée, lecture seule)"""
     
     @pytest.mark.parametrize("product_name,expected_price", [
         ("Sauce Labs Backpack", "$29.99"),
         ("Sauce Labs Bike Light", "$9.99"),
         ("Sauce Labs Fleece Jacket", "$49.99")
     ])
-    def test_product_detail_navigation(self, authenticated_user, inventory_page, 
+    def test_product_detail_navigation(self, inventory_page, 
                                       product_detail_page, product_name, expected_price):
         """Teste la navigation vers les détails de différents produits"""
         
         # Naviguer vers le produit
         inventory_page.click_product_by_name(product_name)
-        time.sleep(1)
         
         # Vérifier la page de détails
         assert product_detail_page.is_on_detail_page()
@@ -235,60 +234,57 @@ class TestProductNavigation:
         
         # Retourner à l'inventaire
         product_detail_page.back_to_products()
-        time.sleep(0.5)
         assert inventory_page.is_on_inventory_page()
 
 
+@pytest.mark.concurrent
+class TestConcurrentUsers:
+    """
+    Parcours complet pour tous les utilisateurs, en parallèle dans un seul processus
+    Navigateurs propres au runner (hors pool de session, proxy réseau et budget
+    d'attente) : exclu de la suite par défaut, lancé avec --concurrent
+    """
+    
+    def test_all_users_journey_concurrently(self):
+        """
+        Login → inventaire → détails → retour pour chaque utilisateur de Config.USERS
+        Durée ≈ celle de l'utilisateur le plus lent au lieu de la somme
+        """
+        runner = ConcurrentJourneyRunner()
+        failures = []
+        
+        for result in runner.run(Config.USERS):
+            steps = ", ".join(f"{s['name']} {s['duration']}s" for s in result.steps)
+            print(f"{'✓' if result.passed else '❌'} {result.username} ({result.duration}s): {steps}")
+            if not result.passed:
+                failures.append(f"{result.username}: {result.error}")
+        
+        assert not failures, "Parcours en échec:\n" + "\n".join(failures)
+
+
 # ============================================================
-# TEST TEMPORAIRE DE DEBUG - À SUPPRIMER APRÈS
+# STRUCTURE HTML DES PRODUITS
+# (en cas d'échec, le DOM complet est archivé dans reports/artifacts/)
 # ============================================================
 def test_debug_product_structure(authenticated_user):
-    """Test de debug pour comprendre la structure HTML"""
+    """Vérifie la structure HTML sur laquelle reposent les locators des produits"""
     driver = authenticated_user
     
-    # Attendre le chargement
-    time.sleep(2)
+    # Trouver tous les items (attente de leur chargement)
+    items = InventoryPage(driver).find_elements(*InventoryPage.INVENTORY_ITEMS)
+    assert len(items) == len(Config.EXPECTED_PRODUCTS), \
+        f"Nombre de produits trouvés: {len(items)}"
     
-    # Trouver tous les items
-    items = driver.find_elements(By.CLASS_NAME, "inventory_item")
-    print(f"\n📦 Nombre de produits trouvés: {len(items)}")
+    # Le nom du premier produit est accessible par sa classe
+    first_item = items[0]
+    names = first_item.find_elements(By.CSS_SELECTOR, ".inventory_item_name")
+    assert names and names[0].text, "Classe .inventory_item_name NON trouvée"
     
-    # Analyser le premier produit
-    if items:
-        first_item = items[0]
-        print(f"\n🔍 Structure HTML du premier produit:")
-        print(first_item.get_attribute('outerHTML')[:800])
-        
-        # Chercher le nom avec espace
-        try:
-            name_with_space = first_item.find_element(By.CSS_SELECTOR, ".inventory_item_name ")
-            print(f"\n✓ Classe avec espace trouvée: '{name_with_space.text}'")
-        except:
-            print(f"\n❌ Classe avec espace NON trouvée")
-        
-        # Chercher le nom sans espace
-        try:
-            name_without_space = first_item.find_element(By.CSS_SELECTOR, ".inventory_item_name")
-            print(f"✓ Classe sans espace trouvée: '{name_without_space.text}'")
-        except:
-            print(f"❌ Classe sans espace NON trouvée")
-        
-        # Chercher les liens
-        try:
-            links = first_item.find_elements(By.TAG_NAME, "a")
-            print(f"\n🔗 Liens trouvés dans le produit: {len(links)}")
-            for idx, link in enumerate(links):
-                print(f"  Lien {idx+1}:")
-                print(f"    - id: {link.get_attribute('id')}")
-                print(f"    - href: {link.get_attribute('href')}")
-                print(f"    - class: {link.get_attribute('class')}")
-                try:
-                    inner_text = link.find_element(By.CSS_SELECTOR, "div").text
-                    print(f"    - texte intérieur: {inner_text}")
-                except:
-                    print(f"    - texte: {link.text}")
-        except Exception as e:
-            print(f"❌ Erreur lors de la recherche des liens: {e}")
+    # Liens image et titre identifiés par un id (utilisés pour la navigation)
+    links = first_item.find_elements(By.TAG_NAME, "a")
+    link_ids = [link.get_attribute('id') for link in links]
+    print(f"✓ {names[0].text}: liens {link_ids}")
+    assert links and all(link_ids), f"Liens sans id dans le produit: {link_ids}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+"""
+Régression visuelle de l'inventaire (utils/visual.py)
+
+Les références versionnées (Config.VISUAL_BASELINES) viennent de
+Config.VISUAL_REFERENCE_USER ; SAUCEDEMO_VISUAL_UPDATE=1 les ré-enregistre.
+Cet utilisateur doit y correspondre ; problem_user et visual_user doivent
+s'en écarter là où leurs bugs sont connus.
+"""
+
+import pytest
+from config.config import Config
+
+
+def _check_inventory(auth_states, login_page, inventory_page, username):
+    """Connexion puis vérification visuelle de l'inventaire (résultats par région)"""
+    assert auth_states.login(login_page, username, timeout=10), f"Connexion échouée pour {username}"
+    check = inventory_page.check_visual()
+    results = check.results()
+    assert results, "Aucune région capturée"
+    assert not check.missing, f"Régions sans référence visuelle: {check.missing}"
+    return check, results
+
+
+@pytest.mark.resources("images")
+def test_reference_user_matches_baseline(visual_baselines, auth_states, login_page, inventory_page):
+    """L'inventaire de l'utilisateur de référence correspond aux références"""
+    if Config.VISUAL_UPDATE:
+        pytest.skip("Mode mise à jour : références enregistrées par cette session")
+    check, results = _check_inventory(auth_states, login_page, inventory_page,
+                                      Config.VISUAL_REFERENCE_USER)
+    assert not check.differences, f"Écarts visuels: {check.differences}"
+
+
+@pytest.mark.resources("images")
+def test_problem_user_images_differ(visual_baselines, auth_states, login_page, inventory_page):
+    """problem_user affiche la même image pour tous les produits"""
+    check, results = _check_inventory(auth_states, login_page, inventory_page, "problem_user")
+    images = [region for region in results if region.startswith("image:")]
+    assert len(images) == len(Config.EXPECTED_PRODUCTS), f"Images capturées: {images}"
+    unchanged = [region for region in images if region not in check.differences]
+    assert not unchanged, f"Images identiques à la référence: {unchanged}"
+
+
+@pytest.mark.resources("images")
+def test_visual_user_differs_from_baseline(visual_baselines, auth_states, login_page, inventory_page):
+    """visual_user : mauvaise image du premier produit et mise en page altérée"""
+    check, results = _check_inventory(auth_states, login_page, inventory_page, "visual_user")
+    assert "image:Sauce Labs Backpack" in check.differences, \
+        f"Image du Backpack identique à la référence (écarts: {check.differences})"
+    assert "page" in check.differences, "Page entière identique à la référence"
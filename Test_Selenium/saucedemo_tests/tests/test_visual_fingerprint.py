@@ -0,0 +1,135 @@
+"""
+Décodage PNG et empreintes visuelles (utils/visual.py)
+
+Tests sans navigateur : des PNG construits ici avec chacun des cinq filtres
+de ligne sont décodés et comparés aux pixels d'origine ; les formats que
+Chrome ne produit pas (palette, 16 bits, gris, entrelacé) sont refusés.
+"""
+
+import struct
+import zlib
+
+import pytest
+from utils.visual import compare, decode_png, fingerprint, fingerprint_regions, fingerprint_thumbnail
+
+WIDTH, HEIGHT = 7, 5
+
+
+def _chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _filter(kind, line, previous, channels):
+    """Filtre une ligne PNG (sens encodage, indépendant du décodeur testé)"""
+    out = bytearray()
+    for i, value in enumerate(line):
+        left = line[i - channels] if i >= channels else 0
+        upper_left = previous[i - channels] if i >= channels else 0
+        predictor = (0, left, previous[i], (left + previous[i]) >> 1,
+                     _paeth(left, previous[i], upper_left))[kind]
+        out.append((value - predictor) & 0xFF)
+    return bytes(out)
+
+
+def encode_png(pixels, width, height, channels=3, filters=(0,), depth=8, color=None, interlace=0):
+    """PNG dont la ligne y utilise le filtre filters[y % len(filters)]"""
+    color = {3: 2, 4: 6}[channels] if color is None else color
+    stride = width * channels
+    raw, previous = bytearray(), bytes(stride)
+    for y in range(height):
+        line = bytes(pixels[y * stride:(y + 1) * stride])
+        kind = filters[y % len(filters)]
+        raw += bytes([kind]) + _filter(kind, line, previous, channels)
+        previous = line
+    header = struct.pack(">IIBBBBB", width, height, depth, color, 0, 0, interlace)
+    return (b"\x89PNG\r\n\x1a\n" + _chunk(b"IHDR", header)
+            + _chunk(b"IDAT", zlib.compress(bytes(raw))) + _chunk(b"IEND", b""))
+
+
+def _gradient(width, height, channels):
+    """Pixels variés (les filtres Sub/Up/Average/Paeth ont de vrais résidus)"""
+    return bytearray((x * 37 + y * 91 + c * 53 + x * y * 7) & 0xFF
+                     for y in range(height) for x in range(width) for c in range(channels))
+
+
+def _solid(width, height, color):
+    return bytearray(bytes(color) * (width * height))
+
+
+@pytest.mark.parametrize("channels", [3, 4])
+@pytest.mark.parametrize("filters", [(0,), (1,), (2,), (3,), (4,), (0, 1, 2, 3, 4)])
+def test_decode_all_filters(channels, filters):
+    """Chaque filtre de ligne restitue exactement les pixels encodés"""
+    pixels = _gradient(WIDTH, HEIGHT, channels)
+    png = encode_png(pixels, WIDTH, HEIGHT, channels, filters)
+    assert decode_png(png) == (WIDTH, HEIGHT, channels, pixels)
+
+
+def test_decode_split_idat():
+    """Données image réparties sur plusieurs IDAT, comme dans les grandes captures"""
+    pixels = _gradient(WIDTH, HEIGHT, 3)
+    png = encode_png(pixels, WIDTH, HEIGHT, 3, (4,))
+    start = png.index(b"IDAT") - 4
+    length = struct.unpack(">I", png[start:start + 4])[0]
+    data = png[start + 8:start + 8 + length]
+    split = _chunk(b"IDAT", data[:10]) + _chunk(b"IDAT", data[10:])
+    assert decode_png(png[:start] + split + png[start + 12 + length:])[3] == pixels
+
+
+@pytest.mark.parametrize("depth, color, interlace", [
+    (8, 3, 0),   # palette
+    (16, 2, 0),  # 16 bits
+    (8, 0, 0),   # gris
+    (8, 4, 0),   # gris + alpha
+    (8, 2, 1),   # entrelacé (Adam7)
+])
+def test_unsupported_png_rejected(depth, color, interlace):
+    """Formats que Chrome ne produit pas : erreur explicite plutôt qu'une empreinte fausse"""
+    png = encode_png(_gradient(WIDTH, HEIGHT, 3), WIDTH, HEIGHT, 3, depth=depth, color=color, interlace=interlace)
+    with pytest.raises(ValueError, match="PNG non supporté"):
+        decode_png(png)
+
+
+def test_not_png_rejected():
+    with pytest.raises(ValueError, match="non PNG"):
+        decode_png(b"GIF89a")
+    with pytest.raises(ValueError, match="incomplet"):
+        decode_png(b"\x89PNG\r\n\x1a\n" + _chunk(b"IEND", b""))
+
+
+def test_identical_thumbnails_match():
+    png = encode_png(_gradient(32, 24, 4), 32, 24, 4, (0, 1, 2, 3, 4))
+    first, second = fingerprint_thumbnail("a", png)["a"], fingerprint_thumbnail("a", png)["a"]
+    assert compare(first, second) == {"distance": 0, "changed_tiles": [], "match": True}
+
+
+def test_different_colors_differ():
+    """Même structure, autre couleur : le hash peut coïncider, les tuiles non"""
+    red = fingerprint_thumbnail("a", encode_png(_solid(16, 16, (200, 10, 10)), 16, 16))["a"]
+    green = fingerprint_thumbnail("a", encode_png(_solid(16, 16, (10, 200, 10)), 16, 16))["a"]
+    result = compare(red, green)
+    assert not result["match"]
+    assert len(result["changed_tiles"]) == 64
+
+
+def test_fingerprint_regions_crops_window_capture():
+    """Capture de la fenêtre : chaque région est découpée, hors champ → None"""
+    width, height = 20, 10
+    pixels = bytearray()
+    for y in range(height):
+        for x in range(width):
+            pixels += bytes((250, 0, 0) if x < 10 else (0, 0, 250))
+    image = decode_png(encode_png(pixels, width, height))
+    regions = {"left": [0, 0, 10, 10], "right": [10, 0, 10, 10], "below": [0, 50, 10, 10]}
+    result = fingerprint_regions(encode_png(pixels, width, height), {"x": 0, "y": 0, "width": width}, regions)
+    assert result["below"] is None
+    assert compare(result["left"], fingerprint(image, (0, 0, 10, 10)))["match"]
+    assert not compare(result["left"], result["right"])["match"]
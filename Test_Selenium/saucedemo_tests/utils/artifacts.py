@@ -0,0 +1,166 @@
+"""
+Artefacts de débogage capturés uniquement pour les tests en échec
+
+Pour chaque échec : capture d'écran, DOM compressé, logs console du
+navigateur et chronologie des étapes, écrits directement sur disque dans
+reports/artifacts/<run>/<test>/. Un plafond par exécution limite l'espace
+occupé ; au-delà, les captures suivantes sont ignorées et signalées dans
+le manifeste. Seules les Config.ARTIFACTS_KEEP_RUNS dernières exécutions
+sont conservées (les workers parallèles partagent le dossier de leur
+exécution via SAUCEDEMO_RUN_ID ; le plafond s'applique à chaque processus).
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+
+# Taille des blocs écrits dans les fichiers compressés
+CHUNK_SIZE = 64 * 1024
+
+
+class SessionReport:
+    """
+    Rapport JSON de fin de session : reports/<REPORT_NAME><suffix>.json
+    (suffixe du worker en exécution parallèle). report_data() retourne le
+    contenu, ou None si rien n'a été mesuré (aucun fichier écrit).
+    """
+    
+    REPORT_NAME = None
+    
+    def report_data(self):
+        raise NotImplementedError
+    
+    def write_report(self, directory, suffix=""):
+        """Écrit le rapport ; retourne son chemin (None si rien à écrire)"""
+        data = self.report_data()
+        if data is None:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.REPORT_NAME}{suffix}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+
+def _safe_name(nodeid: str) -> str:
+    """Nom de dossier lisible et sans caractères problématiques pour un nodeid"""
+    name = nodeid.split("/")[-1].replace("::", "__")
+    return re.sub(r"[^\w.\-\[\]]+", "_", name)[:150]
+
+
+class ArtifactCollector:
+    """Écrit les artefacts d'échec sous un plafond d'octets par exécution"""
+    
+    def __init__(self, directory=None, max_bytes=None, keep_runs=None):
+        self.root = directory or Config.ARTIFACTS_DIR
+        self.max_bytes = Config.ARTIFACTS_MAX_BYTES if max_bytes is None else max_bytes
+        self.keep_runs = Config.ARTIFACTS_KEEP_RUNS if keep_runs is None else keep_runs
+        self.run_dir = os.path.join(self.root, Config.RUN_ID)
+        self.bytes_written = 0
+        self.skipped = []
+        self._lock = threading.Lock()
+    
+    @property
+    def remaining(self) -> int:
+        return max(self.max_bytes - self.bytes_written, 0)
+    
+    def capture(self, nodeid, driver=None, steps=()) -> str:
+        """
+        Capture les artefacts d'un test en échec
+        
+        Returns:
+            Dossier des artefacts du test (None si le plafond est déjà atteint)
+        """
+        with self._lock:
+            if not self.remaining:
+                self.skipped.append(nodeid)
+                return None
+            if not os.path.isdir(self.run_dir):
+                os.makedirs(self.run_dir, exist_ok=True)
+                self._prune_old_runs()
+            test_dir = os.path.join(self.run_dir, _safe_name(nodeid))
+            os.makedirs(test_dir, exist_ok=True)
+            
+            manifest = {"nodeid": nodeid, "files": {}, "skipped": [], "errors": {}}
+            self._write_json(test_dir, "steps.json.gz", list(steps), manifest)
+            if driver is not None:
+                self._capture_browser(test_dir, driver, manifest)
+            
+            with open(os.path.join(test_dir, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            return test_dir
+    
+    def _capture_browser(self, test_dir, driver, manifest):
+        """Capture d'écran, DOM et logs console ; chaque capture est indépendante"""
+        captures = [
+            ("screenshot.png", lambda: self._write_bytes(
+                test_dir, "screenshot.png", driver.get_screenshot_as_png(), manifest)),
+            ("dom.html.gz", lambda: self._write_text(
+                test_dir, "dom.html.gz", driver.page_source, manifest)),
+            ("console.json.gz", lambda: self._write_json(
+                test_dir, "console.json.gz", driver.get_log("browser"), manifest)),
+        ]
+        url = None
+        try:
+            url = driver.current_url
+        except WebDriverException:
+            pass
+        manifest["url"] = url
+        
+        for name, capture in captures:
+            try:
+                capture()
+            except (WebDriverException, ValueError) as e:
+                manifest["errors"][name] = str(e).splitlines()[0] if str(e) else type(e).__name__
+    
+    def _write_bytes(self, test_dir, name, data: bytes, manifest):
+        """Écrit un contenu déjà compressé (PNG) s'il tient dans le plafond"""
+        if len(data) > self.remaining:
+            manifest["skipped"].append(name)
+            return
+        with open(os.path.join(test_dir, name), "wb") as f:
+            f.write(data)
+        self._account(name, len(data), manifest)
+    
+    def _write_text(self, test_dir, name, text: str, manifest):
+        """Compresse le texte par blocs ; fichier supprimé s'il dépasse le plafond"""
+        path = os.path.join(test_dir, name)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for start in range(0, len(text), CHUNK_SIZE):
+                f.write(text[start:start + CHUNK_SIZE])
+        size = os.path.getsize(path)
+        if size > self.remaining:
+            os.remove(path)
+            manifest["skipped"].append(name)
+            return
+        self._account(name, size, manifest)
+    
+    def _write_json(self, test_dir, name, data, manifest):
+        self._write_text(test_dir, name, json.dumps(data, indent=1, default=str), manifest)
+    
+    def _account(self, name, size, manifest):
+        self.bytes_written += size
+        manifest["files"][name] = size
+    
+    def _prune_old_runs(self):
+        """Supprime les exécutions les plus anciennes au-delà de keep_runs"""
+        runs = sorted(
+            entry.path for entry in os.scandir(self.root)
+            if entry.is_dir() and entry.path != self.run_dir
+        )
+        stale = runs[:len(runs) - (self.keep_runs - 1)] if self.keep_runs > 1 else runs
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+    
+    def summary(self) -> str:
+        """Résumé affiché en fin de session"""
+        text = f"{self.bytes_written / 1024:.0f} Ko d'artefacts dans {self.run_dir}"
+        if self.skipped:
+            text += f" ({len(self.skipped)} échec(s) non capturé(s) : plafond atteint)"
+        return text
@@ -0,0 +1,48 @@
+"""
+Cache des états d'authentification par utilisateur, partagé par la session
+
+La première connexion d'un utilisateur passe par le formulaire ; l'état
+obtenu (cookie de session, localStorage) est ensuite réinjecté directement
+pour les tests suivants (Config.FAST_AUTH).
+"""
+
+import logging
+import threading
+
+from config.config import Config
+from utils.step_timing import recorder
+
+logger = logging.getLogger(__name__)
+
+
+class AuthStateCache:
+    """États de connexion capturés une fois par utilisateur"""
+    
+    def __init__(self, fast_auth=None):
+        self.fast_auth = Config.FAST_AUTH if fast_auth is None else fast_auth
+        self.stats = {"ui_logins": 0, "fast_logins": 0}
+        self._states = {}
+        self._lock = threading.Lock()
+    
+    def login(self, login_page, username, timeout=5) -> bool:
+        """Connecte l'utilisateur, par injection de session si possible"""
+        recorder.set_context(username=username)
+        with self._lock:
+            state = self._states.get(username)
+        
+        if self.fast_auth and state:
+            if login_page.restore_session(state, timeout=timeout):
+                self.stats["fast_logins"] += 1
+                return True
+            logger.warning("Session réinjectée refusée pour %s, connexion via le formulaire", username)
+        
+        login_page.navigate()
+        login_page.login(username)
+        if not login_page.is_login_successful(timeout=timeout):
+            return False
+        
+        self.stats["ui_logins"] += 1
+        if self.fast_auth:
+            with self._lock:
+                self._states[username] = login_page.get_session_state()
+        return True
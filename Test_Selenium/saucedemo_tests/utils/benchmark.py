@@ -0,0 +1,120 @@
+"""
+Benchmark de performance des parcours SauceDemo
+
+Chaque parcours de utils/journeys.py est exécuté plusieurs fois par
+utilisateur ; les premières itérations (échauffement) sont ignorées et les
+valeurs aberrantes sont écartées (règle de Tukey, 1.5 × IQR) avant de
+calculer médiane et p95. Les résultats sont comparés à une baseline
+enregistrée : une hausse supérieure au seuil est une régression.
+"""
+
+import json
+import os
+import time
+from collections import defaultdict
+
+from config.config import Config
+from utils.journeys import JOURNEYS, PageSet
+from utils.stats import percentile
+
+# Hausse absolue minimale (secondes) pour signaler une régression
+MIN_REGRESSION_DELTA = 0.05
+
+
+def remove_outliers(samples):
+    """Écarte les mesures hors de [Q1 - 1.5 IQR, Q3 + 1.5 IQR]"""
+    if len(samples) < 4:
+        return list(samples)
+    q1, q3 = percentile(samples, 25), percentile(samples, 75)
+    fence = 1.5 * (q3 - q1)
+    return [s for s in samples if q1 - fence <= s <= q3 + fence]
+
+
+def run_benchmark(driver_pool, users, iterations, warmup=1):
+    """
+    Exécute les parcours et retourne {parcours: {user: [durées]}}
+    Les itérations d'échauffement ne sont pas enregistrées.
+    """
+    samples = defaultdict(lambda: defaultdict(list))
+    failures = []
+    
+    for username in users:
+        for iteration in range(warmup + iterations):
+            driver = driver_pool.acquire()
+            try:
+                pages = PageSet(driver)
+                for name, journey in JOURNEYS.items():
+                    if name != "login" and username in Config.LOCKED_USERS:
+                        break
+                    start = time.perf_counter()
+                    try:
+                        journey(pages, username)
+                    except Exception as e:
+                        # Échec d'assertion, timeout d'attente ou erreur WebDriver :
+                        # le parcours est abandonné pour cette itération, pas le benchmark
+                        failures.append({"journey": name, "username": username,
+                                         "error": f"{type(e).__name__}: {e}"})
+                        break
+                    if iteration >= warmup:
+                        samples[name][username].append(time.perf_counter() - start)
+            finally:
+                driver_pool.release(driver)
+    
+    return samples, failures
+
+
+def summarize_samples(samples):
+    """Médiane et p95 par parcours et utilisateur, après filtrage"""
+    summary = {}
+    for journey, by_user in samples.items():
+        summary[journey] = {}
+        for username, values in by_user.items():
+            kept = remove_outliers(values)
+            summary[journey][username] = {
+                "runs": len(values),
+                "outliers": len(values) - len(kept),
+                "median": round(percentile(kept, 50), 4),
+                "p95": round(percentile(kept, 95), 4),
+            }
+    return summary
+
+
+def compare_to_baseline(summary, baseline, threshold):
+    """Liste des régressions (médiane ou p95 au-delà de baseline × (1 + seuil))"""
+    regressions = []
+    for journey, by_user in summary.items():
+        for username, current in by_user.items():
+            reference = baseline.get(journey, {}).get(username)
+            if not reference:
+                continue
+            for metric in ("median", "p95"):
+                limit = reference[metric] * (1 + threshold)
+                if current[metric] > limit and current[metric] - reference[metric] > MIN_REGRESSION_DELTA:
+                    regressions.append({
+                        "journey": journey, "username": username, "metric": metric,
+                        "baseline": reference[metric], "current": current[metric],
+                    })
+    return regressions
+
+
+def missing_from_baseline(summary, baseline):
+    """Parcours/utilisateurs mesurés sans entrée dans la baseline (non comparables)"""
+    return [
+        {"journey": journey, "username": username}
+        for journey, by_user in summary.items()
+        for username in by_user
+        if not baseline.get(journey, {}).get(username)
+    ]
+
+
+def load_json(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
@@ -0,0 +1,60 @@
+"""
+Profils de lancement du navigateur et blocage des ressources réseau
+
+Profil "fast" (par défaut) : headless, fenêtre de taille fixe, sans
+extensions, GPU ni ralentissement des onglets en arrière-plan ; les
+requêtes tierces et analytics sont toujours bloquées. Les ressources non
+essentielles (images, polices, médias) sont bloquées test par test, sauf
+celles déclarées avec @pytest.mark.resources("images", ...).
+"""
+
+import logging
+
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+FAST_PROFILE_ARGUMENTS = [
+    "--headless=new",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--mute-audio",
+    "--no-first-run",
+]
+
+
+def is_fast_profile() -> bool:
+    return Config.BROWSER_PROFILE == "fast"
+
+
+def profile_arguments() -> list:
+    """Arguments Chrome propres au profil sélectionné"""
+    if is_fast_profile():
+        return FAST_PROFILE_ARGUMENTS + [f"--window-size={Config.WINDOW_SIZE}"]
+    return ["--headless"] if Config.HEADLESS else []
+
+
+def blocked_url_patterns(needed_resources=()) -> list:
+    """Motifs d'URL à bloquer pour un test ayant besoin de `needed_resources`"""
+    patterns = list(Config.BLOCKED_THIRD_PARTY)
+    if is_fast_profile() and Config.BLOCK_NON_ESSENTIAL:
+        for kind, kind_patterns in Config.NON_ESSENTIAL_RESOURCES.items():
+            if kind not in needed_resources:
+                patterns.extend(kind_patterns)
+    return patterns
+
+
+def apply_resource_policy(driver, needed_resources=()):
+    """Applique (via CDP) la liste de blocage la plus stricte compatible avec le test"""
+    unknown = set(needed_resources) - set(Config.NON_ESSENTIAL_RESOURCES)
+    if unknown:
+        raise ValueError(f"Ressources inconnues: {sorted(unknown)}")
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns(needed_resources)})
+    except (WebDriverException, AttributeError) as e:
+        logger.warning("Blocage des ressources indisponible: %s", e)
@@ -0,0 +1,92 @@
+"""
+Exécution concurrente d'un parcours pour plusieurs utilisateurs
+
+Chaque utilisateur dispose de son propre navigateur ; les sessions sont
+pilotées en parallèle depuis un pool de threads (les appels WebDriver
+sont bloquants sur le réseau, le GIL n'est donc pas un frein). Les
+résultats sont produits au fur et à mesure que chaque utilisateur termine :
+la durée totale est celle de l'utilisateur le plus lent.
+"""
+
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List
+
+from config.config import Config
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+from utils.journeys import JOURNEYS, PageSet
+from utils.step_timing import recorder
+
+
+class JourneyResult:
+    """Résultat du parcours d'un utilisateur"""
+    
+    def __init__(self, username):
+        self.username = username
+        self.status = "passed"
+        self.duration = 0.0
+        self.steps = []
+        self.error = None
+    
+    @property
+    def passed(self) -> bool:
+        return self.status == "passed"
+    
+    def __repr__(self):
+        return f"JourneyResult({self.username!r}, {self.status!r}, {self.duration:.2f}s)"
+
+
+class ConcurrentJourneyRunner:
+    """Pilote plusieurs navigateurs en parallèle depuis un seul processus"""
+    
+    def __init__(self, max_workers=None, driver_factory=create_driver):
+        self.max_workers = max_workers or Config.CONCURRENT_WORKERS
+        self.driver_factory = driver_factory
+    
+    def run(self, usernames: List[str],
+            journey: Dict[str, Callable] = None) -> Iterator[JourneyResult]:
+        """
+        Exécute le parcours (étapes {nom: fonction(pages, username)}) pour
+        chaque utilisateur et produit les résultats dans l'ordre d'achèvement
+        """
+        journey = journey or JOURNEYS
+        pool = DriverPool(self.driver_factory, size=self.max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers,
+                                    thread_name_prefix="journey") as executor:
+                futures = [executor.submit(self._run_user, pool, username, journey)
+                           for username in usernames]
+                for future in as_completed(futures):
+                    yield future.result()
+        finally:
+            pool.close()
+    
+    def _run_user(self, pool, username, journey) -> JourneyResult:
+        result = JourneyResult(username)
+        start = time.perf_counter()
+        driver = None
+        try:
+            # Un échec de démarrage du navigateur ne concerne que cet utilisateur
+            driver = pool.acquire()
+            with recorder.thread_context(test_id=f"concurrent::{username}", username=username):
+                pages = PageSet(driver)
+                for name, step in journey.items():
+                    if name != "login" and username in Config.LOCKED_USERS:
+                        break
+                    step_start = time.perf_counter()
+                    try:
+                        step(pages, username)
+                    finally:
+                        result.steps.append({"name": name,
+                                             "duration": round(time.perf_counter() - step_start, 3)})
+        except AssertionError as e:
+            result.status, result.error = "failed", str(e)
+        except Exception:
+            result.status, result.error = "error", traceback.format_exc()
+        finally:
+            if driver is not None:
+                pool.release(driver)
+            result.duration = round(time.perf_counter() - start, 3)
+        return result
@@ -0,0 +1,51 @@
+"""
+Création des instances WebDriver selon la configuration
+"""
+
+import atexit
+import shutil
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from config.config import Config
+from utils.browser_profile import apply_resource_policy, is_fast_profile, profile_arguments
+from utils.driver_resolver import resolve_chromedriver
+from utils.step_timing import instrument_driver
+
+
+def build_chrome_options() -> Options:
+    """Construit les options Chrome à partir de la configuration"""
+    chrome_options = Options()
+    for argument in profile_arguments():
+        chrome_options.add_argument(argument)
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"--user-data-dir={create_profile_dir()}")
+    # Logs console lisibles par driver.get_log("browser") (artefacts d'échec)
+    chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    return chrome_options
+
+
+def create_profile_dir() -> str:
+    """Crée un profil Chrome isolé pour ce navigateur (supprimé en fin de processus)"""
+    profile_dir = tempfile.mkdtemp(prefix=f"saucedemo-{Config.WORKER_ID or 'main'}-")
+    atexit.register(shutil.rmtree, profile_dir, True)
+    return profile_dir
+
+
+def create_driver():
+    """Lance un nouveau navigateur Chrome configuré"""
+    driver = webdriver.Chrome(
+        service=Service(resolve_chromedriver()),
+        options=build_chrome_options()
+    )
+    
+    instrument_driver(driver)
+    driver.implicitly_wait(0 if Config.STRICT_WAITS else Config.IMPLICIT_WAIT)
+    if Config.MAXIMIZE_WINDOW and not is_fast_profile():
+        driver.maximize_window()
+    apply_resource_policy(driver, tuple(Config.NON_ESSENTIAL_RESOURCES))
+    
+    return driver
@@ -0,0 +1,117 @@
+"""
+Pool de navigateurs partagé pendant toute la session de tests
+
+Chaque navigateur est lancé une seule fois puis prêté aux tests successifs.
+Entre deux prêts, il est réinitialisé (cookies, localStorage, retour sur
+Config.BASE_URL). Un navigateur planté ou trop utilisé est recyclé.
+"""
+
+import logging
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+CLEAR_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+class DriverPool:
+    """Pool de drivers « chauds » avec réinitialisation entre les tests"""
+    
+    def __init__(self, factory, size=None, max_uses=None):
+        self.factory = factory
+        self.size = size or Config.DRIVER_POOL_SIZE
+        self.max_uses = max_uses or Config.DRIVER_MAX_USES
+        self.stats = {"created": 0, "leased": 0, "recycled": 0}
+        self._idle = []
+        self._uses = {}
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._closed = False
+    
+    def acquire(self, timeout=None):
+        """Prête un navigateur, en le créant si le pool n'est pas plein"""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Le pool de drivers est fermé")
+                if self._idle:
+                    driver = self._idle.pop()
+                    break
+                if len(self._uses) + self._pending < self.size:
+                    driver = None
+                    self._pending += 1  # Réserve la place pendant la création
+                    break
+                if not self._condition.wait(timeout):
+                    raise TimeoutError("Aucun navigateur disponible dans le pool")
+        
+        if driver is None:
+            try:
+                driver = self.factory()
+            except Exception:
+                with self._condition:
+                    self._pending -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._pending -= 1
+                self._uses[driver] = 0
+                self.stats["created"] += 1
+        
+        with self._condition:
+            self._uses[driver] += 1
+            self.stats["leased"] += 1
+        return driver
+    
+    def release(self, driver, crashed=False):
+        """Rend un navigateur au pool après l'avoir réinitialisé"""
+        with self._condition:
+            worn_out = self._uses.get(driver, 0) >= self.max_uses
+        
+        if not crashed and not worn_out:
+            try:
+                self.reset(driver)
+            except WebDriverException as e:
+                logger.warning("Réinitialisation impossible, navigateur recyclé: %s", e)
+                crashed = True
+        
+        if crashed or worn_out:
+            self._discard(driver)
+            return
+        
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+    
+    def reset(self, driver):
+        """Remet le navigateur dans un état vierge sur la page de login"""
+        driver.get(Config.BASE_URL)
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+    
+    def close(self):
+        """Ferme tous les navigateurs du pool"""
+        with self._condition:
+            self._closed = True
+            drivers = list(self._uses)
+            self._uses.clear()
+            self._idle.clear()
+            self._condition.notify_all()
+        for driver in drivers:
+            self._quit(driver)
+    
+    def _discard(self, driver):
+        with self._condition:
+            self._uses.pop(driver, None)
+            self.stats["recycled"] += 1
+            self._condition.notify()
+        self._quit(driver)
+    
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
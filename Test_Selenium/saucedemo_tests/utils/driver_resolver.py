@@ -0,0 +1,82 @@
+"""
+Résolution du binaire chromedriver, une seule fois par session
+
+Ordre de recherche :
+    1. chemin explicite (argument ou Config.CHROMEDRIVER_PATH)
+    2. chromedriver présent dans le PATH
+    3. cache disque indexé par la version majeure du navigateur
+    4. webdriver-manager (réseau), dont le résultat est copié dans le cache
+
+Les étapes 1 à 3 ne font aucun accès réseau : avec Config.OFFLINE,
+l'étape 4 est interdite et une erreur explicite est levée.
+"""
+
+import functools
+import logging
+import os
+import shutil
+import sys
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+DRIVER_NAME = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+
+@functools.lru_cache(maxsize=None)
+def detect_browser_version():
+    """Retourne la version majeure de Chrome installée (sans réseau), ou None"""
+    from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+    
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.debug("Version du navigateur introuvable: %s", e)
+        return None
+    return version.split(".")[0] if version else None
+
+
+def cached_driver_path(browser_version):
+    """Chemin du chromedriver mis en cache pour une version de navigateur"""
+    return os.path.join(Config.DRIVER_CACHE_DIR, browser_version or "unknown", DRIVER_NAME)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver(explicit_path=None) -> str:
+    """Trouve un chromedriver local, ou le télécharge une fois par machine"""
+    explicit_path = explicit_path or Config.CHROMEDRIVER_PATH
+    if explicit_path:
+        if not os.path.isfile(explicit_path):
+            raise FileNotFoundError(f"chromedriver introuvable: {explicit_path}")
+        return explicit_path
+    
+    on_path = shutil.which(DRIVER_NAME)
+    if on_path:
+        logger.info("chromedriver trouvé dans le PATH: %s", on_path)
+        return on_path
+    
+    browser_version = detect_browser_version()
+    cached = cached_driver_path(browser_version)
+    if os.path.isfile(cached):
+        logger.info("chromedriver trouvé dans le cache: %s", cached)
+        return cached
+    
+    if Config.OFFLINE:
+        raise RuntimeError(
+            f"Mode hors-ligne: aucun chromedriver local pour Chrome {browser_version}. "
+            f"Définir CHROMEDRIVER_PATH ou déposer le binaire dans {cached}"
+        )
+    
+    return _download_to_cache(cached)
+
+
+def _download_to_cache(cached):
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    downloaded = ChromeDriverManager().install()
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    shutil.copy2(downloaded, cached)
+    os.chmod(cached, 0o755)
+    logger.info("chromedriver téléchargé et mis en cache: %s", cached)
+    return cached
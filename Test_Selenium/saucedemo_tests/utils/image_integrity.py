@@ -0,0 +1,166 @@
+"""
+Intégrité des images produits sans capture d'écran
+
+Un seul script lit, pour chaque image de la page (inventaire ou détails),
+l'état réel de chargement (complete, naturalWidth/naturalHeight) une fois
+les images terminées. Les URL sont ensuite vérifiées en parallèle par un
+client HTTP à connexions réutilisées, avec un cache par URL partagé par
+toute la session : les mêmes fichiers ne sont téléchargés qu'une fois quel
+que soit le nombre d'utilisateurs testés.
+
+Le tableau d'intégrité (une ligne par produit) signale les images non
+chargées, les réponses HTTP en erreur, les images qui ne correspondent pas
+au produit (Config.EXPECTED_PRODUCTS) et celles partagées entre produits :
+c'est ce qui distingue problem_user, dont les images s'affichent toutes.
+"""
+
+import hashlib
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from config.config import Config
+
+# État de chaque image après chargement (ou erreur, ou délai dépassé) :
+# [nom du produit, src, complete, naturalWidth, naturalHeight]
+IMAGE_STATES_SCRIPT = """
+const [sel, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const containers = sel.item ? Array.from(document.querySelectorAll(sel.item)) : [document];
+const rows = containers.map((container) => [container.querySelector(sel.name), container.querySelector(sel.image)]);
+const settled = (img) => img.complete ? Promise.resolve() : new Promise((resolve) => {
+    img.addEventListener('load', resolve, {once: true});
+    img.addEventListener('error', resolve, {once: true});
+});
+Promise.race([
+    Promise.all(rows.filter(([, img]) => img).map(([, img]) => settled(img))),
+    new Promise((resolve) => setTimeout(resolve, timeout)),
+]).then(() => done(rows.map(([name, img]) => [
+    name ? name.innerText.trim() : null,
+    img ? (img.currentSrc || img.src) : null,
+    img ? img.complete : false,
+    img ? img.naturalWidth : 0,
+    img ? img.naturalHeight : 0,
+])));
+"""
+
+IMAGE_STATE_COLUMNS = ("name", "src", "complete", "natural_width", "natural_height")
+
+
+class ImageProbe:
+    """Client HTTP à connexions réutilisées par thread, avec cache par URL"""
+    
+    def __init__(self, workers=None, timeout=None):
+        self.workers = workers or Config.IMAGE_PROBE_WORKERS
+        self.timeout = timeout or Config.EXPLICIT_WAIT
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = None
+    
+    def probe_many(self, urls) -> dict:
+        """
+        Vérifie plusieurs URL en parallèle (une seule requête par URL et par session)
+        
+        Returns:
+            {url: {status, content_type, bytes, digest, error}}
+        """
+        futures = {}
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="image-probe")
+            for url in dict.fromkeys(urls):
+                if url not in self._cache:
+                    self._cache[url] = self._executor.submit(self._fetch, url)
+                futures[url] = self._cache[url]
+        return {url: future.result() for url, future in futures.items()}
+    
+    def _connection(self, parts, fresh=False):
+        """Connexion persistante du thread courant vers un hôte"""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (parts.scheme, parts.hostname, parts.port)
+        if fresh or key not in connections:
+            factory = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            connections[key] = factory(parts.hostname, parts.port, timeout=self.timeout)
+        return connections[key]
+    
+    def _fetch(self, url) -> dict:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            return {"status": None, "content_type": None, "bytes": 0, "digest": None,
+                    "error": f"URL non HTTP: {parts.scheme or url}"}
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        # Une connexion réutilisée a pu être fermée par le serveur : un nouvel essai
+        for attempt in range(2):
+            connection = self._connection(parts, fresh=attempt > 0)
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                error = str(e)
+        else:
+            return {"status": None, "content_type": None, "bytes": 0, "digest": None, "error": error}
+        return {
+            "status": response.status,
+            "content_type": response.getheader("Content-Type", "").split(";")[0],
+            "bytes": len(body),
+            "digest": hashlib.sha256(body).hexdigest(),
+            "error": None,
+        }
+    
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            self._cache.clear()
+
+
+def build_integrity_table(states, page="inventory", probe=None) -> list:
+    """
+    Tableau d'intégrité : une ligne par produit, avec les problèmes détectés
+    
+    Args:
+        states: lignes de IMAGE_STATES_SCRIPT
+        page: « inventory » ou « detail » (colonne informative)
+    """
+    probe = probe or image_probe
+    rows = [dict(zip(IMAGE_STATE_COLUMNS, state), page=page) for state in states]
+    responses = probe.probe_many(row["src"] for row in rows if row["src"])
+    expected_images = {product["name"]: product["image"] for product in Config.EXPECTED_PRODUCTS}
+    
+    by_digest = {}
+    for row in rows:
+        row.update(responses.get(row["src"]) or {"status": None, "content_type": None, "bytes": 0,
+                                                 "digest": None, "error": "aucune image"})
+        row["expected_image"] = expected_images.get(row["name"])
+        if row["digest"]:
+            by_digest.setdefault(row["digest"], []).append(row["name"])
+    
+    for row in rows:
+        problems = []
+        if row["error"]:
+            problems.append(row["error"])
+        elif row["status"] != 200:
+            problems.append(f"HTTP {row['status']}")
+        elif not row["content_type"].startswith("image/"):
+            problems.append(f"type {row['content_type']}")
+        if not row["complete"] or not row["natural_width"]:
+            problems.append("non chargée")
+        if row["expected_image"] and row["src"] and row["expected_image"] not in row["src"]:
+            problems.append(f"image inattendue (attendu {row['expected_image']})")
+        shared = [name for name in by_digest.get(row["digest"], ()) if name != row["name"]]
+        if shared:
+            problems.append(f"partagée avec: {', '.join(shared)}")
+        row["problems"] = problems
+        row["ok"] = not problems
+    return rows
+
+
+image_probe = ImageProbe()
@@ -0,0 +1,230 @@
+"""
+Moteur de parcours déclaratifs exécutés par les Page Objects
+
+Les parcours sont décrits en JSON (Config.JOURNEYS_FILE) : une liste
+d'étapes {"action": ..., paramètres}, avec des lignes de données ("rows",
+"id" optionnel pour nommer le cas) et/ou une matrice de valeurs ("matrix")
+qui démultiplient chaque parcours.
+Les paramètres peuvent utiliser les variables de la ligne ("{filter}") et
+des références aux données partagées avec Playwright
+("$steps.filters.{filter}.value", voir utils/shared_data.py).
+
+Le fichier est compilé une seule fois par session : variables substituées,
+références résolues et paramètres vérifiés contre la signature de chaque
+action. Une erreur de données échoue donc à la collecte, pas au milieu
+d'un test ; ajouter des cas ne demande aucune nouvelle fonction de test.
+"""
+
+import functools
+import inspect
+import itertools
+import json
+import re
+
+from config.config import Config
+from utils.shared_data import resolve
+
+VARIABLE_PATTERN = re.compile(r"\{(\w+)\}")
+
+# Actions disponibles : nom → fonction(pages, auth_states, **paramètres)
+ACTIONS = {}
+
+
+def action(name):
+    """Enregistre une fonction comme action utilisable dans les parcours"""
+    def register(func):
+        ACTIONS[name] = func
+        return func
+    return register
+
+
+class CompiledJourney:
+    """Parcours prêt à l'exécution : une ligne de données, étapes résolues"""
+    
+    def __init__(self, name, params, steps):
+        self.name = name
+        self.params = params
+        self.steps = steps  # [(action, fonction, paramètres)]
+    
+    @property
+    def id(self) -> str:
+        if not self.params:
+            return self.name
+        label = self.params.get("id") or "-".join(str(v) for v in self.params.values())
+        return f"{self.name}[{label}]"
+    
+    def __repr__(self):
+        return f"CompiledJourney({self.id!r}, {len(self.steps)} étapes)"
+
+
+# ----- Compilation -----
+
+def _substitute(value, params):
+    """Remplace les variables {nom} de la ligne dans toutes les chaînes"""
+    if isinstance(value, str):
+        def replace(match):
+            name = match.group(1)
+            if name not in params:
+                raise KeyError(f"Variable inconnue: {{{name}}}")
+            return str(params[name])
+        return VARIABLE_PATTERN.sub(replace, value)
+    if isinstance(value, list):
+        return [_substitute(v, params) for v in value]
+    if isinstance(value, dict):
+        return {k: _substitute(v, params) for k, v in value.items()}
+    return value
+
+
+def _expand_rows(definition):
+    """Lignes de données (rows) × combinaisons de la matrice"""
+    rows = definition.get("rows") or [{}]
+    matrix = definition.get("matrix") or {}
+    names = list(matrix)
+    for row in rows:
+        for values in itertools.product(*(matrix[name] for name in names)):
+            yield dict(row, **dict(zip(names, values)))
+
+
+def _compile_step(step, params):
+    step = dict(step)
+    name = step.pop("action", None)
+    func = ACTIONS.get(name)
+    if func is None:
+        raise ValueError(f"Action inconnue: {name!r} (disponibles: {', '.join(sorted(ACTIONS))})")
+    kwargs = resolve(_substitute(step, params))
+    try:
+        inspect.signature(func).bind(None, None, **kwargs)
+    except TypeError as e:
+        raise ValueError(f"Paramètres invalides pour '{name}': {e}") from e
+    return name, func, kwargs
+
+
+def compile_definitions(definitions):
+    """Compile une liste de parcours JSON en CompiledJourney (une par ligne de données)"""
+    compiled = []
+    for definition in definitions:
+        for params in _expand_rows(definition):
+            try:
+                steps = [_compile_step(step, params) for step in definition["steps"]]
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"Parcours '{definition.get('name')}' {params}: {e}") from e
+            compiled.append(CompiledJourney(definition["name"], params, steps))
+    return compiled
+
+
+@functools.lru_cache(maxsize=None)
+def compile_journeys(path=None):
+    """Parcours du fichier JSON, compilés une seule fois par session"""
+    with open(path or Config.JOURNEYS_FILE, encoding="utf-8") as f:
+        definitions = json.load(f)["journeys"]
+    return tuple(compile_definitions(definitions))
+
+
+def run_journey(journey, pages, auth_states=None):
+    """Exécute les étapes d'un parcours ; l'AssertionError indique l'étape en échec"""
+    for index, (name, func, kwargs) in enumerate(journey.steps, 1):
+        try:
+            func(pages, auth_states, **kwargs)
+        except AssertionError as e:
+            raise AssertionError(f"{journey.id} - étape {index} ({name}): {e}") from e
+
+
+# ----- Actions -----
+
+@action("open_login")
+def open_login(pages, auth_states):
+    pages.login.navigate()
+
+
+@action("login")
+def login(pages, auth_states, username, password=None, timeout=10):
+    """Connexion réussie attendue (session réinjectée si déjà capturée)"""
+    if auth_states is not None and password in (None, Config.PASSWORD):
+        assert auth_states.login(pages.login, username, timeout=timeout), \
+            f"Connexion échouée pour {username}"
+        return
+    pages.login.navigate()
+    pages.login.login(username, password)
+    assert pages.login.is_login_successful(timeout=timeout), f"Connexion échouée pour {username}"
+
+
+@action("submit_login")
+def submit_login(pages, auth_states, username="", password=""):
+    """Soumet le formulaire tel quel (champs vides autorisés)"""
+    pages.login.navigate()
+    if username:
+        pages.login.enter_username(username)
+    if password:
+        pages.login.enter_password(password)
+    pages.login.click_login_button()
+
+
+@action("expect_login_error")
+def expect_login_error(pages, auth_states, message):
+    assert pages.login.is_error_displayed(), "Aucun message d'erreur affiché"
+    error = pages.login.get_error_message()
+    assert error == message, f"Message attendu '{message}', obtenu '{error}'"
+
+
+@action("sort")
+def sort(pages, auth_states, value):
+    pages.inventory.sort_by(value)
+
+
+# Clé de comparaison et sens de chaque tri
+SORT_ORDERS = {
+    "az": ("name", False),
+    "za": ("name", True),
+    "lohi": ("price", False),
+    "hilo": ("price", True),
+}
+
+
+@action("expect_sorted")
+def expect_sorted(pages, auth_states, value):
+    key, descending = SORT_ORDERS[value]
+    values = pages.inventory.get_product_names() if key == "name" else pages.inventory.get_product_prices()
+    assert values == sorted(values, reverse=descending), f"Produits non triés ({value}): {values}"
+
+
+@action("add_to_cart")
+def add_to_cart(pages, auth_states, products):
+    for product in [products] if isinstance(products, str) else products:
+        pages.inventory.add_product_to_cart_by_name(product)
+
+
+@action("expect_cart_count")
+def expect_cart_count(pages, auth_states, count):
+    actual = pages.inventory.get_cart_item_count()
+    assert actual == count, f"Panier: {actual} article(s), attendu {count}"
+
+
+@action("open_cart")
+def open_cart(pages, auth_states):
+    pages.inventory.open_shopping_cart()
+
+
+@action("expect_cart_items")
+def expect_cart_items(pages, auth_states, products):
+    names = pages.checkout.get_cart_item_names()
+    assert sorted(names) == sorted(products), f"Panier: {names}, attendu {products}"
+
+
+@action("checkout")
+def checkout(pages, auth_states, customer):
+    """Panier ouvert → informations client → récapitulatif → confirmation"""
+    if "/cart.html" not in pages.checkout.get_current_url():
+        pages.inventory.open_shopping_cart()
+    pages.checkout.start_checkout()
+    pages.checkout.fill_information(customer["firstName"], customer["lastName"], customer["postalCode"])
+    pages.checkout.continue_to_overview()
+    pages.checkout.finish()
+
+
+@action("expect_confirmation")
+def expect_confirmation(pages, auth_states, message, text=None):
+    confirmation = pages.checkout.get_confirmation()
+    assert confirmation["header"] == message, \
+        f"Confirmation attendue '{message}', obtenue '{confirmation['header']}'"
+    if text is not None:
+        assert confirmation["text"] == text, f"Texte de confirmation inattendu: {confirmation['text']}"
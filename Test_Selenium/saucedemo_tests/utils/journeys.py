@@ -0,0 +1,63 @@
+"""
+Parcours utilisateur réutilisables, construits sur les Page Objects
+
+Chaque parcours est une fonction (pages, username) qui lève une
+AssertionError si l'application ne se comporte pas comme attendu.
+"""
+
+from config.config import Config
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from pages.product_detail_page import ProductDetailPage
+from pages.checkout_page import CheckoutPage
+
+DETAIL_PRODUCT = "Sauce Labs Backpack"
+
+
+class PageSet:
+    """Les Page Objects d'un même navigateur"""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.login = LoginPage(driver)
+        self.inventory = InventoryPage(driver)
+        self.detail = ProductDetailPage(driver)
+        self.checkout = CheckoutPage(driver)
+
+
+def login_journey(pages, username):
+    """Connexion via le formulaire (message d'erreur attendu pour un user bloqué)"""
+    pages.login.navigate()
+    pages.login.login(username)
+    if username in Config.LOCKED_USERS:
+        assert pages.login.is_error_displayed(), f"Message d'erreur attendu pour {username}"
+    else:
+        assert pages.login.is_login_successful(timeout=15), f"Connexion échouée pour {username}"
+
+
+def inventory_scrape_journey(pages, username):
+    """Extraction complète de l'inventaire (sans cache)"""
+    products = pages.inventory.get_all_products(refresh=True)
+    assert len(products) == len(Config.EXPECTED_PRODUCTS), \
+        f"{len(products)} produits trouvés pour {username}"
+
+
+def detail_navigation_journey(pages, username):
+    """Inventaire → page de détails"""
+    pages.inventory.click_product_by_name(DETAIL_PRODUCT)
+    assert pages.detail.is_on_detail_page(), f"Pas sur la page de détails pour {username}"
+
+
+def back_navigation_journey(pages, username):
+    """Page de détails → inventaire"""
+    pages.detail.back_to_products()
+    assert pages.inventory.is_on_inventory_page(), f"Pas revenu à l'inventaire pour {username}"
+
+
+# Parcours enchaînés dans cet ordre à chaque itération
+JOURNEYS = {
+    "login": login_journey,
+    "inventory_scrape": inventory_scrape_journey,
+    "detail_navigation": detail_navigation_journey,
+    "back_navigation": back_navigation_journey,
+}
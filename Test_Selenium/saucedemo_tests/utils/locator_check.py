@@ -0,0 +1,123 @@
+"""
+Validation des locators au démarrage de la session
+
+Par défaut, les locators de chaque Page Object sont vérifiés sur des
+snapshots HTML statiques produits par les gabarits du serveur local
+(mêmes ids, classes et data-test que www.saucedemo.com) : un seul
+aller-retour par snapshot, analysé par DOMParser dans un navigateur du
+pool, sans connexion ni navigation. Un sélecteur périmé fait échouer la
+session immédiatement, avec la liste complète des locators en cause, au
+lieu d'un timeout de 15 s au milieu d'un test.
+
+La vérification sur l'application cible (login → inventaire → détail)
+reste disponible sur demande (Config.VALIDATE_LOCATORS_LIVE).
+"""
+
+from config.config import Config
+from local_server import pages as templates
+from local_server.catalog import PRODUCTS
+from pages.checkout_page import CheckoutPage  # noqa: F401 - enregistre ses locators
+from pages.inventory_page import InventoryPage
+from pages.locators import StaleLocatorError, registry
+from pages.login_page import LoginPage
+from pages.product_detail_page import ProductDetailPage
+
+
+def page_snapshots(username="standard_user") -> dict:
+    """
+    Snapshots HTML de chaque Page Object, rendus par le serveur local
+
+    Returns:
+        {nom de la page: [html, ...]} - plusieurs écrans pour une même page
+    """
+    return {
+        "LoginPage": [templates.render_login(Config.USERS, Config.PASSWORD, Config.LOCKED_USERS)],
+        "InventoryPage": [templates.render_inventory(username)],
+        "ProductDetailPage": [templates.render_item(username, PRODUCTS[0])],
+        "CheckoutPage": [
+            templates.render_cart(username),
+            templates.render_checkout_info(username),
+            templates.render_checkout_overview(username),
+            templates.render_checkout_complete(username),
+        ],
+    }
+
+
+def check_locator_snapshots(driver_pool, snapshots=None) -> dict:
+    """
+    Valide les locators de toutes les pages du registre sur leurs snapshots
+    HTML ; un locator est périmé s'il n'est trouvé dans aucun écran de sa
+    page, et une page qui déclare des locators sans snapshot est signalée
+
+    Returns:
+        {page: nombre de locators vérifiés}
+
+    Raises:
+        StaleLocatorError: si un locator obligatoire est introuvable ou invalide
+    """
+    snapshots = page_snapshots() if snapshots is None else snapshots
+    problems = {}
+    checked = {}
+    
+    for page in sorted({locator.page for locator in registry.locators.values()} - set(snapshots)):
+        problems[f"{page}.*"] = "aucun snapshot HTML (utils/locator_check.py: page_snapshots)"
+    
+    driver = driver_pool.acquire()
+    try:
+        for page, documents in snapshots.items():
+            checked[page] = len(registry.for_page(page))
+            found = [registry.validate(driver, page, html=html) for html in documents]
+            missing = set.intersection(*(set(result) for result in found))
+            problems.update((key, found[0][key]) for key in missing)
+    finally:
+        driver_pool.release(driver)
+    
+    _raise_if_stale(problems)
+    return checked
+
+
+def check_page_locators(driver_pool, auth_states, username="standard_user") -> dict:
+    """
+    Valide les locators de chaque page sur l'application cible (connexion et
+    navigation réelles, voir Config.VALIDATE_LOCATORS_LIVE)
+
+    Returns:
+        {page: nombre de locators vérifiés}
+
+    Raises:
+        StaleLocatorError: si un locator obligatoire est introuvable ou invalide
+    """
+    problems = {}
+    checked = {}
+    
+    def validate(page):
+        checked[page.__name__] = len(registry.for_page(page))
+        problems.update(registry.validate(driver, page))
+    
+    driver = driver_pool.acquire()
+    try:
+        login_page = LoginPage(driver)
+        login_page.navigate()
+        login_page.find_element(*LoginPage.USERNAME_INPUT)
+        validate(LoginPage)
+        
+        assert auth_states.login(login_page, username), f"La connexion a échoué pour {username}"
+        inventory_page = InventoryPage(driver)
+        products = inventory_page.get_all_products()
+        validate(InventoryPage)
+        
+        if products:
+            inventory_page.click_product_by_name(products[0]['name'])
+            ProductDetailPage(driver).is_on_detail_page()
+            validate(ProductDetailPage)
+    finally:
+        driver_pool.release(driver)
+    
+    _raise_if_stale(problems)
+    return checked
+
+
+def _raise_if_stale(problems):
+    if problems:
+        details = "\n".join(f"  {key}: {message}" for key, message in sorted(problems.items()))
+        raise StaleLocatorError(f"Locators périmés:\n{details}")
@@ -0,0 +1,304 @@
+"""
+Enregistrement et rejeu du trafic HTTP des parcours
+
+Un proxy local prend la place de Config.BASE_URL (comme le serveur local) :
+    * record : chaque requête est relayée vers le site réel et la réponse
+      (statut, en-têtes, octets) est archivée, étiquetée avec le parcours
+      du navigateur qui l'a émise (en-tête X-SauceDemo-Journey, posé par
+      CDP : voir tag_journey) ; sans en-tête, avec le parcours de session
+      explicite SESSION_JOURNEY ;
+    * replay : les réponses sont servies depuis l'archive, à l'identique,
+      sans aucun accès réseau, avec une latence ajoutée configurable.
+L'archive est un seul fichier JSON compressé ; les corps identiques
+(bundles JS, images) n'y sont stockés qu'une fois. En exécution parallèle
+(run_parallel.py), chaque worker enregistre sa propre archive
+(saucedemo.gw0.json.gz...) ; le rejeu fusionne toutes les archives. Les requêtes vers
+d'autres domaines ne passent pas par le proxy (les tiers sont bloqués par
+le profil navigateur, voir utils/browser_profile.py).
+"""
+
+import base64
+import glob
+import gzip
+import hashlib
+import http.client
+import json
+import logging
+import os
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay")
+
+# En-têtes propres à une connexion (ou ajoutés par le proxy lui-même),
+# jamais archivés ni relayés
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te",
+    "trailer", "transfer-encoding", "upgrade", "content-length", "content-encoding",
+    "server", "date",
+}
+
+ARCHIVE_SUFFIX = ".json.gz"
+
+# Parcours de chaque requête, ajouté par le navigateur et retiré avant relais
+JOURNEY_HEADER = "X-SauceDemo-Journey"
+# Requêtes sans parcours (travail de session, navigateurs hors test)
+SESSION_JOURNEY = "session::untagged"
+
+ARCHIVE_VERSION = 1
+
+
+def worker_archive_path(path, worker):
+    """Archive propre à un worker parallèle : saucedemo.json.gz → saucedemo.gw0.json.gz"""
+    if path.endswith(ARCHIVE_SUFFIX):
+        return f"{path[:-len(ARCHIVE_SUFFIX)]}.{worker}{ARCHIVE_SUFFIX}"
+    return f"{path}.{worker}"
+
+
+def tag_journey(driver, journey):
+    """Ajoute l'en-tête de parcours à toutes les requêtes suivantes du navigateur (CDP)"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": {JOURNEY_HEADER: journey}})
+    except (WebDriverException, AttributeError) as e:
+        logger.warning("Étiquetage réseau indisponible (%s), requêtes classées en %s", e, SESSION_JOURNEY)
+
+
+def archive_paths(path) -> list:
+    """Archive principale (si elle existe) puis archives des workers, dans cet ordre"""
+    paths = [path] if os.path.exists(path) else []
+    return paths + sorted(glob.glob(worker_archive_path(glob.escape(path), "*")))
+
+
+class NetworkArchive:
+    """Réponses archivées, indexées par (méthode, chemin) et par parcours"""
+    
+    def __init__(self, upstream=None):
+        self.upstream = upstream
+        self.entries = []
+        self.bodies = {}
+        self._index = {}
+        self._lock = threading.Lock()
+    
+    def add(self, journey, method, path, status, headers, body, elapsed):
+        digest = hashlib.sha256(body).hexdigest()
+        entry = {
+            "journey": journey, "method": method, "path": path, "status": status,
+            "headers": headers, "body": digest, "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            self.bodies.setdefault(digest, body)
+            self.entries.append(entry)
+            self._index.setdefault((method, path), []).append(entry)
+    
+    def find(self, journey, method, path):
+        """Réponse enregistrée pendant le même parcours si possible, sinon la première"""
+        with self._lock:
+            candidates = self._index.get((method, path), [])
+            for entry in candidates:
+                if entry["journey"] == journey:
+                    return entry
+            return candidates[0] if candidates else None
+    
+    def body(self, entry) -> bytes:
+        return self.bodies[entry["body"]]
+    
+    def save(self, path):
+        """Écrit l'archive (JSON compressé, corps dédupliqués en base64)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock:
+            data = {
+                "version": ARCHIVE_VERSION,
+                "upstream": self.upstream,
+                "entries": self.entries,
+                "bodies": {digest: base64.b64encode(body).decode("ascii")
+                           for digest, body in self.bodies.items()},
+            }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+    
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Version d'archive non supportée: {data.get('version')}")
+        archive = cls(data["upstream"])
+        archive.bodies = {digest: base64.b64decode(body) for digest, body in data["bodies"].items()}
+        for entry in data["entries"]:
+            archive.entries.append(entry)
+            archive._index.setdefault((entry["method"], entry["path"]), []).append(entry)
+        return archive
+    
+    def merge(self, other):
+        """Ajoute les réponses d'une autre archive (celles déjà présentes restent prioritaires)"""
+        with self._lock:
+            self.bodies.update({digest: body for digest, body in other.bodies.items()
+                                if digest not in self.bodies})
+            for entry in other.entries:
+                self.entries.append(entry)
+                self._index.setdefault((entry["method"], entry["path"]), []).append(entry)
+    
+    @classmethod
+    def load_all(cls, path):
+        """Archive principale fusionnée avec celles des workers parallèles"""
+        paths = archive_paths(path)
+        if not paths:
+            raise FileNotFoundError(f"Aucune archive réseau: {path}")
+        archive = cls.load(paths[0])
+        for other in paths[1:]:
+            archive.merge(cls.load(other))
+        return archive
+    
+    def stats(self) -> dict:
+        return {
+            "responses": len(self.entries),
+            "bodies": len(self.bodies),
+            "bytes": sum(len(body) for body in self.bodies.values()),
+        }
+
+
+class ArchiveHandler(BaseHTTPRequestHandler):
+    """Relaie (record) ou rejoue (replay) chaque requête"""
+    
+    server_version = "SauceDemoNetworkArchive/1.0"
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        self._handle()
+    
+    do_HEAD = do_POST = do_PUT = do_DELETE = do_OPTIONS = do_GET
+    
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+    
+    def _handle(self):
+        proxy = self.server.proxy
+        journey = self.headers.get(JOURNEY_HEADER) or proxy.journey
+        if proxy.mode == "record":
+            status, headers, body = self._forward(proxy, journey)
+        else:
+            entry = proxy.archive.find(journey, self.command, self.path)
+            if entry is None:
+                proxy.misses.append({"journey": journey, "method": self.command, "path": self.path})
+                message = f"Absent de l'archive: {self.command} {self.path}".encode("utf-8")
+                status, headers, body = HTTPStatus.GATEWAY_TIMEOUT, [["Content-Type", "text/plain"]], message
+            else:
+                status, headers, body = entry["status"], entry["headers"], proxy.archive.body(entry)
+            if proxy.latency:
+                time.sleep(proxy.latency)
+        
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+    
+    def _forward(self, proxy, journey):
+        """Relaie la requête vers le site réel et archive la réponse"""
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else None
+        excluded = HOP_BY_HOP_HEADERS | {"host", "accept-encoding", JOURNEY_HEADER.lower()}
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in excluded}
+        
+        start = time.perf_counter()
+        connection = proxy.connect()
+        try:
+            connection.request(self.command, self.path, body=request_body, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+            status = response.status
+            response_headers = [
+                [name, proxy.rewrite_header(name, value)]
+                for name, value in response.getheaders()
+                if name.lower() not in HOP_BY_HOP_HEADERS
+            ]
+        finally:
+            connection.close()
+        proxy.archive.add(journey, self.command, self.path, status, response_headers,
+                          body, time.perf_counter() - start)
+        return status, response_headers, body
+
+
+class NetworkArchiveProxy:
+    """Proxy local d'enregistrement / de rejeu démarré dans un thread"""
+    
+    def __init__(self, mode, path=None, upstream=None, latency=None, host="127.0.0.1"):
+        if mode not in MODES:
+            raise ValueError(f"Mode réseau inconnu: {mode} (attendu: {', '.join(MODES)})")
+        self.mode = mode
+        self.path = path or Config.NETWORK_ARCHIVE
+        if mode == "record" and Config.WORKER_ID:
+            # Une archive par worker : aucun worker n'écrase celle des autres
+            self.path = worker_archive_path(self.path, Config.WORKER_ID)
+        self.latency = Config.NETWORK_LATENCY if latency is None else latency
+        self.host = host
+        self.journey = SESSION_JOURNEY
+        self.misses = []
+        if mode == "replay":
+            self.archive = NetworkArchive.load_all(self.path)
+        else:
+            self.archive = NetworkArchive(upstream or Config.BASE_URL)
+        self._upstream = urlsplit(self.archive.upstream)
+        self._httpd = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self._httpd.server_address[1]}/"
+    
+    def start(self) -> str:
+        """Démarre le proxy et retourne l'URL à utiliser comme BASE_URL"""
+        self._httpd = ThreadingHTTPServer((self.host, 0), ArchiveHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.proxy = self
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        logger.info("Proxy réseau (%s) sur %s → %s", self.mode, self.base_url, self.archive.upstream)
+        return self.base_url
+    
+    def stop(self):
+        """Arrête le proxy ; en mode record, écrit l'archive"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self.mode == "record" and self.archive.entries:
+            self.archive.save(self.path)
+    
+    def begin_journey(self, journey):
+        """Parcours des requêtes sans en-tête de parcours (clients HTTP hors navigateur)"""
+        self.journey = journey
+    
+    def connect(self):
+        """Connexion vers le site réel (mode record uniquement)"""
+        port = self._upstream.port
+        if self._upstream.scheme == "https":
+            return http.client.HTTPSConnection(self._upstream.hostname, port, timeout=Config.EXPLICIT_WAIT)
+        return http.client.HTTPConnection(self._upstream.hostname, port, timeout=Config.EXPLICIT_WAIT)
+    
+    def rewrite_header(self, name, value):
+        """Redirections vers le site réel ramenées sur le proxy ; cookies sans domaine"""
+        lower = name.lower()
+        if lower == "location" and value.startswith(self.archive.upstream):
+            return "/" + value[len(self.archive.upstream):]
+        if lower == "set-cookie":
+            return "; ".join(part for part in value.split(";")
+                             if not part.strip().lower().startswith("domain="))
+        return value
+    
+    def summary(self) -> str:
+        stats = self.archive.stats()
+        text = (f"Réseau {self.mode}: {stats['responses']} réponse(s), {stats['bodies']} corps "
+                f"({stats['bytes'] / 1024:.0f} Ko) - {self.path}")
+        if self.misses:
+            text += f" ; {len(self.misses)} requête(s) absente(s) de l'archive"
+        return text
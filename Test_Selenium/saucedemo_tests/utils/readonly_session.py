@@ -0,0 +1,105 @@
+"""
+Session authentifiée partagée par des tests qui ne font que lire l'inventaire
+
+Une seule connexion pour toute une classe de tests : avant chaque test, la
+page est ramenée sur /inventory.html et l'état modifiable (panier, tri) est
+comparé à celui capturé après la connexion. Si un test l'a modifié, ou si la
+session a été perdue, une session neuve est ouverte ; sinon le navigateur
+est réutilisé tel quel.
+"""
+
+import logging
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.browser_profile import apply_resource_policy
+
+logger = logging.getLogger(__name__)
+
+
+class ReadOnlySession:
+    """Navigateur connecté prêté successivement à plusieurs tests en lecture seule"""
+    
+    def __init__(self, driver_pool, auth_states, username="standard_user"):
+        self.driver_pool = driver_pool
+        self.auth_states = auth_states
+        self.username = username
+        self.driver = None
+        self.stats = {"sessions": 0, "reused": 0, "renewed": 0}
+        self._baseline = None
+        self._resources = None
+    
+    def prepare(self, needed_resources=()):
+        """Retourne le navigateur prêt sur l'inventaire pour le prochain test"""
+        if self.driver is None:
+            self._open(needed_resources)
+            return self.driver
+        
+        try:
+            state = self._restore(needed_resources)
+        except WebDriverException as e:
+            logger.warning("Navigateur de la session lecture seule inutilisable: %s", e)
+            self.stats["renewed"] += 1
+            self._release(crashed=True)
+            self._open(needed_resources)
+            return self.driver
+        
+        if self._is_untouched(state):
+            self.stats["reused"] += 1
+            return self.driver
+        
+        logger.warning("Session lecture seule modifiée (%s), ouverture d'une session neuve",
+                       self._describe_changes(state))
+        self.stats["renewed"] += 1
+        self._release()
+        self._open(needed_resources)
+        return self.driver
+    
+    def close(self):
+        """Rend le navigateur au pool (réinitialisé pour les tests suivants)"""
+        self._release()
+    
+    def _open(self, needed_resources):
+        self.driver = self.driver_pool.acquire()
+        self._apply_resources(needed_resources)
+        login_page = LoginPage(self.driver)
+        assert self.auth_states.login(login_page, self.username), \
+            f"La connexion a échoué pour {self.username}"
+        self._baseline = InventoryPage(self.driver).get_mutable_state()
+        self.stats["sessions"] += 1
+    
+    def _release(self, crashed=False):
+        if self.driver is not None:
+            self.driver_pool.release(self.driver, crashed=crashed)
+        self.driver = None
+        self._baseline = None
+        self._resources = None
+    
+    def _apply_resources(self, needed_resources):
+        """Change la liste de blocage ; True si la page doit être rechargée"""
+        needed_resources = tuple(sorted(needed_resources))
+        if needed_resources == self._resources:
+            return False
+        apply_resource_policy(self.driver, needed_resources)
+        self._resources = needed_resources
+        return True
+    
+    def _restore(self, needed_resources) -> dict:
+        """Ramène le navigateur sur l'inventaire (rechargé si nécessaire)"""
+        inventory = InventoryPage(self.driver)
+        reload = self._apply_resources(needed_resources)
+        if reload or not inventory.is_on_inventory_page():
+            inventory.navigate_to(LoginPage(self.driver).inventory_url)
+        try:
+            return inventory.get_mutable_state()
+        except TimeoutException:
+            return {"url": inventory.get_current_url()}  # Session perdue (retour au login)
+    
+    def _is_untouched(self, state) -> bool:
+        return all(state.get(key) == self._baseline[key] for key in ("cart", "badge", "sort", "order"))
+    
+    def _describe_changes(self, state) -> str:
+        changed = [key for key in ("cart", "badge", "sort", "order")
+                   if state.get(key) != self._baseline[key]]
+        return ", ".join(changed)
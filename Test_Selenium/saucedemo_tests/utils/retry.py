@@ -0,0 +1,119 @@
+"""
+Relances courtes et typées des actions des Page Objects, et rapport des instabilités
+
+Seules les erreurs transitoires connues sont relancées (élément périmé après
+un re-rendu, clic intercepté par un élément en superposition), avec un
+délai court et aléatoire (« full jitter ») plutôt qu'un timeout complet.
+Chaque relance est enregistrée : le rapport de fin de session indique les
+locators et étapes instables et le temps perdu en relances.
+"""
+
+import random
+import threading
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+)
+from config.config import Config
+from utils.artifacts import SessionReport
+from utils.step_timing import recorder
+
+# Erreurs transitoires relancées par perform()
+RETRYABLE_EXCEPTIONS = (StaleElementReferenceException, ElementClickInterceptedException)
+
+
+def backoff_delay(attempt, base=None, cap=None) -> float:
+    """Délai avant la relance n° attempt (0, 1, ...) : uniforme dans [0, min(cap, base * 2^attempt)]"""
+    base = Config.RETRY_BACKOFF if base is None else base
+    cap = Config.RETRY_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class FlakeTracker(SessionReport):
+    """Relances enregistrées pendant la session, agrégées par étape et locator"""
+    
+    REPORT_NAME = "flakes"
+    
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+    
+    def record(self, page, step, locator, error, attempt, cost) -> dict:
+        """Enregistre une relance ; son issue (recovered) est renseignée par l'appelant"""
+        event = {
+            "test_id": recorder.current_context.get("test_id"),
+            "page": page,
+            "step": step,
+            "locator": locator,
+            "error": type(error).__name__,
+            "attempt": attempt,
+            "cost": round(cost, 4),
+            "recovered": None,
+        }
+        with self._lock:
+            self.events.append(event)
+        return event
+    
+    def summary(self) -> dict:
+        """Relances, échecs définitifs et temps perdu par Page.étape [locator]"""
+        groups = defaultdict(lambda: {"retries": 0, "failed": 0, "cost": 0.0,
+                                      "errors": defaultdict(int), "tests": set()})
+        for event in self.events:
+            key = f"{event['page']}.{event['step']} [{event['locator']}]"
+            group = groups[key]
+            group["retries"] += 1
+            group["failed"] += event["recovered"] is False
+            group["cost"] += event["cost"]
+            group["errors"][event["error"]] += 1
+            if event["test_id"]:
+                group["tests"].add(event["test_id"])
+        
+        # « flaky » : au moins une relance a fini par réussir ; « failing » : jamais
+        return {
+            key: dict(group, cost=round(group["cost"], 3), errors=dict(group["errors"]),
+                      tests=sorted(group["tests"]),
+                      classification="flaky" if group["retries"] > group["failed"] else "failing")
+            for key, group in sorted(groups.items(), key=lambda kv: -kv[1]["cost"])
+        }
+    
+    def report_data(self):
+        """flakes.json : résumé et relances (rien si aucune relance)"""
+        if not self.events:
+            return None
+        return {"summary": self.summary(), "events": self.events}
+
+
+flake_tracker = FlakeTracker()
+
+
+def retry_action(action, page, step=None, locator=None, attempts=None):
+    """
+    Exécute action() en relançant les erreurs transitoires (RETRYABLE_EXCEPTIONS)
+    au plus `attempts` fois au total ; toute autre erreur est propagée aussitôt.
+    L'action doit relocaliser ses éléments à chaque tentative.
+    """
+    attempts = attempts or Config.RETRY_ATTEMPTS
+    retries = []
+    for attempt in range(attempts):
+        start = time.perf_counter()
+        try:
+            result = action()
+        except RETRYABLE_EXCEPTIONS as e:
+            last_attempt = attempt == attempts - 1
+            with recorder.waiting():
+                if not last_attempt:
+                    time.sleep(backoff_delay(attempt))
+            retries.append(flake_tracker.record(
+                page, step, locator, e, attempt + 1, time.perf_counter() - start
+            ))
+            if last_attempt:
+                for event in retries:
+                    event["recovered"] = False
+                raise
+            continue
+        for event in retries:
+            event["recovered"] = True
+        return result
@@ -0,0 +1,29 @@
+"""
+Répartition équilibrée des tests entre workers d'après leurs durées
+(voir utils/test_history.py pour l'enregistrement des durées)
+"""
+
+import statistics
+from typing import Dict, List
+
+from utils.test_history import DEFAULT_DURATION
+
+
+def plan_shards(nodeids: List[str], durations: Dict[str, float], workers: int) -> List[List[str]]:
+    """
+    Répartit les tests en `workers` lots de durée totale proche
+    (plus longue durée d'abord, chaque test va au lot le moins chargé)
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    default = statistics.median(known) if known else DEFAULT_DURATION
+    
+    shards = [[] for _ in range(max(1, workers))]
+    loads = [0.0] * len(shards)
+    
+    ordered = sorted(nodeids, key=lambda n: durations.get(n, default), reverse=True)
+    for nodeid in ordered:
+        target = loads.index(min(loads))
+        shards[target].append(nodeid)
+        loads[target] += durations.get(nodeid, default)
+    
+    return [shard for shard in shards if shard]
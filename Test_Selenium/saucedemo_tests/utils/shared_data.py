@@ -0,0 +1,59 @@
+"""
+Données de test partagées avec la suite Playwright
+
+Les fichiers TestPlaywright/tests/data/*.json (utilisateurs, filtres,
+client de commande, messages d'erreur, produits) sont lus au premier
+accès seulement puis gardés en cache pour toute la session. Les valeurs
+sont désignées par un chemin : "$users.standard.username",
+"$steps.filters.priceLowHigh.value".
+"""
+
+import functools
+import json
+import os
+
+from config.config import Config
+
+# Préfixe des références vers les données partagées
+REFERENCE_PREFIX = "$"
+
+
+@functools.lru_cache(maxsize=None)
+def load_shared(name: str) -> dict:
+    """Contenu de <name>.json (lu une seule fois par session)"""
+    path = os.path.join(Config.SHARED_DATA_DIR, f"{name}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Données partagées illisibles ({path}): {e}") from e
+
+
+def lookup(path: str):
+    """Valeur désignée par un chemin « fichier.clé.sous_clé »"""
+    name, _, keys = path.partition(".")
+    value = load_shared(name)
+    for key in keys.split(".") if keys else ():
+        if not isinstance(value, dict) or key not in value:
+            raise KeyError(f"Référence inconnue: {REFERENCE_PREFIX}{path}")
+        value = value[key]
+    return value
+
+
+def resolve(value):
+    """Remplace récursivement les références "$..." par les données partagées"""
+    if isinstance(value, str) and value.startswith(REFERENCE_PREFIX):
+        return lookup(value[len(REFERENCE_PREFIX):])
+    if isinstance(value, list):
+        return [resolve(v) for v in value]
+    if isinstance(value, dict):
+        return {k: resolve(v) for k, v in value.items()}
+    return value
+
+
+def user_credentials(user_type: str) -> dict:
+    """Identifiants d'un type d'utilisateur de users.json (standard, locked, ...)"""
+    users = load_shared("users")
+    if user_type not in users:
+        raise KeyError(f"Type d'utilisateur '{user_type}' absent de users.json")
+    return users[user_type]
@@ -0,0 +1,27 @@
+"""
+Petites fonctions statistiques partagées par les rapports de performance
+"""
+
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Percentile par interpolation linéaire (pct entre 0 et 100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: Sequence[float]) -> dict:
+    """Résumé compact : nombre, p50, p95, min, max"""
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "min": round(min(values), 4) if values else 0.0,
+        "max": round(max(values), 4) if values else 0.0,
+    }
@@ -0,0 +1,232 @@
+"""
+Instrumentation des actions des Page Objects
+
+Chaque méthode publique d'une page est enregistrée comme une « étape » :
+durée totale, nombre de commandes WebDriver, temps passé à attendre et
+temps d'action, avec l'id du test et l'utilisateur courant. Les appels
+imbriqués (find_element, click_element, attentes... appelés par login ou
+click_product_by_name) sont aussi enregistrés, avec leur profondeur et
+l'étape parente : commandes et attentes comptent à chaque niveau. Le
+résumé distingue les étapes de premier niveau des primitives imbriquées.
+"""
+
+import csv
+import functools
+import inspect
+import itertools
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from config.config import Config
+from utils.artifacts import SessionReport
+from utils.stats import summarize
+from utils.wait_budget import wait_budget
+
+CSV_FIELDS = ["id", "parent_id", "depth", "test_id", "username", "page", "step", "status",
+              "wall_time", "wait_time", "action_time", "commands"]
+
+
+class StepRecorder(SessionReport):
+    """Collecte les mesures par étape pour toute la session"""
+    
+    REPORT_NAME = "step_timings"
+    
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.records = []
+        self.context = {"test_id": None, "username": None}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+    
+    def set_context(self, **values):
+        """Met à jour les étiquettes (test_id, username) des prochaines étapes"""
+        local_context = getattr(self._local, "context", None)
+        (local_context if local_context is not None else self.context).update(values)
+    
+    @contextmanager
+    def thread_context(self, **values):
+        """Étiquettes propres au thread courant (exécution concurrente)"""
+        self._local.context = dict(self.context, **values)
+        try:
+            yield
+        finally:
+            self._local.context = None
+    
+    @property
+    def current_context(self) -> dict:
+        """Étiquettes actives pour le thread courant"""
+        return getattr(self._local, "context", None) or self.context
+    
+    @property
+    def _stack(self) -> list:
+        """Étapes en cours sur le thread, de la plus externe à la plus interne"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    @property
+    def current_step(self):
+        """Étape de premier niveau en cours (celle qui nomme l'action du test)"""
+        stack = self._stack
+        return stack[0] if stack else None
+    
+    def run_step(self, page, name, func, *args, **kwargs):
+        """Exécute func comme une étape mesurée, imbriquée dans l'étape en cours s'il y en a une"""
+        if not self.enabled:
+            return func(*args, **kwargs)
+        
+        stack = self._stack
+        parent = stack[-1] if stack else None
+        step = dict(self.current_context, id=next(self._ids),
+                    parent_id=parent["id"] if parent else None, depth=len(stack),
+                    page=page, step=name, status="ok", wait_time=0.0, commands=0)
+        stack.append(step)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            step["status"] = "error"
+            raise
+        finally:
+            stack.pop()
+            step["wall_time"] = round(time.perf_counter() - start, 4)
+            step["wait_time"] = round(step["wait_time"], 4)
+            step["action_time"] = round(max(step["wall_time"] - step["wait_time"], 0.0), 4)
+            with self._lock:
+                self.records.append(step)
+    
+    @contextmanager
+    def waiting(self):
+        """Attribue la durée du bloc au temps d'attente de l'étape et du test courants"""
+        if getattr(self._local, "in_wait", False):
+            yield
+            return
+        steps = list(self._stack)
+        self._local.in_wait = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.in_wait = False
+            for step in steps:
+                step["wait_time"] += elapsed
+            wait_budget.add(self.current_context.get("test_id"), elapsed)
+    
+    def count_command(self):
+        """Commande WebDriver comptée pour l'étape en cours et toutes ses parentes"""
+        for step in self._stack:
+            step["commands"] += 1
+    
+    def summary(self, nested=True) -> dict:
+        """
+        p50/p95 par étape (Page.méthode) de premier niveau, globalement et par
+        utilisateur ; avec nested, aussi par étape imbriquée (primitives)
+        """
+        by_step = defaultdict(list)
+        by_user = defaultdict(list)
+        by_nested = defaultdict(list)
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            key = f"{record['page']}.{record['step']}"
+            if record["depth"]:
+                by_nested[key].append(record)
+                continue
+            by_step[key].append(record)
+            by_user[(key, record["username"] or "-")].append(record)
+        
+        def describe(records):
+            return {
+                "wall_time": summarize([r["wall_time"] for r in records]),
+                "wait_time": summarize([r["wait_time"] for r in records]),
+                "action_time": summarize([r["action_time"] for r in records]),
+                "commands": summarize([r["commands"] for r in records]),
+                "errors": sum(1 for r in records if r["status"] != "ok"),
+            }
+        
+        summary = {
+            "steps": {key: describe(records) for key, records in sorted(by_step.items())},
+            "steps_by_user": {
+                f"{key}[{user}]": describe(records)
+                for (key, user), records in sorted(by_user.items())
+            },
+        }
+        if nested:
+            summary["nested_steps"] = {key: describe(records) for key, records in sorted(by_nested.items())}
+        return summary
+    
+    def records_for(self, test_id) -> list:
+        """Chronologie des étapes d'un test"""
+        with self._lock:
+            return [record for record in self.records if record["test_id"] == test_id]
+    
+    def pages_by_test(self) -> dict:
+        """Page Objects utilisés par chaque test {test_id: {page, ...}}"""
+        pages = defaultdict(set)
+        for record in self.records:
+            if record["test_id"]:
+                pages[record["test_id"]].add(record["page"])
+        return dict(pages)
+    
+    def report_data(self):
+        """step_timings.json : résumé par étape"""
+        return self.summary() if self.records else None
+    
+    def write_report(self, directory, suffix=""):
+        """Écrit step_timings{suffix}.json (résumé) et .csv (mesures brutes)"""
+        json_path = super().write_report(directory, suffix)
+        if json_path is None:
+            return None
+        with open(os.path.join(directory, f"step_timings{suffix}.csv"), "w",
+                  encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(self.records)
+        return json_path
+
+
+recorder = StepRecorder(enabled=Config.STEP_TIMING)
+
+
+def timed_step(func):
+    """Décorateur : mesure l'appel comme une étape de la page"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return recorder.run_step(type(self).__name__, func.__name__, func, self, *args, **kwargs)
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def untimed(func):
+    """Exclut une méthode publique de l'instrumentation"""
+    func.__untimed__ = True
+    return func
+
+
+def instrument_page_class(cls):
+    """Décore toutes les méthodes publiques définies dans la classe"""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attr):
+            continue
+        if getattr(attr, "__timed__", False) or getattr(attr, "__untimed__", False):
+            continue
+        setattr(cls, name, timed_step(attr))
+    return cls
+
+
+def instrument_driver(driver):
+    """Compte chaque commande WebDriver envoyée pendant une étape"""
+    execute = driver.execute
+    
+    def counted_execute(driver_command, params=None):
+        recorder.count_command()
+        return execute(driver_command, params)
+    
+    driver.execute = counted_execute
+    return driver
@@ -0,0 +1,168 @@
+"""
+Historique d'exécution des tests : durée, résultat et Page Objects utilisés
+
+L'historique sert à ordonner les tests (échecs récents d'abord, puis les plus
+longs), à équilibrer les lots de l'exécution parallèle et à choisir le
+sous-ensemble le plus rapide couvrant un ensemble de Page Objects.
+"""
+
+import json
+import os
+import statistics
+import time
+from typing import Dict, Iterable, List
+
+# Durée supposée d'un test jamais exécuté (secondes)
+DEFAULT_DURATION = 10.0
+
+# Nombre d'exécutions conservées par test
+HISTORY_LENGTH = 10
+
+# Un échec parmi les N dernières exécutions rend le test « récemment en échec »
+RECENT_FAILURE_WINDOW = 3
+
+
+class TestHistory:
+    """Historique {nodeid: entrée} persistant dans un fichier JSON"""
+    
+    __test__ = False  # Pas une classe de tests pour pytest
+    
+    def __init__(self, path):
+        self.path = path
+        self.entries = self._read(path)
+        self.updated = set()
+    
+    @staticmethod
+    def _read(path) -> Dict[str, dict]:
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def record(self, nodeid, duration, outcome, page_objects=()):
+        """
+        Ajoute une exécution (outcome: passed, failed, skipped)
+        
+        Une durée None (test en erreur dès le setup) n'est pas représentative :
+        seul le résultat est conservé.
+        """
+        entry = self.entries.setdefault(
+            nodeid, {"durations": [], "outcomes": [], "page_objects": []}
+        )
+        if duration is not None and outcome != "skipped":
+            entry["durations"] = (entry["durations"] + [round(duration, 3)])[-HISTORY_LENGTH:]
+        entry["outcomes"] = (entry["outcomes"] + [outcome])[-HISTORY_LENGTH:]
+        if page_objects:
+            entry["page_objects"] = sorted(set(page_objects))
+        entry["last_run"] = round(time.time(), 1)
+        self.updated.add(nodeid)
+    
+    def merge(self, other: "TestHistory"):
+        """Intègre l'historique d'un worker (ses entrées sont plus récentes)"""
+        self.entries.update(other.entries)
+    
+    def save(self, path=None, only_updated=False):
+        """
+        Écriture atomique de l'historique
+        
+        Args:
+            path: Fichier cible (par défaut celui de chargement)
+            only_updated: N'écrire que les tests exécutés dans cette session
+                          (historique partiel d'un worker parallèle)
+        """
+        path = path or self.path
+        entries = self.entries
+        if only_updated:
+            entries = {k: v for k, v in entries.items() if k in self.updated}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    
+    # ---- Lecture ----
+    
+    def durations(self) -> Dict[str, float]:
+        """Durée de référence par test : médiane des dernières exécutions"""
+        return {
+            nodeid: statistics.median(entry["durations"])
+            for nodeid, entry in self.entries.items() if entry["durations"]
+        }
+    
+    def default_duration(self, nodeids: Iterable[str]) -> float:
+        known = self.durations()
+        values = [known[n] for n in nodeids if n in known]
+        return statistics.median(values) if values else DEFAULT_DURATION
+    
+    def recently_failed(self, nodeid) -> bool:
+        outcomes = self.entries.get(nodeid, {}).get("outcomes", [])
+        return "failed" in outcomes[-RECENT_FAILURE_WINDOW:]
+    
+    def page_objects(self, nodeid) -> List[str]:
+        return self.entries.get(nodeid, {}).get("page_objects", [])
+    
+    # ---- Planification ----
+    
+    def order(self, nodeids: List[str], group_of=None) -> List[str]:
+        """
+        Échecs récents d'abord, puis du plus long au plus court
+        
+        Args:
+            group_of: Fonction nodeid -> clé de groupe (ou None). Les tests d'un
+                      même groupe restent contigus (fixture de classe partagée) ;
+                      le groupe est placé selon son échec le plus récent et sa
+                      durée totale.
+        """
+        known = self.durations()
+        default = self.default_duration(nodeids)
+        
+        def rank(members):
+            return (not any(self.recently_failed(n) for n in members),
+                    -sum(known.get(n, default) for n in members))
+        
+        units = {}
+        for nodeid in nodeids:
+            key = group_of(nodeid) if group_of else None
+            units.setdefault(key if key is not None else ("test", nodeid), []).append(nodeid)
+        
+        ordered = []
+        for members in sorted(units.values(), key=rank):
+            ordered.extend(sorted(members, key=lambda n: rank([n])))
+        return ordered
+    
+    def fastest_cover(self, nodeids: List[str], targets: Iterable[str]):
+        """
+        Sous-ensemble rapide de tests couvrant tous les Page Objects demandés
+        (couverture d'ensemble pondérée, heuristique gloutonne : à chaque tour,
+        le test au meilleur rapport durée / nouveaux Page Objects couverts)
+        
+        Les tests sans historique de Page Objects sont ajoutés si une cible
+        reste non couverte : ils pourraient la couvrir.
+        
+        Returns:
+            (tests retenus, Page Objects non couverts par l'historique)
+        """
+        known = self.durations()
+        default = self.default_duration(nodeids)
+        remaining = set(targets)
+        selected = []
+        
+        while remaining:
+            best, best_cost = None, None
+            for nodeid in nodeids:
+                gain = len(remaining & set(self.page_objects(nodeid)))
+                if nodeid in selected or not gain:
+                    continue
+                cost = known.get(nodeid, default) / gain
+                if best_cost is None or cost < best_cost:
+                    best, best_cost = nodeid, cost
+            if best is None:
+                break
+            selected.append(best)
+            remaining -= set(self.page_objects(best))
+        
+        if remaining:
+            selected += [n for n in nodeids if not self.page_objects(n)]
+        return selected, sorted(remaining)
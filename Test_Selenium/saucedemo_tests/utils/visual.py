@@ -0,0 +1,480 @@
+"""
+Régression visuelle par empreintes perceptuelles
+
+La position de chaque région (page, carte produit, image) est lue en un
+seul script ; le navigateur produit ensuite, pour chaque région, une
+vignette déjà réduite (capture CDP limitée à la région, à l'échelle de
+Config.VISUAL_THUMBNAIL pixels). Seules ces vignettes sont décodées et
+hachées, dans un pool de processus : le calcul d'une région se fait pendant
+la capture de la suivante. Chaque vignette est réduite à une grille de
+gris 9×8 (hash de différence, 64 bits) et à une grille de tuiles RGB
+moyennes ; la comparaison à la référence se limite à une distance de
+Hamming et à un écart par tuile.
+
+Les références sont versionnées, un fichier JSON par environnement
+(région → empreinte, empreintes identiques stockées une fois). Elles sont
+lues à la première vérification et ne sont réécrites qu'en mode mise à
+jour (SAUCEDEMO_VISUAL_UPDATE=1, exécution série) depuis
+Config.VISUAL_REFERENCE_USER.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.artifacts import SessionReport
+from utils.step_timing import recorder
+
+logger = logging.getLogger(__name__)
+
+BASELINE_VERSION = 1
+
+# Position (coordonnées du document) de chaque région ; avec un libellé
+# (sélecteur descendant, ou « @attribut »), une région par élément trouvé
+REGIONS_SCRIPT = """
+const specs = arguments[0];
+const doc = document.documentElement;
+const result = {
+    page: {width: Math.max(doc.scrollWidth, window.innerWidth),
+           height: Math.max(doc.scrollHeight, window.innerHeight)},
+    viewport: {x: window.scrollX, y: window.scrollY, width: window.innerWidth, height: window.innerHeight},
+    regions: {},
+};
+for (const [name, css, label] of specs) {
+    document.querySelectorAll(css).forEach((element, index) => {
+        let key = name;
+        if (label !== null) {
+            const text = label.startsWith('@')
+                ? element.getAttribute(label.slice(1))
+                : (element.querySelector(label) || {}).innerText;
+            key = `${name}:${(text || String(index)).trim()}`;
+        }
+        const r = element.getBoundingClientRect();
+        if (r.width && r.height && !(key in result.regions)) {
+            result.regions[key] = [r.left + window.scrollX, r.top + window.scrollY, r.width, r.height];
+        }
+    });
+}
+return result;
+"""
+
+IMAGES_LOADED_SCRIPT = "return Array.from(document.images).every((img) => img.complete);"
+
+
+# ----- Décodage PNG et empreintes (exécutés dans les processus du pool) -----
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Seuls les PNG produits par Chrome (captures CDP / get_screenshot_as_png) sont
+# acceptés : RGB ou RGBA 8 bits, non entrelacés. Type de couleur → canaux
+PNG_CHANNELS = {2: 3, 6: 4}
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _unfilter(kind, line, previous, channels):
+    """Inverse le filtre d'une ligne PNG (en place)"""
+    if kind == 1:
+        for i in range(channels, len(line)):
+            line[i] = (line[i] + line[i - channels]) & 0xFF
+    elif kind == 2:
+        line[:] = bytes((a + b) & 0xFF for a, b in zip(line, previous))
+    elif kind == 3:
+        for i in range(len(line)):
+            left = line[i - channels] if i >= channels else 0
+            line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+    elif kind == 4:
+        for i in range(len(line)):
+            left = line[i - channels] if i >= channels else 0
+            upper_left = previous[i - channels] if i >= channels else 0
+            line[i] = (line[i] + _paeth(left, previous[i], upper_left)) & 0xFF
+    elif kind != 0:
+        raise ValueError(f"Filtre PNG inconnu: {kind}")
+
+
+def decode_png(data: bytes):
+    """
+    Décode une capture PNG de Chrome (RGB/RGBA 8 bits, non entrelacée) ;
+    tout autre PNG lève ValueError
+    
+    Returns:
+        (largeur, hauteur, canaux, pixels) - pixels ligne par ligne
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Capture non PNG")
+    position, header, idat = len(PNG_SIGNATURE), None, []
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        chunk = data[position + 8:position + 8 + length]
+        position += 12 + length
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", chunk)
+        elif kind == b"IDAT":
+            idat.append(chunk)
+        elif kind == b"IEND":
+            break
+    if header is None or not idat:
+        raise ValueError("PNG incomplet (IHDR ou IDAT absent)")
+    width, height, depth, color, _, _, interlace = header
+    if depth != 8 or color not in PNG_CHANNELS or interlace:
+        raise ValueError(f"PNG non supporté (profondeur {depth}, couleur {color}, entrelacé {interlace}) : "
+                         f"seules les captures RGB/RGBA 8 bits non entrelacées de Chrome sont décodées")
+    
+    channels = PNG_CHANNELS[color]
+    stride = width * channels
+    raw = zlib.decompress(b"".join(idat))
+    pixels = bytearray(height * stride)
+    previous = bytearray(stride)
+    for y in range(height):
+        start = y * (stride + 1)
+        line = bytearray(raw[start + 1:start + 1 + stride])
+        _unfilter(raw[start], line, previous, channels)
+        pixels[y * stride:(y + 1) * stride] = line
+        previous = line
+    return width, height, channels, pixels
+
+
+def _sample_grid(image, box, columns, rows, samples=4):
+    """Couleurs moyennes (r, g, b) d'une grille sur la boîte, échantillonnée"""
+    width, _, channels, pixels = image
+    left, top, right, bottom = box
+    cell_width, cell_height = (right - left) / columns, (bottom - top) / rows
+    grid = []
+    for row in range(rows):
+        for column in range(columns):
+            totals, count = [0, 0, 0], 0
+            for sy in range(samples):
+                y = int(top + (row + (sy + 0.5) / samples) * cell_height)
+                for sx in range(samples):
+                    x = int(left + (column + (sx + 0.5) / samples) * cell_width)
+                    offset = (y * width + x) * channels
+                    pixel = pixels[offset:offset + 3]
+                    for i in range(3):
+                        totals[i] += pixel[i]
+                    count += 1
+            grid.append(tuple(total // count for total in totals))
+    return grid
+
+
+def fingerprint(image, box) -> dict:
+    """Hash de différence 64 bits (gris 9×8) et tuiles RGB moyennes d'une région"""
+    gray = [(299 * r + 587 * g + 114 * b) // 1000 for r, g, b in _sample_grid(image, box, 9, 8)]
+    bits = 0
+    for row in range(8):
+        for column in range(8):
+            bits = (bits << 1) | (gray[row * 9 + column] > gray[row * 9 + column + 1])
+    tiles = _sample_grid(image, box, Config.VISUAL_TILE_GRID, Config.VISUAL_TILE_GRID)
+    return {"hash": f"{bits:016x}", "tiles": bytes(value for tile in tiles for value in tile)}
+
+
+def fingerprint_thumbnail(key, png: bytes) -> dict:
+    """Empreinte d'une vignette de région produite par le navigateur"""
+    image = decode_png(png)
+    return {key: fingerprint(image, (0, 0, image[0], image[1]))}
+
+
+def fingerprint_regions(png: bytes, origin: dict, regions: dict) -> dict:
+    """
+    Empreinte de chaque région d'une capture
+    
+    Args:
+        origin: zone du document couverte par la capture (x, y, width)
+        regions: {nom: [x, y, largeur, hauteur]} en coordonnées du document
+    
+    Returns:
+        {nom: empreinte}, None pour une région hors de la capture
+    """
+    image = decode_png(png)
+    width, height = image[0], image[1]
+    ratio = width / origin["width"]
+    result = {}
+    for key, (x, y, w, h) in regions.items():
+        left = max(int((x - origin["x"]) * ratio), 0)
+        top = max(int((y - origin["y"]) * ratio), 0)
+        right = min(int((x - origin["x"] + w) * ratio), width)
+        bottom = min(int((y - origin["y"] + h) * ratio), height)
+        result[key] = fingerprint(image, (left, top, right, bottom)) if right > left and bottom > top else None
+    return result
+
+
+def compare(baseline: dict, current: dict) -> dict:
+    """Distance de Hamming des hash et tuiles dont une couleur s'écarte au-delà de la tolérance"""
+    distance = bin(int(baseline["hash"], 16) ^ int(current["hash"], 16)).count("1")
+    reference, tiles = baseline["tiles"], current["tiles"]
+    changed = [
+        index // 3 for index in range(0, min(len(reference), len(tiles)), 3)
+        if max(abs(reference[index + i] - tiles[index + i]) for i in range(3)) > Config.VISUAL_TILE_TOLERANCE
+    ]
+    return {
+        "distance": distance,
+        "changed_tiles": changed,
+        "match": distance <= Config.VISUAL_HASH_THRESHOLD and not changed,
+    }
+
+
+# ----- Références -----
+
+class VisualBaselines:
+    """Références par région ; empreintes dédupliquées par contenu"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.regions = {}
+        self.fingerprints = {}
+        self.dirty = False
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != BASELINE_VERSION:
+                raise ValueError(f"Version de références visuelles non supportée: {data.get('version')}")
+            self.regions = data["regions"]
+            self.fingerprints = {
+                digest: {"hash": entry["hash"], "tiles": base64.b64decode(entry["tiles"])}
+                for digest, entry in data["fingerprints"].items()
+            }
+    
+    def has_page(self, page) -> bool:
+        return any(key.startswith(f"{page}:") for key in self.regions)
+    
+    def get(self, key):
+        digest = self.regions.get(key)
+        return self.fingerprints[digest] if digest else None
+    
+    def put(self, key, fingerprint):
+        digest = hashlib.sha1(fingerprint["hash"].encode("ascii") + fingerprint["tiles"]).hexdigest()[:16]
+        self.fingerprints.setdefault(digest, fingerprint)
+        if self.regions.get(key) != digest:
+            self.regions[key] = digest
+            self.dirty = True
+    
+    def save(self):
+        """Écrit les références (empreintes non référencées supprimées)"""
+        used = set(self.regions.values())
+        data = {
+            "version": BASELINE_VERSION,
+            "regions": dict(sorted(self.regions.items())),
+            "fingerprints": {
+                digest: {"hash": fp["hash"], "tiles": base64.b64encode(fp["tiles"]).decode("ascii")}
+                for digest, fp in sorted(self.fingerprints.items()) if digest in used
+            },
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        self.dirty = False
+
+
+# ----- Vérifications -----
+
+class VisualCheck:
+    """Vérification en cours : empreintes calculées dans le pool, comparées à la demande"""
+    
+    def __init__(self, checker, page, username, test_id, futures, captures):
+        self.checker = checker
+        self.page = page
+        self.username = username
+        self.test_id = test_id
+        self._futures = futures
+        self._captures = captures  # {région: vignette PNG} (ou {None: capture de la fenêtre})
+        self._fingerprints = None
+        self._results = None
+    
+    def fingerprints(self, timeout=None) -> dict:
+        """{région: empreinte} (None pour une région hors de la capture)"""
+        if self._fingerprints is None:
+            fingerprints = {}
+            for future in self._futures:
+                fingerprints.update(future.result(timeout))
+            self._fingerprints = fingerprints
+        return self._fingerprints
+    
+    def results(self, timeout=None) -> dict:
+        """{région: {status, distance, changed_tiles}} - status: match, diff, missing, offscreen"""
+        if self._results is None:
+            self._results = self.checker.evaluate(self, self.fingerprints(timeout))
+            self._captures = None
+        return self._results
+    
+    def _with_status(self, status) -> list:
+        return sorted(key for key, entry in self.results().items() if entry["status"] == status)
+    
+    @property
+    def differences(self) -> list:
+        return self._with_status("diff")
+    
+    @property
+    def missing(self) -> list:
+        return self._with_status("missing")
+
+
+class VisualChecker(SessionReport):
+    """Captures, pool de calcul des empreintes, références et rapport de la session"""
+    
+    REPORT_NAME = "visual_regression"
+    
+    def __init__(self, baselines_path=None, workers=None):
+        self.baselines_path = baselines_path or Config.VISUAL_BASELINES
+        self.baselines = None
+        self.workers = workers or Config.VISUAL_WORKERS
+        self.entries = []
+        self._executor = None
+        self._lock = threading.Lock()
+    
+    def load_baselines(self) -> VisualBaselines:
+        """Références, lues au premier appel (fichier illisible : ValueError / OSError)"""
+        with self._lock:
+            if self.baselines is None:
+                self.baselines = VisualBaselines(self.baselines_path)
+            return self.baselines
+    
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        # spawn : le processus de test a déjà des threads (pool de navigateurs, serveurs locaux)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+    
+    def check(self, driver, page, regions) -> VisualCheck:
+        """
+        Capture chaque région et soumet le calcul de son empreinte au pool
+        
+        Args:
+            page: nom de la page (préfixe des régions dans les références)
+            regions: [(nom, sélecteur CSS, libellé ou None)]
+        """
+        layout = driver.execute_script(REGIONS_SCRIPT, [list(region) for region in regions])
+        futures, captures = [], {}
+        try:
+            for key, rect in layout["regions"].items():
+                captures[key] = self._capture_thumbnail(driver, rect)
+                futures.append(self.executor.submit(fingerprint_thumbnail, key, captures[key]))
+        except (WebDriverException, AttributeError) as e:
+            # Sans CDP (Firefox) : une capture de la fenêtre, découpée dans le pool
+            logger.debug("Vignettes CDP indisponibles, capture de la fenêtre: %s", e)
+            png = driver.get_screenshot_as_png()
+            futures = [self.executor.submit(fingerprint_regions, png, layout["viewport"], layout["regions"])]
+            captures = {None: png}
+        context = recorder.current_context
+        return VisualCheck(self, page, context.get("username"), context.get("test_id"), futures, captures)
+    
+    @staticmethod
+    def _capture_thumbnail(driver, rect) -> bytes:
+        """Vignette d'une région (coordonnées du document), réduite par le navigateur"""
+        x, y, width, height = rect
+        scale = min(1.0, Config.VISUAL_THUMBNAIL / max(width, height))
+        data = driver.execute_cdp_cmd("Page.captureScreenshot", {
+            "format": "png",
+            "captureBeyondViewport": True,
+            "clip": {"x": x, "y": y, "width": width, "height": height, "scale": scale},
+        })
+        return base64.b64decode(data["data"])
+    
+    def record_baseline(self, check, timeout=None) -> int:
+        """Enregistre les empreintes d'une vérification comme références ; retourne le nombre de régions"""
+        self.load_baselines()
+        recorded = 0
+        with self._lock:
+            for region, current in check.fingerprints(timeout).items():
+                if current is not None:
+                    self.baselines.put(f"{check.page}:{region}", current)
+                    recorded += 1
+        return recorded
+    
+    def evaluate(self, check, fingerprints) -> dict:
+        """Compare les empreintes d'une vérification aux références"""
+        self.load_baselines()
+        results = {}
+        with self._lock:
+            for region, current in sorted(fingerprints.items()):
+                baseline = self.baselines.get(f"{check.page}:{region}")
+                if current is None:
+                    results[region] = {"status": "offscreen"}
+                elif baseline is None:
+                    results[region] = {"status": "missing"}
+                else:
+                    comparison = compare(baseline, current)
+                    matched = comparison.pop("match")
+                    results[region] = dict(comparison, status="match" if matched else "diff")
+        
+        differences = [region for region, entry in results.items() if entry["status"] == "diff"]
+        screenshots = self._save_captures(check, differences) if differences else []
+        with self._lock:
+            self.entries.append({
+                "page": check.page, "username": check.username, "test_id": check.test_id,
+                "screenshots": screenshots, "regions": results,
+            })
+        return results
+    
+    def _save_captures(self, check, regions) -> list:
+        """Conserve les vignettes des régions en écart (ou la capture de la fenêtre)"""
+        directory = os.path.join(Config.SCREENSHOTS_DIR, "visual", Config.RUN_ID)
+        os.makedirs(directory, exist_ok=True)
+        prefix = f"{check.username or 'anonymous'}-{check.page}-{len(self.entries)}"
+        captures = check._captures or {}
+        if None in captures:
+            selected = {"window": captures[None]}
+        else:
+            selected = {re.sub(r"[^\w.\-]+", "_", region): captures[region]
+                        for region in regions if region in captures}
+        paths = []
+        for name, png in selected.items():
+            path = os.path.join(directory, f"{prefix}-{name}.png")
+            with open(path, "wb") as f:
+                f.write(png)
+            paths.append(path)
+        return paths
+    
+    def summary(self) -> dict:
+        """{utilisateur: {page: {checks, statut: nombre de régions, differences: [régions]}}}"""
+        summary = defaultdict(dict)
+        with self._lock:
+            for entry in self.entries:
+                page = summary[entry["username"] or "-"].setdefault(entry["page"], {"checks": 0, "differences": []})
+                page["checks"] += 1
+                for region, result in entry["regions"].items():
+                    page[result["status"]] = page.get(result["status"], 0) + 1
+                    if result["status"] == "diff" and region not in page["differences"]:
+                        page["differences"].append(region)
+        return dict(sorted(summary.items()))
+    
+    def report_data(self):
+        """visual_regression.json : résumé et détail par région"""
+        if not self.entries:
+            return None
+        return {"summary": self.summary(), "checks": self.entries}
+    
+    def close(self):
+        """
+        Arrête le pool ; les références modifiées ne sont écrites qu'en mode
+        mise à jour et hors des workers de run_parallel.py
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        if self.baselines is not None and self.baselines.dirty:
+            if Config.VISUAL_UPDATE and not Config.WORKER_ID:
+                self.baselines.save()
+            else:
+                logger.warning("Références visuelles modifiées hors du mode mise à jour, non écrites")
+
+
+visual = VisualChecker()
@@ -0,0 +1,67 @@
+"""
+Budget total d'attente par test
+
+Chaque attente explicite (BasePage.wait_until, wait_for_dom_settled, délais
+de relance) est décomptée pour le test courant. Avec un budget
+(Config.TEST_WAIT_BUDGET, désactivé par défaut), une attente ne peut pas
+dépasser ce qui reste : une fois épuisé, la suivante échoue aussitôt avec
+un TimeoutException explicite au lieu de prolonger le test.
+"""
+
+import threading
+
+from selenium.common.exceptions import TimeoutException
+from config.config import Config
+from utils.artifacts import SessionReport
+
+
+class WaitBudget(SessionReport):
+    """Temps d'attente cumulé par test, plafonné à `limit` secondes"""
+    
+    REPORT_NAME = "wait_budget"
+    
+    def __init__(self, limit=None):
+        self.limit = Config.TEST_WAIT_BUDGET if limit is None else limit
+        self.spent = {}
+        self._lock = threading.Lock()
+    
+    def add(self, test_id, seconds):
+        if test_id is None:
+            return
+        with self._lock:
+            self.spent[test_id] = self.spent.get(test_id, 0.0) + seconds
+    
+    def remaining(self, test_id):
+        """Secondes d'attente encore autorisées (None : pas de limite)"""
+        if not self.limit or test_id is None:
+            return None
+        return max(self.limit - self.spent.get(test_id, 0.0), 0.0)
+    
+    def clamp(self, test_id, timeout):
+        """Réduit un timeout au budget restant ; échoue si le budget est épuisé"""
+        remaining = self.remaining(test_id)
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise TimeoutException(
+                f"Budget d'attente du test épuisé ({self.limit}s) : {test_id}"
+            )
+        return min(timeout, remaining)
+    
+    def summary(self) -> dict:
+        """Temps d'attente par test, du plus long au plus court"""
+        return {
+            test_id: {
+                "wait_time": round(spent, 3),
+                "budget": self.limit,
+                "exhausted": bool(self.limit) and spent >= self.limit,
+            }
+            for test_id, spent in sorted(self.spent.items(), key=lambda kv: -kv[1])
+        }
+    
+    def report_data(self):
+        """wait_budget.json : temps d'attente par test"""
+        return self.summary() if self.spent else None
+
+
+wait_budget = WaitBudget()
@@ -0,0 +1,140 @@
+"""
+Métriques de performance côté navigateur pour chaque page visitée
+
+Après chaque transition de page (navigate_to, navigation attendue par
+wait_for_navigation, connexion réussie), un seul script lit les entrées
+Navigation Timing, paint, Resource Timing et long tasks accumulées depuis
+la mesure précédente. Les mesures sont étiquetées avec l'utilisateur et le
+test courants puis agrégées par utilisateur et par page (chemin de l'URL) :
+on mesure ainsi directement la lenteur de performance_glitch_user au lieu
+de la déduire des timeouts des tests.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.artifacts import SessionReport
+from utils.stats import summarize
+from utils.step_timing import recorder
+
+logger = logging.getLogger(__name__)
+
+# Entrées depuis la mesure précédente du même document ; une transition sans
+# nouveau document (routage côté client) est marquée "soft"
+PERF_SCRIPT = """
+if (!window.__sdPerf) {
+    window.__sdPerf = {resources: 0, longTasks: [], navigationReported: false};
+    try {
+        new PerformanceObserver((list) => {
+            for (const e of list.getEntries()) window.__sdPerf.longTasks.push(e.duration);
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) { /* long tasks non supportées */ }
+}
+const state = window.__sdPerf;
+const soft = state.navigationReported;
+const resources = performance.getEntriesByType('resource').slice(state.resources);
+state.resources += resources.length;
+const longTasks = state.longTasks.splice(0);
+const result = {
+    url: location.href,
+    soft: soft,
+    navigation: null,
+    paint: {},
+    resources: {
+        count: resources.length,
+        transfer_size: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        duration_max: resources.reduce((max, r) => Math.max(max, r.duration), 0),
+        slowest: resources.slice().sort((a, b) => b.duration - a.duration).slice(0, arguments[0])
+            .map((r) => ({name: r.name, type: r.initiatorType, duration: r.duration})),
+    },
+    long_tasks: {count: longTasks.length, total: longTasks.reduce((sum, d) => sum + d, 0)},
+};
+const nav = performance.getEntriesByType('navigation')[0];
+if (!soft && nav) {
+    result.navigation = {
+        type: nav.type,
+        ttfb: nav.responseStart - nav.requestStart,
+        response_end: nav.responseEnd,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        transfer_size: nav.transferSize,
+    };
+    for (const p of performance.getEntriesByType('paint')) result.paint[p.name] = p.startTime;
+    state.navigationReported = true;
+}
+return result;
+"""
+
+# Métriques agrégées (millisecondes, sauf compteurs et octets)
+METRICS = {
+    "ttfb": lambda e: (e["navigation"] or {}).get("ttfb"),
+    "dom_content_loaded": lambda e: (e["navigation"] or {}).get("dom_content_loaded"),
+    "load": lambda e: (e["navigation"] or {}).get("load"),
+    "first_contentful_paint": lambda e: e["paint"].get("first-contentful-paint"),
+    "resource_count": lambda e: e["resources"]["count"],
+    "resource_bytes": lambda e: e["resources"]["transfer_size"],
+    "resource_duration_max": lambda e: e["resources"]["duration_max"],
+    "long_task_count": lambda e: e["long_tasks"]["count"],
+    "long_task_total": lambda e: e["long_tasks"]["total"],
+}
+
+
+class WebPerfCollector(SessionReport):
+    """Mesures navigateur de la session, agrégées par utilisateur et par page"""
+    
+    REPORT_NAME = "web_perf"
+    
+    def __init__(self, enabled=True, slowest=5):
+        self.enabled = enabled
+        self.slowest = slowest
+        self.entries = []
+        self._lock = threading.Lock()
+    
+    def collect(self, driver, transition):
+        """Lit les entrées de performance après une transition (erreurs ignorées)"""
+        if not self.enabled:
+            return None
+        try:
+            data = driver.execute_script(PERF_SCRIPT, self.slowest)
+        except WebDriverException as e:
+            logger.debug("Mesures de performance indisponibles (%s): %s", transition, e)
+            return None
+        context = recorder.current_context
+        entry = dict(data, transition=transition, page=urlsplit(data["url"]).path or "/",
+                     username=context.get("username"), test_id=context.get("test_id"))
+        with self._lock:
+            self.entries.append(entry)
+        return entry
+    
+    def summary(self) -> dict:
+        """{utilisateur: {page: {transitions, soft, métrique: p50/p95...}}}"""
+        groups = defaultdict(lambda: defaultdict(list))
+        with self._lock:
+            for entry in self.entries:
+                groups[entry["username"] or "-"][entry["page"]].append(entry)
+        
+        def describe(entries):
+            result = {"transitions": len(entries), "soft": sum(1 for e in entries if e["soft"])}
+            for name, extract in METRICS.items():
+                values = [v for v in (extract(e) for e in entries) if v is not None]
+                if values:
+                    result[name] = summarize(values)
+            return result
+        
+        return {
+            username: {page: describe(entries) for page, entries in sorted(pages.items())}
+            for username, pages in sorted(groups.items())
+        }
+    
+    def report_data(self):
+        """web_perf.json : résumé et mesures brutes"""
+        if not self.entries:
+            return None
+        return {"summary": self.summary(), "entries": self.entries}
+
+
+web_perf = WebPerfCollector(enabled=Config.WEB_PERF)